@@ -0,0 +1,143 @@
+import argparse
+import json
+import statistics
+import time
+
+from config import CLOSING_MESSAGES
+from interview_logic import get_closing_code_matcher
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare the streaming closing-code scanner with the previous "
+            "rescan-per-delta approach on a synthetic streamed reply."
+        )
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=50,
+        help="How many timed runs per scenario.",
+    )
+    parser.add_argument(
+        "--reply-chars",
+        type=int,
+        default=4000,
+        help="Size of the synthetic assistant reply.",
+    )
+    parser.add_argument(
+        "--delta-chars",
+        type=int,
+        default=4,
+        help="Characters per streamed delta (providers typically send 1-8).",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print results as JSON instead of tab-separated text.",
+    )
+    return parser
+
+
+def build_deltas(reply_chars: int, delta_chars: int, closing_code: str) -> list[str]:
+    """Split a synthetic reply that ends in a closing code into stream deltas."""
+    body = ("Tell me more about the last time that happened. " * (reply_chars // 49 + 1))[
+        :reply_chars
+    ]
+    reply = f"{body} {closing_code}"
+    size = max(delta_chars, 1)
+    return [reply[index:index + size] for index in range(0, len(reply), size)]
+
+
+def rescan_per_delta(deltas: list[str], closing_messages) -> str:
+    """The previous approach: search every code in the pending text after each delta."""
+    holdback = max((len(code) for code in closing_messages), default=0) - 1
+    visible = []
+    pending_text = ""
+    for delta in deltas:
+        pending_text += delta
+        while True:
+            closing_code = next(
+                (code for code in closing_messages if code in pending_text), None
+            )
+            if not closing_code:
+                break
+            code_index = pending_text.find(closing_code)
+            visible.append(pending_text[:code_index])
+            pending_text = pending_text[code_index + len(closing_code):]
+        safe_length = max(len(pending_text) - holdback, 0)
+        visible.append(pending_text[:safe_length])
+        pending_text = pending_text[safe_length:]
+    visible.append(pending_text)
+    return "".join(visible)
+
+
+def streaming_scanner(deltas: list[str], closing_messages) -> str:
+    scanner = get_closing_code_matcher(closing_messages).scanner()
+    visible = [scanner.feed(delta) for delta in deltas]
+    visible.append(scanner.finish())
+    return "".join(visible)
+
+
+SCENARIOS = {
+    "rescan_per_delta": rescan_per_delta,
+    "streaming_scanner": streaming_scanner,
+}
+
+
+def summarize_timings(timings_ms: list[float]) -> dict[str, float]:
+    """Return min/median/p95/max for a list of millisecond timings."""
+    ordered = sorted(timings_ms)
+    p95_index = min(len(ordered) - 1, max(0, round(0.95 * len(ordered)) - 1))
+    return {
+        "min_ms": round(ordered[0], 4),
+        "median_ms": round(statistics.median(ordered), 4),
+        "p95_ms": round(ordered[p95_index], 4),
+        "max_ms": round(ordered[-1], 4),
+    }
+
+
+def run_benchmark(deltas, closing_messages, iterations: int, clock=time.perf_counter):
+    """Time every scenario on the same deltas and return summary rows."""
+    expected = None
+    rows = []
+    for scenario_name, scan in SCENARIOS.items():
+        timings_ms = []
+        for _ in range(max(iterations, 1)):
+            started = clock()
+            visible = scan(deltas, closing_messages)
+            timings_ms.append((clock() - started) * 1000)
+        if expected is None:
+            expected = visible
+        elif visible != expected:
+            raise AssertionError(f"{scenario_name} produced different visible text.")
+        rows.append(
+            {
+                "scenario": scenario_name,
+                "deltas": len(deltas),
+                "iterations": len(timings_ms),
+                **summarize_timings(timings_ms),
+            }
+        )
+    return rows
+
+
+def main():
+    args = build_parser().parse_args()
+    closing_code = next(iter(CLOSING_MESSAGES))
+    deltas = build_deltas(args.reply_chars, args.delta_chars, closing_code)
+    rows = run_benchmark(deltas, CLOSING_MESSAGES, args.iterations)
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+
+    columns = ["scenario", "deltas", "iterations", "min_ms", "median_ms", "p95_ms", "max_ms"]
+    print("\t".join(columns))
+    for row in rows:
+        print("\t".join(str(row[column]) for column in columns))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,565 @@
+import argparse
+import hashlib
+import json
+import threading
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+from database import INTERVIEWS_TABLE_QUERY, get_storage_backend
+from interview_async_provider import stream_reply
+from interview_context import build_context_window
+from interview_logic import compose_system_prompt
+from interview_metrics import StreamTiming
+from interview_provider import (
+    OPENROUTER_INDUSTRY_CONFIGS,
+    apply_model_selection_to_openai_kwargs,
+    apply_prompt_cache_to_anthropic_kwargs,
+    apply_prompt_cache_to_openai_kwargs,
+    apply_reasoning_level,
+    build_prompt_cache_key,
+    create_provider_runtime,
+)
+from interview_rate_limit import configure_rate_limits
+from interview_reasoning import percentile
+from interview_usage import estimate_cost_usd, load_model_prices
+from interview_warmup import load_interview_config
+from secrets_utils import load_local_secrets
+
+
+DEFAULT_CONFIG_NAME = "midterm_interview"
+DEFAULT_CONCURRENCY = 4
+DEFAULT_TRANSCRIPT_LIMIT = 20
+TRANSCRIPT_ROLES = ("user", "assistant")
+# Stands in for the rolling context summary, which the replay does not generate.
+REPLAY_SUMMARY_PLACEHOLDER = "(Earlier turns are summarized here in the app.)"
+REPORT_COLUMNS = [
+    "target",
+    "history",
+    "turns",
+    "errors",
+    "ttft_p50_ms",
+    "ttft_p95_ms",
+    "total_p50_ms",
+    "total_p95_ms",
+    "tokens_per_second_p50",
+    "input_tokens",
+    "output_tokens",
+    "cost_usd",
+    "cost_per_turn_usd",
+]
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description=(
+            "Replay the participant turns of saved interviews against one or more "
+            "provider/model/reasoning targets and compare latency, throughput, "
+            "token usage and cost."
+        )
+    )
+    parser.add_argument(
+        "--target",
+        dest="targets",
+        action="append",
+        help=(
+            "provider[=model][@reasoning], e.g. openrouter=qwen/qwen3.5-35b-a3b@none. "
+            "Repeat to compare; defaults to the configured API_PROVIDER."
+        ),
+    )
+    parser.add_argument(
+        "--transcripts-dir",
+        default="",
+        help="Read *_transcript.txt files from this directory instead of the database.",
+    )
+    parser.add_argument(
+        "--shard",
+        default="",
+        help="Read interviews from one shard file (e.g. 2025-2026) instead of interviews.db.",
+    )
+    parser.add_argument(
+        "--interview-type",
+        default="",
+        help=(
+            "Only replay interviews of this config. Also the config used for local "
+            f"transcript files (default {DEFAULT_CONFIG_NAME})."
+        ),
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=DEFAULT_TRANSCRIPT_LIMIT,
+        help="How many transcripts to replay (0 replays every transcript found).",
+    )
+    parser.add_argument(
+        "--max-turns",
+        type=int,
+        default=0,
+        help="Replay at most this many participant turns per transcript (0 replays all).",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help="How many replayed turns are in flight at once.",
+    )
+    parser.add_argument(
+        "--full-history",
+        action="store_true",
+        help=(
+            "Send the whole recorded history every turn instead of the app's "
+            "CONTEXT_TOKEN_BUDGET window."
+        ),
+    )
+    parser.add_argument(
+        "--turns-file",
+        default="",
+        help="Also write one JSON line per replayed turn to this file.",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the report as JSON instead of tab-separated text.",
+    )
+    return parser
+
+
+@dataclass(frozen=True)
+class ReplayTarget:
+    provider: str
+    model: str = ""
+    reasoning_level: str = ""
+
+    @property
+    def label(self) -> str:
+        label = self.provider
+        if self.model:
+            label += f"={self.model}"
+        if self.reasoning_level:
+            label += f"@{self.reasoning_level}"
+        return label
+
+
+@dataclass(frozen=True)
+class ReplayTranscript:
+    label: str
+    config_name: str
+    messages: tuple
+
+
+def parse_target(raw_target: str) -> ReplayTarget:
+    """Parse ``provider[=model][@reasoning]`` into a replay target."""
+    spec, _, reasoning_level = raw_target.strip().partition("@")
+    provider, _, model = spec.partition("=")
+    provider = provider.strip().lower()
+    if not provider:
+        raise ValueError(f"Target {raw_target!r} does not name a provider.")
+    if reasoning_level and provider != "openrouter":
+        raise ValueError(
+            f"Target {raw_target!r} sets a reasoning level, which only OpenRouter routing uses."
+        )
+    return ReplayTarget(provider, model.strip(), reasoning_level.strip().lower())
+
+
+def anonymize_label(identifier: str) -> str:
+    """Return a stable short label so reports never carry interview or student ids."""
+    return f"t-{hashlib.sha256(identifier.encode()).hexdigest()[:10]}"
+
+
+def parse_transcript(text: str) -> list[dict]:
+    """Rebuild chat messages from a saved ``role: content`` transcript.
+
+    Lines that do not start with a role continue the previous message, and a
+    leading ``Session ID:`` header from local transcript files is skipped.
+    """
+    messages = []
+    for line in (text or "").splitlines():
+        role, separator, content = line.partition(": ")
+        if separator and role in TRANSCRIPT_ROLES:
+            messages.append({"role": role, "content": content})
+        elif messages:
+            messages[-1]["content"] += f"\n{line}"
+    for message in messages:
+        message["content"] = message["content"].strip()
+    return messages
+
+
+def load_local_transcripts(
+    directory, config_name: str, limit: int = 0
+) -> list[ReplayTranscript]:
+    """Return transcripts saved by the app under ``directory``, newest file name first."""
+    paths = sorted(Path(directory).glob("*_transcript.txt"), reverse=True)
+    transcripts = []
+    for path in paths:
+        messages = parse_transcript(path.read_text(encoding="utf-8"))
+        if any(message["role"] == "user" for message in messages):
+            transcripts.append(
+                ReplayTranscript(anonymize_label(path.name), config_name, tuple(messages))
+            )
+        if limit and len(transcripts) >= limit:
+            break
+    return transcripts
+
+
+def load_database_transcripts(
+    backend=None, *, interview_type: str = "", limit: int = 0
+) -> list[ReplayTranscript]:
+    """Return the newest saved interviews; only the transcript and config are read."""
+    backend = backend or get_storage_backend()
+    conditions = ["COALESCE(transcript, '') != ''"]
+    params = []
+    if interview_type:
+        conditions.append("interview_type = ?")
+        params.append(interview_type)
+    sql_query = f"""
+        SELECT interview_id, interview_type, transcript
+        FROM interviews
+        WHERE {' AND '.join(conditions)}
+        ORDER BY timestamp DESC, interview_id
+    """
+    if limit:
+        sql_query += " LIMIT ?"
+        params.append(limit)
+    results = backend.run_batch(
+        [
+            {"type": "execute", "sql_query": INTERVIEWS_TABLE_QUERY},
+            {"type": "execute", "sql_query": sql_query, "params": params, "fetch": "all"},
+        ],
+        ensure_directory=True,
+    )
+    transcripts = []
+    for interview_id, row_type, transcript in results[0] if results else []:
+        messages = parse_transcript(transcript)
+        if any(message["role"] == "user" for message in messages):
+            transcripts.append(
+                ReplayTranscript(
+                    anonymize_label(interview_id),
+                    row_type or DEFAULT_CONFIG_NAME,
+                    tuple(messages),
+                )
+            )
+    return transcripts
+
+
+def replay_turns(transcript: ReplayTranscript, max_turns: int = 0) -> list[tuple[int, list]]:
+    """Return ``(turn, history)`` for each participant turn of ``transcript``.
+
+    The history is the recorded conversation up to and including that
+    participant message, so every target answers the same prompts no matter
+    what it replied earlier.
+    """
+    turns = []
+    for index, message in enumerate(transcript.messages):
+        if message["role"] != "user":
+            continue
+        turns.append((len(turns) + 1, list(transcript.messages[: index + 1])))
+        if max_turns and len(turns) >= max_turns:
+            break
+    return turns
+
+
+def create_target_runtime(secrets, target: ReplayTarget, config_name: str, max_tokens: int):
+    """Build the runtime the app would use for ``target`` via its own model routing.
+
+    The target's model is written into the secret that
+    ``resolve_model_selection`` reads for this provider and config, so
+    max-token and reasoning defaults match production.
+    """
+    overrides = {"API_PROVIDER": target.provider}
+    model = target.model or (
+        secrets.get(f"{target.provider.upper()}_MODEL")
+        if target.provider != "openrouter"
+        else ""
+    )
+    if model and target.provider == "openrouter":
+        overrides[
+            "OPENROUTER_INDUSTRY_MODEL"
+            if config_name in OPENROUTER_INDUSTRY_CONFIGS
+            else "OPENROUTER_DEFAULT_MODEL"
+        ] = model
+    elif model:
+        overrides["MODEL"] = model
+    runtime = create_provider_runtime(ChainMap(overrides, secrets), config_name, max_tokens)
+    if target.reasoning_level:
+        runtime = replace(
+            runtime,
+            model_selection=apply_reasoning_level(
+                runtime.model_selection, target.reasoning_level
+            ),
+        )
+    return runtime
+
+
+def window_replay_history(messages: list[dict], token_budget: int | None) -> list[dict]:
+    """Trim ``messages`` to what the app sends once its rolling summary has caught up.
+
+    Turns the summary would cover are dropped and a placeholder system
+    message takes the summary's place, so input tokens reflect the app's
+    window but not the summary text or the summary job's own cost.
+    """
+    window = build_context_window(messages, token_budget=token_budget)
+    if window.pending_summary_through is None:
+        return window.messages
+    return build_context_window(
+        messages,
+        token_budget=token_budget,
+        summary=REPLAY_SUMMARY_PLACEHOLDER,
+        summary_through=window.pending_summary_through,
+    ).messages
+
+
+def build_replay_kwargs(
+    runtime,
+    config,
+    config_name: str,
+    system_prompt: str,
+    history,
+    full_history: bool = False,
+) -> dict:
+    """Build the streamed chat request the app would send for ``history``."""
+    selection = runtime.model_selection
+    conversation = list(history)
+    if runtime.api == "openai":
+        conversation.insert(0, {"role": "system", "content": system_prompt})
+    if not full_history:
+        conversation = window_replay_history(
+            conversation, getattr(config, "CONTEXT_TOKEN_BUDGET", None)
+        )
+    kwargs = {
+        "model": selection.model,
+        "max_tokens": config.MAX_OUTPUT_TOKENS,
+        "messages": conversation,
+        "stream": True,
+    }
+    if config.TEMPERATURE is not None:
+        kwargs["temperature"] = config.TEMPERATURE
+    if runtime.api == "openai":
+        kwargs = apply_model_selection_to_openai_kwargs(kwargs, selection)
+        kwargs = apply_prompt_cache_to_openai_kwargs(
+            kwargs, runtime.provider, build_prompt_cache_key(config_name, selection.model)
+        )
+        kwargs["stream_options"] = {"include_usage": True}
+    else:
+        kwargs["system"] = "\n\n".join(
+            [system_prompt]
+            + [message["content"] for message in conversation if message["role"] == "system"]
+        )
+        kwargs["messages"] = [
+            message for message in conversation if message["role"] != "system"
+        ]
+        kwargs = apply_prompt_cache_to_anthropic_kwargs(kwargs)
+    return kwargs
+
+
+def replay_turn(runtime, request_kwargs: dict, *, concurrency: int, model_prices=None) -> dict:
+    """Stream one replayed turn and return its latency, throughput, usage and cost."""
+    usage_state = {}
+    timing = StreamTiming()
+    result = {"error": ""}
+    timing.start()
+    try:
+        for delta in stream_reply(
+            runtime, request_kwargs, usage_state, concurrency_limit=concurrency
+        ):
+            timing.mark_delta(delta)
+    except Exception as exc:
+        result["error"] = str(exc) or type(exc).__name__
+    timing.finish()
+
+    usage = usage_state.get("usage")
+    metrics = timing.as_dict(output_tokens=usage.output_tokens if usage else None)
+    result.update(
+        ttft_ms=metrics["ttft_ms"],
+        total_ms=metrics["stream_ms"],
+        tokens_per_second=metrics["output_tokens_per_second"],
+        output_chars=metrics["output_chars"],
+        queue_wait_ms=round(usage_state.get("queue_wait_seconds", 0.0) * 1000, 2),
+        **(usage.as_dict() if usage is not None else {}),
+        cost_usd=estimate_cost_usd(request_kwargs["model"], usage, model_prices),
+    )
+    return result
+
+
+def run_replay(
+    transcripts: list[ReplayTranscript],
+    targets: list[ReplayTarget],
+    secrets,
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    max_turns: int = 0,
+    model_prices=None,
+    full_history: bool = False,
+) -> list[dict]:
+    """Replay every participant turn against every target; rows keep the input order.
+
+    Each turn is windowed to the config's ``CONTEXT_TOKEN_BUDGET`` like the
+    app, unless ``full_history`` sends the whole recorded history.
+    """
+    runtimes = {}
+    prompts = {}
+    lock = threading.Lock()
+
+    def prepare(target: ReplayTarget, config_name: str):
+        with lock:
+            if config_name not in prompts:
+                config = load_interview_config(config_name)
+                prompts[config_name] = (
+                    config,
+                    compose_system_prompt(
+                        getattr(config, "SYSTEM_PROMPT", config.INTERVIEW_OUTLINE)
+                    ),
+                )
+            config, system_prompt = prompts[config_name]
+            if (target, config_name) not in runtimes:
+                runtimes[(target, config_name)] = create_target_runtime(
+                    secrets, target, config_name, config.MAX_OUTPUT_TOKENS
+                )
+            return runtimes[(target, config_name)], config, system_prompt
+
+    jobs = [
+        (transcript, turn, history, target)
+        for transcript in transcripts
+        for turn, history in replay_turns(transcript, max_turns)
+        for target in targets
+    ]
+
+    def run(job) -> dict:
+        transcript, turn, history, target = job
+        runtime, config, system_prompt = prepare(target, transcript.config_name)
+        request_kwargs = build_replay_kwargs(
+            runtime,
+            config,
+            transcript.config_name,
+            system_prompt,
+            history,
+            full_history=full_history,
+        )
+        return {
+            "target": target.label,
+            "provider": runtime.provider,
+            "model": runtime.model_selection.model,
+            "reasoning_level": runtime.model_selection.reasoning_level,
+            "history": "full" if full_history else "windowed",
+            "transcript": transcript.label,
+            "config": transcript.config_name,
+            "turn": turn,
+            **replay_turn(
+                runtime,
+                request_kwargs,
+                concurrency=concurrency,
+                model_prices=model_prices,
+            ),
+        }
+
+    with ThreadPoolExecutor(
+        max_workers=max(concurrency, 1), thread_name_prefix="benchmark-models"
+    ) as executor:
+        return list(executor.map(run, jobs))
+
+
+def _rounded(value):
+    return round(value, 2) if value is not None else None
+
+
+def summarize_target(rows: list[dict]) -> dict:
+    """Aggregate one target's replayed turns into a report row.
+
+    Latency and throughput only count successful turns. ``cost_usd`` is
+    None when any successful turn could not be priced.
+    """
+    succeeded = [row for row in rows if not row["error"]]
+    costs = [row.get("cost_usd") for row in succeeded]
+    total_cost = None if None in costs else round(sum(costs), 6)
+
+    def values(key):
+        return [row[key] for row in succeeded if row.get(key) is not None]
+
+    return {
+        "target": rows[0]["target"],
+        "provider": rows[0]["provider"],
+        "model": rows[0]["model"],
+        "reasoning_level": rows[0]["reasoning_level"],
+        "history": rows[0]["history"],
+        "turns": len(rows),
+        "errors": len(rows) - len(succeeded),
+        "ttft_p50_ms": _rounded(percentile(values("ttft_ms"), 0.5)),
+        "ttft_p95_ms": _rounded(percentile(values("ttft_ms"), 0.95)),
+        "total_p50_ms": _rounded(percentile(values("total_ms"), 0.5)),
+        "total_p95_ms": _rounded(percentile(values("total_ms"), 0.95)),
+        "tokens_per_second_p50": _rounded(percentile(values("tokens_per_second"), 0.5)),
+        "input_tokens": sum(values("input_tokens")),
+        "output_tokens": sum(values("output_tokens")),
+        "cost_usd": total_cost,
+        "cost_per_turn_usd": (
+            round(total_cost / len(succeeded), 6)
+            if total_cost is not None and succeeded
+            else None
+        ),
+    }
+
+
+def build_report(rows: list[dict]) -> list[dict]:
+    """Return one summary row per target, in the order the targets were given."""
+    by_target = {}
+    for row in rows:
+        by_target.setdefault(row["target"], []).append(row)
+    return [summarize_target(target_rows) for target_rows in by_target.values()]
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    secrets = load_local_secrets()
+    try:
+        targets = [
+            parse_target(raw_target)
+            for raw_target in args.targets or [secrets.get("API_PROVIDER", "openai")]
+        ]
+    except ValueError as exc:
+        parser.error(str(exc))
+    configure_rate_limits(secrets)
+
+    if args.transcripts_dir:
+        transcripts = load_local_transcripts(
+            args.transcripts_dir, args.interview_type or DEFAULT_CONFIG_NAME, args.limit
+        )
+    else:
+        transcripts = load_database_transcripts(
+            get_storage_backend(shard_key=args.shard or None),
+            interview_type=args.interview_type,
+            limit=args.limit,
+        )
+    if not transcripts:
+        parser.error("No transcripts with participant turns were found.")
+
+    rows = run_replay(
+        transcripts,
+        targets,
+        secrets,
+        concurrency=args.concurrency,
+        max_turns=args.max_turns,
+        model_prices=load_model_prices(secrets.get("MODEL_PRICES_JSON")),
+        full_history=args.full_history,
+    )
+    if args.turns_file:
+        with open(args.turns_file, "w", encoding="utf-8") as turns_file:
+            for row in rows:
+                turns_file.write(json.dumps(row) + "\n")
+
+    report = build_report(rows)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(
+        f"# {len(transcripts)} transcripts, {len(rows)} replayed turns, "
+        f"{'full history' if args.full_history else 'history windowed to CONTEXT_TOKEN_BUDGET'}"
+    )
+    print("\t".join(REPORT_COLUMNS))
+    for row in report:
+        print("\t".join(str(row[column]) for column in REPORT_COLUMNS))
+
+
+if __name__ == "__main__":
+    main()
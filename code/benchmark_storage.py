@@ -0,0 +1,153 @@
+import argparse
+import json
+import statistics
+import time
+import uuid
+from dataclasses import replace
+
+from database import (
+    CHECKPOINTS_TABLE_QUERY,
+    _build_checkpoint_upsert_operation,
+    get_storage_backend,
+)
+
+
+BENCHMARK_DATABASE_FILENAME = "storage-benchmark.db"
+TRANSPORT_PROBE_OPERATIONS = [
+    {"type": "execute", "sql_query": "SELECT 1", "fetch": "one"},
+]
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare storage-backend transport overhead against SQL cost using a "
+            "scratch database next to interviews.db."
+        )
+    )
+    parser.add_argument(
+        "--backend",
+        dest="backends",
+        action="append",
+        choices=["local", "ssh"],
+        help="Backend to benchmark. Repeat to compare; defaults to local.",
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=20,
+        help="How many timed runs per scenario.",
+    )
+    parser.add_argument(
+        "--transcript-chars",
+        type=int,
+        default=20000,
+        help="Size of the synthetic checkpoint transcript.",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print results as JSON instead of tab-separated text.",
+    )
+    return parser
+
+
+def benchmark_backend(backend):
+    """Return the backend pointed at the scratch benchmark database."""
+    return replace(
+        backend,
+        db_path=f"{backend.directory}/{BENCHMARK_DATABASE_FILENAME}",
+    )
+
+
+def build_scenarios(transcript_chars: int) -> dict[str, list[dict]]:
+    """Return the named operation batches timed by the benchmark."""
+    transcript = ("user: benchmark reply\n" * (transcript_chars // 22 + 1))[
+        :transcript_chars
+    ]
+    interview_id = f"benchmark-{uuid.uuid4()}"
+    return {
+        "transport_probe": TRANSPORT_PROBE_OPERATIONS,
+        "checkpoint_upsert": [
+            {"type": "execute", "sql_query": CHECKPOINTS_TABLE_QUERY},
+            _build_checkpoint_upsert_operation(
+                interview_id,
+                "benchmark-student",
+                "Benchmark",
+                "",
+                "midterm_interview",
+                time.strftime("%Y-%m-%d %H:%M:%S"),
+                transcript,
+                "1.00",
+            ),
+        ],
+        "checkpoint_lookup": [
+            {
+                "type": "execute",
+                "sql_query": (
+                    "SELECT duration_minutes FROM interview_checkpoints "
+                    "WHERE interview_id = ?"
+                ),
+                "params": [interview_id],
+                "fetch": "one",
+            }
+        ],
+    }
+
+
+def summarize_timings(timings_ms: list[float]) -> dict[str, float]:
+    """Return min/median/p95/max for a list of millisecond timings."""
+    ordered = sorted(timings_ms)
+    p95_index = min(len(ordered) - 1, max(0, round(0.95 * len(ordered)) - 1))
+    return {
+        "min_ms": round(ordered[0], 2),
+        "median_ms": round(statistics.median(ordered), 2),
+        "p95_ms": round(ordered[p95_index], 2),
+        "max_ms": round(ordered[-1], 2),
+    }
+
+
+def run_benchmark(backend, scenarios, iterations: int, clock=time.perf_counter):
+    """Time every scenario against one backend and return summary rows."""
+    backend.run_batch(
+        [{"type": "execute", "sql_query": CHECKPOINTS_TABLE_QUERY}],
+        ensure_directory=True,
+    )
+    rows = []
+    for scenario_name, operations in scenarios.items():
+        timings_ms = []
+        for _ in range(max(iterations, 1)):
+            started = clock()
+            backend.run_batch(operations)
+            timings_ms.append((clock() - started) * 1000)
+        rows.append(
+            {
+                "backend": backend.name,
+                "scenario": scenario_name,
+                "iterations": len(timings_ms),
+                **summarize_timings(timings_ms),
+            }
+        )
+    return rows
+
+
+def main():
+    args = build_parser().parse_args()
+    scenarios = build_scenarios(args.transcript_chars)
+    rows = []
+    for backend_name in args.backends or ["local"]:
+        backend = benchmark_backend(get_storage_backend(backend_name))
+        rows.extend(run_benchmark(backend, scenarios, args.iterations))
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+
+    columns = ["backend", "scenario", "iterations", "min_ms", "median_ms", "p95_ms", "max_ms"]
+    print("\t".join(columns))
+    for row in rows:
+        print("\t".join(str(row[column]) for column in columns))
+
+
+if __name__ == "__main__":
+    main()
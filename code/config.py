@@ -7,6 +7,9 @@ try:
         build_system_prompt,
         TEMPERATURE,
         MAX_OUTPUT_TOKENS,
+        CONTEXT_TOKEN_BUDGET,
+        TYPING_PACING,
+        CACHE_OPENING_TURN,
         LOGINS,
         TRANSCRIPTS_DIRECTORY,
         TIMES_DIRECTORY,
@@ -26,6 +29,9 @@ except ImportError:
         build_system_prompt,
         TEMPERATURE,
         MAX_OUTPUT_TOKENS,
+        CONTEXT_TOKEN_BUDGET,
+        TYPING_PACING,
+        CACHE_OPENING_TURN,
         LOGINS,
         TRANSCRIPTS_DIRECTORY,
         TIMES_DIRECTORY,
@@ -1,14 +1,34 @@
 import json
+import time
+from dataclasses import replace
 
 from remote_utils import (
     close_ssh_connection,
     ensure_remote_directory,
+    get_pooled_ssh_connection,
     get_ssh_connection,
+    release_pooled_ssh_connection,
     resolve_ssh_settings,
     run_remote_sql_batch,
     run_remote_sql,
 )
+from database_shards import (
+    DEFAULT_ACADEMIC_YEAR_START_MONTH,
+    DEFAULT_SHARD_LOOKBACK_YEARS,
+    build_attach_operations,
+    normalize_sharding_mode,
+    resolve_read_shard_keys,
+    resolve_write_shard_key,
+    shard_filename,
+)
 from secrets_utils import get_secret
+from storage_backend import (
+    DATABASE_FILENAME,
+    DEFAULT_LOCAL_DATABASE_DIRECTORY,
+    LocalSqliteBackend,
+    SshSqliteBackend,
+    normalize_backend_name,
+)
 
 
 INTERVIEWS_TABLE_QUERY = """
@@ -57,6 +77,73 @@ CREATE TABLE IF NOT EXISTS interview_checkpoints (
 )
 """
 
+CHECKPOINTS_ARCHIVE_TABLE_QUERY = """
+CREATE TABLE IF NOT EXISTS interview_checkpoints_archive (
+    interview_id TEXT PRIMARY KEY,
+    student_id TEXT,
+    name TEXT,
+    company TEXT,
+    interview_type TEXT,
+    last_updated TEXT,
+    duration_minutes TEXT,
+    transcript_zlib BLOB,
+    archive_reason TEXT,
+    archived_at TEXT
+)
+"""
+
+TURN_METRICS_TABLE_QUERY = """
+CREATE TABLE IF NOT EXISTS turn_metrics (
+    interview_id TEXT NOT NULL,
+    turn INTEGER NOT NULL,
+    recorded_at TEXT,
+    provider TEXT,
+    model TEXT,
+    reasoning_level TEXT,
+    hedged INTEGER,
+    queue_wait_ms REAL,
+    ttft_ms REAL,
+    first_visible_ms REAL,
+    holdback_ms REAL,
+    stream_ms REAL,
+    render_ms REAL,
+    pacing_ms REAL,
+    output_chars INTEGER,
+    output_tokens INTEGER,
+    output_tokens_per_second REAL,
+    PRIMARY KEY (interview_id, turn)
+)
+"""
+
+TURN_METRIC_COLUMNS = (
+    "turn",
+    "recorded_at",
+    "provider",
+    "model",
+    "reasoning_level",
+    "hedged",
+    "queue_wait_ms",
+    "ttft_ms",
+    "first_visible_ms",
+    "holdback_ms",
+    "stream_ms",
+    "render_ms",
+    "pacing_ms",
+    "output_chars",
+    "output_tokens",
+    "output_tokens_per_second",
+)
+
+INTERVIEW_ID_INDEX_QUERY = """
+CREATE INDEX IF NOT EXISTS idx_interviews_interview_id
+ON interviews (interview_id)
+"""
+
+CHECKPOINTS_LAST_UPDATED_INDEX_QUERY = """
+CREATE INDEX IF NOT EXISTS idx_interview_checkpoints_last_updated
+ON interview_checkpoints (last_updated)
+"""
+
 EMAIL_DELIVERIES_TABLE_QUERY = """
 CREATE TABLE IF NOT EXISTS email_deliveries (
     interview_id TEXT,
@@ -69,6 +156,33 @@ CREATE TABLE IF NOT EXISTS email_deliveries (
 )
 """
 
+LATEST_SUMMARIES_TABLE_QUERY = """
+CREATE TABLE IF NOT EXISTS latest_summaries (
+    student_id TEXT NOT NULL,
+    interview_type TEXT NOT NULL,
+    interview_id TEXT,
+    timestamp TEXT,
+    summary TEXT,
+    PRIMARY KEY (student_id, interview_type)
+) WITHOUT ROWID
+"""
+
+LATEST_SUMMARIES_COLUMNS = [
+    "student_id",
+    "interview_type",
+    "interview_id",
+    "timestamp",
+    "summary",
+]
+
+LATEST_SUMMARY_CONFLICT_CLAUSE = """
+ON CONFLICT(student_id, interview_type) DO UPDATE SET
+    interview_id = excluded.interview_id,
+    timestamp = excluded.timestamp,
+    summary = excluded.summary
+WHERE excluded.timestamp >= COALESCE(latest_summaries.timestamp, '')
+"""
+
 SURVEY_COLUMNS = {
     "survey_helpfulness": "TEXT",
     "survey_connection": "TEXT",
@@ -83,6 +197,23 @@ INTERVIEW_METADATA_COLUMNS = {
     "model_reasoning_level": "TEXT",
 }
 
+USAGE_COLUMNS = {
+    "input_tokens": "INTEGER",
+    "cached_input_tokens": "INTEGER",
+    "cache_write_tokens": "INTEGER",
+    "output_tokens": "INTEGER",
+    "reasoning_tokens": "INTEGER",
+    "cost_usd": "REAL",
+}
+
+SUMMARY_STATUS_COLUMNS = {
+    "summary_status": "TEXT",
+    "summary_attempts": "INTEGER",
+    "summary_error": "TEXT",
+    "summary_updated_at": "TEXT",
+    "summary_model": "TEXT",
+}
+
 EMAIL_STATUS_COLUMNS = {
     "email_recipient": "TEXT",
     "email_recipients": "TEXT",
@@ -102,10 +233,131 @@ def get_remote_database_location():
         ssh_username = resolve_ssh_settings().username
         remote_directory = f"/home/{ssh_username}/BS-Interviews/Database"
 
-    db_path = f"{remote_directory}/interviews.db"
+    db_path = f"{remote_directory}/{DATABASE_FILENAME}"
     return remote_directory, db_path
 
 
+def get_local_database_location():
+    """Return the local directory and database path used by the local backend."""
+    configured_directory = get_secret("LOCAL_DATABASE_DIRECTORY")
+    if configured_directory and str(configured_directory).strip():
+        local_directory = str(configured_directory).strip().rstrip("/")
+    else:
+        local_directory = str(DEFAULT_LOCAL_DATABASE_DIRECTORY)
+
+    db_path = f"{local_directory}/{DATABASE_FILENAME}"
+    return local_directory, db_path
+
+
+def _int_secret(key: str, default: int) -> int:
+    try:
+        return int(get_secret(key, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def ssh_pool_enabled() -> bool:
+    """Return whether SSH_CONNECTION_POOL keeps one SSH connection open per process."""
+    value = get_secret("SSH_CONNECTION_POOL", False)
+    if isinstance(value, str):
+        return value.strip().lower() in {"1", "true", "yes", "on"}
+    return bool(value)
+
+
+def get_sharding_mode() -> str:
+    """Return the DATABASE_SHARDING mode: none, academic_year, or interview_type."""
+    return normalize_sharding_mode(get_secret("DATABASE_SHARDING"))
+
+
+def resolve_shard_key(interview_type="", timestamp=""):
+    """Return the shard that writes for this interview are routed to."""
+    return resolve_write_shard_key(
+        get_sharding_mode(),
+        interview_type=interview_type,
+        timestamp=timestamp,
+        start_month=_int_secret(
+            "ACADEMIC_YEAR_START_MONTH", DEFAULT_ACADEMIC_YEAR_START_MONTH
+        ),
+    )
+
+
+def resolve_interview_shard_key(interview_type="", interview_timestamp=""):
+    """Return the shard holding an already saved interview row.
+
+    Updates must be routed by the row's own save timestamp: near an
+    academic-year boundary any later timestamp can name the next shard.
+    """
+    if not interview_timestamp and get_sharding_mode() == "academic_year":
+        raise ValueError(
+            "interview_timestamp is required to route updates when "
+            "DATABASE_SHARDING is academic_year."
+        )
+    return resolve_shard_key(interview_type, interview_timestamp)
+
+
+def get_read_shard_keys(interview_type=""):
+    """Return the shards a federated read attaches, hottest first."""
+    return resolve_read_shard_keys(
+        get_sharding_mode(),
+        interview_type=interview_type,
+        lookback_years=_int_secret(
+            "DATABASE_SHARD_LOOKBACK_YEARS", DEFAULT_SHARD_LOOKBACK_YEARS
+        ),
+        start_month=_int_secret(
+            "ACADEMIC_YEAR_START_MONTH", DEFAULT_ACADEMIC_YEAR_START_MONTH
+        ),
+    )
+
+
+def get_storage_backend(backend_name=None, shard_key=None):
+    """Return the storage backend selected by the DATABASE_BACKEND secret.
+
+    With a shard key the backend points at that shard's file in the same
+    directory instead of interviews.db.
+    """
+    resolved_name = normalize_backend_name(
+        backend_name if backend_name is not None else get_secret("DATABASE_BACKEND")
+    )
+    if resolved_name == "local":
+        local_directory, db_path = get_local_database_location()
+        if shard_key:
+            db_path = f"{local_directory}/{shard_filename(shard_key)}"
+        return LocalSqliteBackend(directory=local_directory, db_path=db_path)
+
+    remote_directory, db_path = get_remote_database_location()
+    if shard_key:
+        db_path = f"{remote_directory}/{shard_filename(shard_key)}"
+    pooled = ssh_pool_enabled()
+    return SshSqliteBackend(
+        directory=remote_directory,
+        db_path=db_path,
+        connect=get_pooled_ssh_connection if pooled else get_ssh_connection,
+        close=release_pooled_ssh_connection if pooled else close_ssh_connection,
+        ensure_remote_dir=ensure_remote_directory,
+        run_remote_batch=run_remote_sql_batch,
+        run_remote_query=run_remote_sql,
+    )
+
+
+def get_federated_read_backend(backend_name=None):
+    """Return the configured backend with an in-memory main database.
+
+    Federated reads ATTACH the interview files they need, so they never
+    create a database file or table as a side effect.
+    """
+    return replace(get_storage_backend(backend_name), db_path=":memory:")
+
+
+def warm_storage_connection() -> bool:
+    """Open the pooled SSH connection ahead of the first save; False when there is none to open."""
+    backend = get_storage_backend()
+    if backend.name != "ssh" or not ssh_pool_enabled():
+        return False
+    with backend.session():
+        pass
+    return True
+
+
 def _build_interview_insert_operation(
     interview_id,
     student_id,
@@ -149,6 +401,100 @@ def _build_interview_insert_operation(
     }
 
 
+def _build_usage_increment_operation(interview_id, usage):
+    """Add one call's (or one interview's) token totals to the interview row.
+
+    Totals accumulate because chat turns and the summary are saved at
+    different times. Once any unpriced call is recorded ``cost_usd`` stays
+    NULL, so a partial cost is never stored as the interview's total.
+    """
+    token_columns = [column for column in USAGE_COLUMNS if column != "cost_usd"]
+    assignments = ",\n            ".join(
+        f"{column} = COALESCE({column}, 0) + ?" for column in token_columns
+    )
+    cost = usage.get("cost_usd")
+    return {
+        "type": "execute",
+        "sql_query": f"""
+        UPDATE interviews
+        SET {assignments},
+            cost_usd = CASE
+                WHEN ? IS NULL THEN NULL
+                WHEN input_tokens IS NOT NULL AND cost_usd IS NULL THEN NULL
+                ELSE COALESCE(cost_usd, 0) + ?
+            END
+        WHERE interview_id = ?
+        """,
+        "params": [int(usage.get(column) or 0) for column in token_columns]
+        + [cost, cost, interview_id],
+    }
+
+
+def _usage_operations(interview_id, usage):
+    if not usage:
+        return []
+    return [
+        {"type": "ensure_columns", "table": "interviews", "columns": USAGE_COLUMNS},
+        _build_usage_increment_operation(interview_id, usage),
+    ]
+
+
+def _build_summary_status_update_operation(
+    interview_id, status, *, attempts=None, error="", updated_at="", summary_model=None
+):
+    return {
+        "type": "execute",
+        "sql_query": """
+        UPDATE interviews
+        SET summary_status = ?,
+            summary_attempts = COALESCE(?, summary_attempts),
+            summary_error = ?,
+            summary_updated_at = ?,
+            summary_model = COALESCE(?, summary_model)
+        WHERE interview_id = ?
+        """,
+        "params": [
+            status,
+            attempts,
+            error,
+            updated_at or time.strftime("%Y-%m-%d %H:%M:%S", time.localtime()),
+            summary_model or None,
+            interview_id,
+        ],
+    }
+
+
+def _summary_status_operations(interview_id, status, **kwargs):
+    return [
+        {
+            "type": "ensure_columns",
+            "table": "interviews",
+            "columns": SUMMARY_STATUS_COLUMNS,
+        },
+        _build_summary_status_update_operation(interview_id, status, **kwargs),
+    ]
+
+
+def _summary_update_operations(interview_id, summary, usage=None, summary_model=""):
+    if not str(summary or "").strip():
+        raise ValueError(f"Refusing to save an empty summary for {interview_id}.")
+    return [
+        {
+            "type": "execute",
+            "sql_query": """
+            UPDATE interviews
+            SET summary = ?
+            WHERE interview_id = ?
+            """,
+            "params": [summary, interview_id],
+        },
+        {"type": "execute", "sql_query": LATEST_SUMMARIES_TABLE_QUERY},
+        _build_latest_summary_upsert_operation(interview_id),
+        *_usage_operations(interview_id, usage),
+        *_summary_status_operations(interview_id, "done", summary_model=summary_model),
+    ]
+
+
 def _build_progress_insert_operation(student_id, name, interview_type, timestamp):
     return {
         "type": "execute",
@@ -209,6 +555,78 @@ def _build_checkpoint_upsert_operation(
     }
 
 
+def _build_turn_metrics_upsert_operation(interview_id, metrics):
+    """Store one chat turn's timing; re-sending a turn after a failed save overwrites it."""
+    columns = ("interview_id", *TURN_METRIC_COLUMNS)
+    values = [interview_id] + [metrics.get(column) for column in TURN_METRIC_COLUMNS]
+    values[columns.index("hedged")] = int(bool(metrics.get("hedged")))
+    return {
+        "type": "execute",
+        "sql_query": f"""
+        INSERT OR REPLACE INTO turn_metrics ({', '.join(columns)})
+        VALUES ({', '.join('?' for _ in columns)})
+        """,
+        "params": values,
+    }
+
+
+def _build_latest_summary_upsert_operation(interview_id):
+    return {
+        "type": "execute",
+        "sql_query": f"""
+        INSERT INTO latest_summaries (
+            student_id,
+            interview_type,
+            interview_id,
+            timestamp,
+            summary
+        )
+        SELECT student_id, interview_type, interview_id, timestamp, summary
+        FROM interviews
+        WHERE interview_id = ?
+            AND COALESCE(student_id, '') != ''
+            AND COALESCE(summary, '') != ''
+        ORDER BY timestamp DESC
+        LIMIT 1
+        {LATEST_SUMMARY_CONFLICT_CLAUSE}
+        """,
+        "params": [interview_id],
+    }
+
+
+def _build_latest_summaries_backfill_operation():
+    return {
+        "type": "execute",
+        "sql_query": f"""
+        INSERT INTO latest_summaries (
+            student_id,
+            interview_type,
+            interview_id,
+            timestamp,
+            summary
+        )
+        SELECT student_id, interview_type, interview_id, timestamp, summary
+        FROM (
+            SELECT
+                student_id,
+                interview_type,
+                interview_id,
+                timestamp,
+                summary,
+                ROW_NUMBER() OVER (
+                    PARTITION BY student_id, interview_type
+                    ORDER BY timestamp DESC
+                ) AS summary_rank
+            FROM interviews
+            WHERE COALESCE(student_id, '') != ''
+                AND COALESCE(summary, '') != ''
+        )
+        WHERE summary_rank = 1
+        {LATEST_SUMMARY_CONFLICT_CLAUSE}
+        """,
+    }
+
+
 def _build_survey_update_operation(
     interview_id,
     helpfulness_rating,
@@ -315,19 +733,14 @@ def _run_batch_operations(
     ensure_remote_dir=False,
     ssh_timeout=None,
     ssh_retries=None,
+    shard_key=None,
 ):
-    remote_directory, db_path = get_remote_database_location()
-
-    ssh, tmp_key_path = get_ssh_connection(
-        timeout_seconds=ssh_timeout,
+    return get_storage_backend(shard_key=shard_key).run_batch(
+        operations,
+        ensure_directory=ensure_remote_dir,
+        timeout=ssh_timeout,
         retries=ssh_retries,
     )
-    try:
-        if ensure_remote_dir:
-            ensure_remote_directory(ssh, remote_directory)
-        return run_remote_sql_batch(ssh, db_path, operations)
-    finally:
-        close_ssh_connection(ssh, tmp_key_path)
 
 
 def persist_completion_remote(
@@ -348,8 +761,15 @@ def persist_completion_remote(
     validation_rating="",
     feedback="",
     survey_timestamp="",
+    usage=None,
+    summary_status="",
 ):
-    """Persist completion-time interview data in one remote save operation."""
+    """Persist completion-time interview data in one remote save operation.
+
+    ``usage`` holds the chat token totals from ``interview_usage.total_usage``.
+    ``summary_status`` (normally "pending") is stored in the same batch, so a
+    saved interview always shows whether its background summary is done.
+    """
     operations = [
         {"type": "execute", "sql_query": INTERVIEWS_TABLE_QUERY},
         {
@@ -369,7 +789,14 @@ def persist_completion_remote(
             model,
             model_reasoning_level,
         ),
+        *_usage_operations(interview_id, usage),
     ]
+    if summary_status:
+        operations.extend(
+            _summary_status_operations(
+                interview_id, summary_status, attempts=0, updated_at=timestamp
+            )
+        )
 
     if student_id:
         operations.extend(
@@ -406,6 +833,7 @@ def persist_completion_remote(
         ensure_remote_dir=True,
         ssh_timeout=20,
         ssh_retries=3,
+        shard_key=resolve_shard_key(interview_type, timestamp),
     )
 
 
@@ -418,25 +846,40 @@ def persist_checkpoint_remote(
     last_updated,
     transcript,
     duration_minutes,
+    *,
+    turn_metrics=None,
 ):
-    """Upsert an in-progress transcript checkpoint in the remote SQLite database."""
+    """Upsert an in-progress transcript checkpoint in the remote SQLite database.
+
+    ``turn_metrics`` holds the chat turns recorded since the last successful
+    checkpoint; their timing is written to ``turn_metrics`` in the same batch.
+    """
+    operations = [
+        {"type": "execute", "sql_query": CHECKPOINTS_TABLE_QUERY},
+        _build_checkpoint_upsert_operation(
+            interview_id,
+            student_id,
+            name,
+            company,
+            interview_type,
+            last_updated,
+            transcript,
+            duration_minutes,
+        ),
+    ]
+    if turn_metrics:
+        operations.append({"type": "execute", "sql_query": TURN_METRICS_TABLE_QUERY})
+        operations.extend(
+            _build_turn_metrics_upsert_operation(interview_id, metrics)
+            for metrics in turn_metrics
+        )
+
     _run_batch_operations(
-        operations=[
-            {"type": "execute", "sql_query": CHECKPOINTS_TABLE_QUERY},
-            _build_checkpoint_upsert_operation(
-                interview_id,
-                student_id,
-                name,
-                company,
-                interview_type,
-                last_updated,
-                transcript,
-                duration_minutes,
-            ),
-        ],
+        operations=operations,
         ensure_remote_dir=True,
         ssh_timeout=5,
         ssh_retries=1,
+        shard_key=resolve_shard_key(interview_type, last_updated),
     )
 
 
@@ -448,8 +891,15 @@ def record_email_delivery_remote(
     status,
     attempted_at,
     error="",
+    *,
+    interview_type="",
+    interview_timestamp="",
 ):
-    """Record transcript email delivery status without changing transcript data."""
+    """Record transcript email delivery status without changing transcript data.
+
+    ``interview_timestamp`` is the interview's saved timestamp and routes the
+    write when sharding is enabled.
+    """
     _run_batch_operations(
         operations=[
             {"type": "execute", "sql_query": EMAIL_DELIVERIES_TABLE_QUERY},
@@ -480,6 +930,7 @@ def record_email_delivery_remote(
         ensure_remote_dir=True,
         ssh_timeout=10,
         ssh_retries=2,
+        shard_key=resolve_interview_shard_key(interview_type, interview_timestamp),
     )
 
 
@@ -496,9 +947,9 @@ def save_interview_to_sheet(
     model_reasoning_level="none",
 ):
     """
-    Insert the interview data into the remote SQLite database.
+    Insert the interview data into the configured SQLite database.
 
-    The database file (interviews.db) is located in the SSH directory.
+    The database file (interviews.db) is located in the backend directory.
     """
     _run_batch_operations(
         operations=[
@@ -522,14 +973,15 @@ def save_interview_to_sheet(
             ),
         ],
         ensure_remote_dir=True,
+        shard_key=resolve_shard_key(interview_type, timestamp),
     )
 
 
 def update_progress_sheet(student_id, name, interview_type, timestamp):
     """
-    Insert a progress update into the remote SQLite database.
+    Insert a progress update into the configured SQLite database.
 
-    The database file (interviews.db) is located in the SSH directory.
+    The database file (interviews.db) is located in the backend directory.
     """
     _run_batch_operations(
         operations=[
@@ -539,6 +991,7 @@ def update_progress_sheet(student_id, name, interview_type, timestamp):
             ),
         ],
         ensure_remote_dir=True,
+        shard_key=resolve_shard_key(interview_type, timestamp),
     )
 
 
@@ -546,53 +999,145 @@ def get_transcript_by_student_and_type(student_id, interview_type, ssh_conn=None
     """
     Retrieve the most recent summary for a student and interview type.
 
-    Accepts an optional SSH connection. Returns an empty string if not found.
+    Reads the materialized latest_summaries rows of interviews.db and, when
+    sharding is enabled, of the shards that exist in the lookback window.
+    History that ``manage_database.py backfill-summaries`` has not loaded
+    yet has no such row, so the interviews table is searched instead.
+    Accepts an optional SSH connection, ignored by the local backend.
+    Returns an empty string if not found.
     """
-    _, db_path = get_remote_database_location()
+    backend = get_federated_read_backend()
+    results = backend.run_batch(
+        build_attach_operations(
+            backend.directory,
+            get_read_shard_keys(interview_type),
+            {
+                "latest_summaries": LATEST_SUMMARIES_COLUMNS,
+                "interviews": ["student_id", "interview_type", "timestamp", "summary"],
+            },
+        )
+        + [
+            {
+                "type": "execute",
+                "sql_query": """
+                SELECT summary
+                FROM (
+                    SELECT summary, timestamp
+                    FROM latest_summaries
+                    WHERE student_id = ? AND interview_type = ?
+                    UNION ALL
+                    SELECT summary, timestamp
+                    FROM interviews
+                    WHERE student_id = ?
+                        AND interview_type = ?
+                        AND COALESCE(summary, '') != ''
+                        AND NOT EXISTS (
+                            SELECT 1
+                            FROM latest_summaries
+                            WHERE student_id = ? AND interview_type = ?
+                        )
+                )
+                ORDER BY timestamp DESC
+                LIMIT 1
+                """,
+                "params": [student_id, interview_type] * 3,
+                "fetch": "one",
+            },
+        ],
+        connection=ssh_conn,
+    )
+    row = results[0] if results else None
+    return row[0] if row and row[0] else ""
 
-    remove_after = False
-    if ssh_conn is None:
-        ssh, tmp_key_path = get_ssh_connection()
-        remove_after = True
-    else:
-        ssh = ssh_conn
-        tmp_key_path = None
 
-    try:
-        query = """
-        SELECT summary
-        FROM interviews
-        WHERE student_id = ? AND interview_type = ?
-        ORDER BY timestamp DESC
-        LIMIT 1
-        """
-        row = run_remote_sql(
-            ssh,
-            db_path,
-            query,
-            [student_id, interview_type],
-            fetch="one",
-        )
-        return row[0] if row and row[0] else ""
-    finally:
-        if remove_after:
-            close_ssh_connection(ssh, tmp_key_path)
+def update_interview_summary(
+    interview_id,
+    summary,
+    *,
+    interview_type="",
+    timestamp="",
+    usage=None,
+    summary_model="",
+):
+    """Update the stored summary and the latest-summary row for its student.
 
+    ``interview_type`` and ``timestamp`` only route the write when sharding
+    is enabled; without a timestamp the current academic year is used.
+    ``usage`` adds the summary call's tokens and cost to the interview totals,
+    and ``summary_model`` records which model wrote the summary.
+    """
+    _run_batch_operations(
+        operations=_summary_update_operations(
+            interview_id, summary, usage, summary_model
+        ),
+        shard_key=resolve_shard_key(interview_type, timestamp),
+    )
 
-def update_interview_summary(interview_id, summary):
-    """Update the stored summary for a completed interview."""
-    _, db_path = get_remote_database_location()
 
-    ssh, tmp_key_path = get_ssh_connection()
-    try:
-        update_query = """
-        UPDATE interviews
-        SET summary = ?
-        WHERE interview_id = ?
-        """
-        run_remote_sql(ssh, db_path, update_query, [summary, interview_id])
-    finally:
-        close_ssh_connection(ssh, tmp_key_path)
+def save_summary_results(results, *, shard_key=None):
+    """Write a group of generated summaries and failures in one transaction.
+
+    Each result is a dict with ``interview_id`` and ``status``; "done"
+    results also carry ``summary`` and optional ``usage`` totals and
+    ``summary_model``, failed ones carry ``attempts`` and ``error``.
+    """
+    if not results:
+        return
+    operations = []
+    for result in results:
+        if result["status"] == "done":
+            operations.extend(
+                _summary_update_operations(
+                    result["interview_id"],
+                    result["summary"],
+                    result.get("usage"),
+                    result.get("summary_model", ""),
+                )
+            )
+        else:
+            operations.extend(
+                _summary_status_operations(
+                    result["interview_id"],
+                    result["status"],
+                    attempts=result.get("attempts"),
+                    error=result.get("error", ""),
+                )
+            )
+    _run_batch_operations(operations=operations, shard_key=shard_key)
+
+
+def update_summary_status(
+    interview_id, status, *, attempts=None, error="", interview_type="", timestamp=""
+):
+    """Record background summary progress (running, retrying, failed) for an interview."""
+    _run_batch_operations(
+        operations=_summary_status_operations(
+            interview_id, status, attempts=attempts, error=error
+        ),
+        ssh_timeout=10,
+        ssh_retries=2,
+        shard_key=resolve_shard_key(interview_type, timestamp),
+    )
+
+
+def backfill_latest_summaries(shard_key=None):
+    """Populate latest_summaries from the full interview history of one file."""
+    results = _run_batch_operations(
+        operations=[
+            {"type": "execute", "sql_query": INTERVIEWS_TABLE_QUERY},
+            {"type": "execute", "sql_query": LATEST_SUMMARIES_TABLE_QUERY},
+            _build_latest_summaries_backfill_operation(),
+            {
+                "type": "execute",
+                "sql_query": "SELECT COUNT(*) FROM latest_summaries",
+                "fetch": "one",
+            },
+        ],
+        ensure_remote_dir=True,
+        shard_key=shard_key,
+    )
+    row = results[0] if results else None
+    return row[0] if row else 0
 
 
 def update_interview_survey(
@@ -603,8 +1148,15 @@ def update_interview_survey(
     validation_rating,
     feedback,
     survey_timestamp,
+    *,
+    interview_type="",
+    interview_timestamp="",
 ):
-    """Update the stored inline survey responses for a completed interview."""
+    """Update the stored inline survey responses for a completed interview.
+
+    ``interview_timestamp`` is the interview's saved timestamp and routes the
+    write when sharding is enabled.
+    """
     _run_batch_operations(
         operations=[
             {
@@ -621,5 +1173,6 @@ def update_interview_survey(
                 feedback,
                 survey_timestamp,
             ),
-        ]
+        ],
+        shard_key=resolve_interview_shard_key(interview_type, interview_timestamp),
     )
@@ -0,0 +1,577 @@
+import time
+from dataclasses import asdict, dataclass, field
+
+from database import (
+    CHECKPOINTS_ARCHIVE_TABLE_QUERY,
+    CHECKPOINTS_LAST_UPDATED_INDEX_QUERY,
+    CHECKPOINTS_TABLE_QUERY,
+    INTERVIEW_ID_INDEX_QUERY,
+    INTERVIEWS_TABLE_QUERY,
+    SUMMARY_STATUS_COLUMNS,
+    get_storage_backend,
+)
+
+
+AUTO_VACUUM_INCREMENTAL = 2
+DEFAULT_MAX_SECONDS = 120
+DEFAULT_MAX_VACUUM_BYTES = 512 * 1024 * 1024
+DEFAULT_INCREMENTAL_VACUUM_PAGES = 2000
+DEFAULT_ANALYSIS_LIMIT = 1000
+INTEGRITY_CHECK_MODES = ("quick", "full", "skip")
+INTEGRITY_CHECK_MAX_ERRORS = 100
+# Conservative throughput used to skip full-file steps that would not fit in
+# the time left: VACUUM rewrites the file twice, an integrity check reads it.
+VACUUM_BYTES_PER_SECOND = 20 * 1024 * 1024
+INTEGRITY_CHECK_BYTES_PER_SECOND = 50 * 1024 * 1024
+DEFAULT_CHECKPOINT_RETENTION_DAYS = 30
+DEFAULT_ABANDONED_AFTER_HOURS = 6
+UNFINISHED_SUMMARY_STATUSES = ("pending", "running", "retrying", "failed")
+# Statuses a live background job may still be working on; "missing" backfills
+# leave those rows alone.
+ACTIVE_SUMMARY_STATUSES = ("running", "retrying")
+SUMMARY_BACKFILL_MODES = ("missing", "all")
+DEFAULT_BACKFILL_PAGE_SIZE = 50
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+CHECKPOINT_SCHEMA_OPERATIONS = [
+    {"type": "execute", "sql_query": INTERVIEWS_TABLE_QUERY},
+    {"type": "execute", "sql_query": CHECKPOINTS_TABLE_QUERY},
+    {"type": "execute", "sql_query": CHECKPOINTS_ARCHIVE_TABLE_QUERY},
+    {"type": "execute", "sql_query": INTERVIEW_ID_INDEX_QUERY},
+    {"type": "execute", "sql_query": CHECKPOINTS_LAST_UPDATED_INDEX_QUERY},
+]
+
+COMPLETED_CHECKPOINT_CONDITION = """
+EXISTS (
+    SELECT 1
+    FROM interviews AS i
+    WHERE i.interview_id = interview_checkpoints.interview_id
+)
+"""
+
+DATABASE_STATS_OPERATIONS = [
+    {"type": "execute", "sql_query": "PRAGMA page_size", "fetch": "one"},
+    {"type": "execute", "sql_query": "PRAGMA page_count", "fetch": "one"},
+    {"type": "execute", "sql_query": "PRAGMA freelist_count", "fetch": "one"},
+    {"type": "execute", "sql_query": "PRAGMA auto_vacuum", "fetch": "one"},
+]
+
+
+@dataclass(frozen=True)
+class DatabaseStats:
+    page_size: int
+    page_count: int
+    freelist_count: int
+    auto_vacuum: int
+
+    @property
+    def file_size_bytes(self) -> int:
+        return self.page_size * self.page_count
+
+    @property
+    def fragmentation_pct(self) -> float:
+        if not self.page_count:
+            return 0.0
+        return round(100 * self.freelist_count / self.page_count, 2)
+
+    def as_report(self) -> dict:
+        return {
+            "file_size_bytes": self.file_size_bytes,
+            "page_count": self.page_count,
+            "freelist_count": self.freelist_count,
+            "fragmentation_pct": self.fragmentation_pct,
+            "auto_vacuum": self.auto_vacuum,
+        }
+
+
+@dataclass
+class MaintenanceStep:
+    name: str
+    status: str
+    seconds: float = 0.0
+    detail: str = ""
+
+
+@dataclass
+class MaintenanceReport:
+    before: dict
+    after: dict = field(default_factory=dict)
+    steps: list[MaintenanceStep] = field(default_factory=list)
+
+    def as_dict(self) -> dict:
+        return {
+            "before": self.before,
+            "after": self.after,
+            "steps": [asdict(step) for step in self.steps],
+        }
+
+
+def parse_database_stats(results) -> DatabaseStats:
+    """Build database stats from the results of DATABASE_STATS_OPERATIONS."""
+    values = [int(row[0]) if row else 0 for row in results]
+    page_size, page_count, freelist_count, auto_vacuum = values
+    return DatabaseStats(
+        page_size=page_size,
+        page_count=page_count,
+        freelist_count=freelist_count,
+        auto_vacuum=auto_vacuum,
+    )
+
+
+def read_database_stats(backend, connection=None) -> DatabaseStats:
+    return parse_database_stats(
+        backend.run_batch(DATABASE_STATS_OPERATIONS, connection=connection)
+    )
+
+
+def build_maintenance_plan(
+    stats: DatabaseStats,
+    *,
+    max_vacuum_bytes=DEFAULT_MAX_VACUUM_BYTES,
+    incremental_vacuum_pages=DEFAULT_INCREMENTAL_VACUUM_PAGES,
+    analysis_limit=DEFAULT_ANALYSIS_LIMIT,
+    integrity_check="quick",
+):
+    """Return (step name, operations or skip reason) pairs in execution order."""
+    plan = []
+
+    if stats.auto_vacuum == AUTO_VACUUM_INCREMENTAL:
+        plan.append(("enable_incremental_auto_vacuum", "already enabled"))
+    elif stats.file_size_bytes > max_vacuum_bytes:
+        plan.append(
+            (
+                "enable_incremental_auto_vacuum",
+                f"database is {stats.file_size_bytes} bytes, above the "
+                f"{max_vacuum_bytes}-byte VACUUM budget",
+            )
+        )
+    else:
+        plan.append(
+            (
+                "enable_incremental_auto_vacuum",
+                [
+                    {"type": "execute", "sql_query": "PRAGMA auto_vacuum = INCREMENTAL"},
+                    {"type": "execute", "sql_query": "VACUUM"},
+                ],
+            )
+        )
+
+    if incremental_vacuum_pages > 0:
+        plan.append(
+            (
+                "incremental_vacuum",
+                [
+                    {
+                        "type": "execute",
+                        "sql_query": f"PRAGMA incremental_vacuum({int(incremental_vacuum_pages)})",
+                        "fetch": "all",
+                    }
+                ],
+            )
+        )
+
+    plan.append(
+        (
+            "analyze",
+            [
+                {
+                    "type": "execute",
+                    "sql_query": f"PRAGMA analysis_limit = {int(analysis_limit)}",
+                    "fetch": "one",
+                },
+                {"type": "execute", "sql_query": "ANALYZE"},
+                {"type": "execute", "sql_query": "PRAGMA optimize"},
+            ],
+        )
+    )
+
+    if integrity_check == "skip":
+        plan.append(("integrity_check", "disabled"))
+    else:
+        pragma = "integrity_check" if integrity_check == "full" else "quick_check"
+        plan.append(
+            (
+                "integrity_check",
+                [
+                    {
+                        "type": "execute",
+                        "sql_query": f"PRAGMA {pragma}({INTEGRITY_CHECK_MAX_ERRORS})",
+                        "fetch": "all",
+                    }
+                ],
+            )
+        )
+
+    return plan
+
+
+def _describe_step_result(step_name: str, results) -> str:
+    if step_name != "integrity_check":
+        return ""
+    messages = [row[0] for row in (results[-1] if results else []) if row]
+    return "; ".join(str(message) for message in messages) or "ok"
+
+
+def estimate_step_seconds(step_name: str, stats: DatabaseStats) -> float:
+    """Return a rough duration for steps that touch every page of the file."""
+    if step_name == "enable_incremental_auto_vacuum":
+        return stats.file_size_bytes / VACUUM_BYTES_PER_SECOND
+    if step_name == "integrity_check":
+        return stats.file_size_bytes / INTEGRITY_CHECK_BYTES_PER_SECOND
+    return 0.0
+
+
+def run_maintenance(
+    backend=None,
+    *,
+    max_seconds=DEFAULT_MAX_SECONDS,
+    max_vacuum_bytes=DEFAULT_MAX_VACUUM_BYTES,
+    incremental_vacuum_pages=DEFAULT_INCREMENTAL_VACUUM_PAGES,
+    analysis_limit=DEFAULT_ANALYSIS_LIMIT,
+    integrity_check="quick",
+    clock=time.monotonic,
+) -> MaintenanceReport:
+    """Run ANALYZE, incremental VACUUM and an integrity check within budgets.
+
+    ``max_seconds`` is checked before each step, and the full VACUUM and the
+    integrity check are skipped when their size-based estimate does not fit
+    in the time left. A step that has started is not interrupted.
+    """
+    backend = backend or get_storage_backend()
+    started = clock()
+
+    with backend.session(timeout=30, retries=2) as connection:
+        before = read_database_stats(backend, connection)
+        report = MaintenanceReport(before=before.as_report())
+        plan = build_maintenance_plan(
+            before,
+            max_vacuum_bytes=max_vacuum_bytes,
+            incremental_vacuum_pages=incremental_vacuum_pages,
+            analysis_limit=analysis_limit,
+            integrity_check=integrity_check,
+        )
+
+        for step_name, operations in plan:
+            if isinstance(operations, str):
+                report.steps.append(
+                    MaintenanceStep(name=step_name, status="skipped", detail=operations)
+                )
+                continue
+            remaining = max_seconds - (clock() - started)
+            if remaining <= 0:
+                report.steps.append(
+                    MaintenanceStep(
+                        name=step_name,
+                        status="skipped",
+                        detail=f"time budget of {max_seconds}s exhausted",
+                    )
+                )
+                continue
+            estimate = estimate_step_seconds(step_name, before)
+            if estimate > remaining:
+                report.steps.append(
+                    MaintenanceStep(
+                        name=step_name,
+                        status="skipped",
+                        detail=(
+                            f"estimated {estimate:.0f}s exceeds the {remaining:.0f}s "
+                            "left in the time budget"
+                        ),
+                    )
+                )
+                continue
+
+            step_started = clock()
+            results = backend.run_batch(operations, connection=connection)
+            report.steps.append(
+                MaintenanceStep(
+                    name=step_name,
+                    status="ran",
+                    seconds=round(clock() - step_started, 3),
+                    detail=_describe_step_result(step_name, results),
+                )
+            )
+
+        report.after = read_database_stats(backend, connection).as_report()
+
+    return report
+
+
+def timestamp_days_ago(days: float, now_fn=time.time) -> str:
+    """Return the local timestamp string ``days`` before now."""
+    return time.strftime(TIMESTAMP_FORMAT, time.localtime(now_fn() - days * 86400))
+
+
+def _archive_checkpoints_operation(
+    reason: str, archived_at: str, condition: str, condition_params: list
+):
+    return {
+        "type": "execute",
+        "sql_query": f"""
+        INSERT OR REPLACE INTO interview_checkpoints_archive (
+            interview_id,
+            student_id,
+            name,
+            company,
+            interview_type,
+            last_updated,
+            duration_minutes,
+            transcript_zlib,
+            archive_reason,
+            archived_at
+        )
+        SELECT
+            interview_id,
+            student_id,
+            name,
+            company,
+            interview_type,
+            last_updated,
+            duration_minutes,
+            zlib_compress(transcript),
+            ?,
+            ?
+        FROM interview_checkpoints
+        WHERE {condition}
+        """,
+        "params": [reason, archived_at, *condition_params],
+    }
+
+
+def build_checkpoint_archive_operations(
+    cutoff_timestamp: str, archived_at: str, *, dry_run=False
+) -> list[dict]:
+    """Return one transaction that archives and prunes checkpoints.
+
+    Completed checkpoints (their interview_id exists in interviews) are archived
+    first; any remaining checkpoint last updated before ``cutoff_timestamp`` is
+    archived as abandoned. Both sets are then deleted from the hot table.
+    """
+    stale_condition = "last_updated < ?"
+    count_operations = [
+        {
+            "type": "execute",
+            "sql_query": (
+                "SELECT COUNT(*) FROM interview_checkpoints "
+                f"WHERE {COMPLETED_CHECKPOINT_CONDITION}"
+            ),
+            "fetch": "one",
+        },
+        {
+            "type": "execute",
+            "sql_query": (
+                "SELECT COUNT(*) FROM interview_checkpoints "
+                f"WHERE {stale_condition} AND NOT {COMPLETED_CHECKPOINT_CONDITION}"
+            ),
+            "params": [cutoff_timestamp],
+            "fetch": "one",
+        },
+    ]
+    if dry_run:
+        return CHECKPOINT_SCHEMA_OPERATIONS + count_operations
+
+    return (
+        CHECKPOINT_SCHEMA_OPERATIONS
+        + count_operations
+        + [
+            _archive_checkpoints_operation(
+                "completed", archived_at, COMPLETED_CHECKPOINT_CONDITION, []
+            ),
+            _archive_checkpoints_operation(
+                "abandoned",
+                archived_at,
+                f"{stale_condition} AND NOT {COMPLETED_CHECKPOINT_CONDITION}",
+                [cutoff_timestamp],
+            ),
+            {
+                "type": "execute",
+                "sql_query": (
+                    "DELETE FROM interview_checkpoints "
+                    f"WHERE {COMPLETED_CHECKPOINT_CONDITION} OR {stale_condition}"
+                ),
+                "params": [cutoff_timestamp],
+            },
+        ]
+    )
+
+
+def archive_checkpoints(
+    backend=None,
+    *,
+    retention_days=DEFAULT_CHECKPOINT_RETENTION_DAYS,
+    dry_run=False,
+    now_fn=time.time,
+) -> dict:
+    """Move completed and expired checkpoints into the compressed archive table."""
+    backend = backend or get_storage_backend()
+    cutoff_timestamp = timestamp_days_ago(retention_days, now_fn)
+    archived_at = time.strftime(TIMESTAMP_FORMAT, time.localtime(now_fn()))
+    results = backend.run_batch(
+        build_checkpoint_archive_operations(
+            cutoff_timestamp, archived_at, dry_run=dry_run
+        ),
+        ensure_directory=True,
+        timeout=30,
+        retries=2,
+    )
+    completed_row, abandoned_row = results[:2]
+    return {
+        "cutoff": cutoff_timestamp,
+        "dry_run": dry_run,
+        "completed_checkpoints": completed_row[0] if completed_row else 0,
+        "expired_checkpoints": abandoned_row[0] if abandoned_row else 0,
+    }
+
+
+def abandoned_interviews_report(
+    backend=None,
+    *,
+    older_than_hours=DEFAULT_ABANDONED_AFTER_HOURS,
+    limit=50,
+    now_fn=time.time,
+) -> list[dict]:
+    """List checkpoints with no completed interview, newest first.
+
+    The anti-join probes idx_interviews_interview_id per checkpoint and the
+    age filter uses idx_interview_checkpoints_last_updated, so neither table
+    is scanned in full.
+    """
+    backend = backend or get_storage_backend()
+    cutoff_timestamp = timestamp_days_ago(older_than_hours / 24, now_fn)
+    columns = [
+        "interview_id",
+        "student_id",
+        "interview_type",
+        "last_updated",
+        "duration_minutes",
+        "transcript_chars",
+    ]
+    results = backend.run_batch(
+        CHECKPOINT_SCHEMA_OPERATIONS
+        + [
+            {
+                "type": "execute",
+                "sql_query": """
+                SELECT
+                    c.interview_id,
+                    c.student_id,
+                    c.interview_type,
+                    c.last_updated,
+                    c.duration_minutes,
+                    LENGTH(c.transcript)
+                FROM interview_checkpoints AS c
+                LEFT JOIN interviews AS i
+                    ON i.interview_id = c.interview_id
+                WHERE c.last_updated < ?
+                    AND i.interview_id IS NULL
+                ORDER BY c.last_updated DESC
+                LIMIT ?
+                """,
+                "params": [cutoff_timestamp, limit],
+                "fetch": "all",
+            }
+        ],
+        ensure_directory=True,
+    )
+    rows = results[0] if results else []
+    return [dict(zip(columns, row)) for row in rows]
+
+
+def pending_summaries_report(backend=None, *, limit=50) -> list[dict]:
+    """List completed interviews whose background summary has not finished, oldest first."""
+    backend = backend or get_storage_backend()
+    columns = [
+        "interview_id",
+        "interview_type",
+        "timestamp",
+        "summary_status",
+        "summary_attempts",
+        "summary_error",
+        "summary_updated_at",
+    ]
+    placeholders = ", ".join("?" for _ in UNFINISHED_SUMMARY_STATUSES)
+    results = backend.run_batch(
+        [
+            {"type": "execute", "sql_query": INTERVIEWS_TABLE_QUERY},
+            {
+                "type": "ensure_columns",
+                "table": "interviews",
+                "columns": SUMMARY_STATUS_COLUMNS,
+            },
+            {
+                "type": "execute",
+                "sql_query": f"""
+                SELECT {', '.join(columns)}
+                FROM interviews
+                WHERE summary_status IN ({placeholders})
+                ORDER BY timestamp
+                LIMIT ?
+                """,
+                "params": [*UNFINISHED_SUMMARY_STATUSES, limit],
+                "fetch": "all",
+            },
+        ],
+        ensure_directory=True,
+    )
+    rows = results[0] if results else []
+    return [dict(zip(columns, row)) for row in rows]
+
+
+def summary_backfill_candidates(
+    backend=None,
+    *,
+    mode="missing",
+    after_interview_id="",
+    interview_type="",
+    limit=DEFAULT_BACKFILL_PAGE_SIZE,
+) -> list[dict]:
+    """Return the next page of saved interviews to (re-)summarize, by interview_id.
+
+    "missing" selects rows with an empty summary or a failed summary job;
+    "all" selects every row, e.g. after the summary prompt changes. Pages
+    are keyset-paginated after ``after_interview_id`` so a backfill can
+    stream the table and resume from the last id it wrote.
+    """
+    if mode not in SUMMARY_BACKFILL_MODES:
+        raise ValueError(f"Unsupported summary backfill mode: {mode!r}")
+    backend = backend or get_storage_backend()
+    columns = ["interview_id", "interview_type", "timestamp", "transcript"]
+    conditions = ["interview_id > ?", "COALESCE(transcript, '') != ''"]
+    params = [after_interview_id or ""]
+    if mode == "missing":
+        active_placeholders = ", ".join("?" for _ in ACTIVE_SUMMARY_STATUSES)
+        conditions.append(
+            "(COALESCE(summary, '') = '' OR summary_status = 'failed')"
+        )
+        conditions.append(
+            f"COALESCE(summary_status, '') NOT IN ({active_placeholders})"
+        )
+        params.extend(ACTIVE_SUMMARY_STATUSES)
+    if interview_type:
+        conditions.append("interview_type = ?")
+        params.append(interview_type)
+    results = backend.run_batch(
+        [
+            {"type": "execute", "sql_query": INTERVIEWS_TABLE_QUERY},
+            {
+                "type": "ensure_columns",
+                "table": "interviews",
+                "columns": SUMMARY_STATUS_COLUMNS,
+            },
+            {
+                "type": "execute",
+                "sql_query": f"""
+                SELECT {', '.join(columns)}
+                FROM interviews
+                WHERE {' AND '.join(conditions)}
+                ORDER BY interview_id
+                LIMIT ?
+                """,
+                "params": [*params, limit],
+                "fetch": "all",
+            },
+        ],
+        ensure_directory=True,
+    )
+    rows = results[0] if results else []
+    return [dict(zip(columns, row)) for row in rows]
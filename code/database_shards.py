@@ -0,0 +1,137 @@
+import re
+import time
+from pathlib import Path
+
+from storage_backend import DATABASE_FILENAME
+
+
+SHARDING_MODES = {"none", "academic_year", "interview_type"}
+DEFAULT_ACADEMIC_YEAR_START_MONTH = 9
+DEFAULT_SHARD_LOOKBACK_YEARS = 1
+# SQLite refuses more than ten attached databases in a default build; one
+# slot is kept for the unsharded interviews.db.
+MAX_ATTACHED_SHARDS = 9
+INTERVIEW_CONFIGS_DIRECTORY = Path(__file__).resolve().parent / "interview_configs"
+
+_SHARD_KEY_PATTERN = re.compile(r"[^A-Za-z0-9_-]+")
+
+
+def normalize_sharding_mode(raw_mode) -> str:
+    """Normalize the configured sharding mode, defaulting to a single file."""
+    mode = str(raw_mode or "none").strip().lower() or "none"
+    if mode not in SHARDING_MODES:
+        raise ValueError(
+            "Unrecognized DATABASE_SHARDING; supported values are none, "
+            "academic_year, and interview_type."
+        )
+    return mode
+
+
+def academic_year_for(
+    timestamp: str = "",
+    *,
+    start_month=DEFAULT_ACADEMIC_YEAR_START_MONTH,
+    now_fn=time.localtime,
+) -> str:
+    """Return the academic year label, e.g. ``2025-2026``, for a timestamp."""
+    if timestamp and len(timestamp) >= 7:
+        year, month = int(timestamp[:4]), int(timestamp[5:7])
+    else:
+        now = now_fn()
+        year, month = now.tm_year, now.tm_mon
+
+    start_year = year if month >= start_month else year - 1
+    return f"{start_year}-{start_year + 1}"
+
+
+def shift_academic_year(label: str, years: int) -> str:
+    start_year = int(label.split("-", 1)[0]) + years
+    return f"{start_year}-{start_year + 1}"
+
+
+def shard_filename(shard_key: str | None) -> str:
+    """Return the database filename for a shard, or the unsharded default."""
+    if not shard_key:
+        return DATABASE_FILENAME
+    safe_key = _SHARD_KEY_PATTERN.sub("_", shard_key).strip("_")
+    if not safe_key:
+        raise ValueError(f"Invalid database shard key: {shard_key!r}")
+    stem = DATABASE_FILENAME.rsplit(".", 1)[0]
+    return f"{stem}-{safe_key}.db"
+
+
+def resolve_write_shard_key(
+    mode: str,
+    *,
+    interview_type: str = "",
+    timestamp: str = "",
+    start_month=DEFAULT_ACADEMIC_YEAR_START_MONTH,
+    now_fn=time.localtime,
+) -> str | None:
+    """Return the shard a write for this interview belongs to."""
+    if mode == "academic_year":
+        return academic_year_for(timestamp, start_month=start_month, now_fn=now_fn)
+    if mode == "interview_type":
+        if not interview_type:
+            raise ValueError(
+                "interview_type is required to route writes when "
+                "DATABASE_SHARDING is interview_type."
+            )
+        return interview_type.lower()
+    return None
+
+
+def known_interview_types() -> list[str]:
+    """Return interview types that have a config module, and so may have a shard."""
+    return sorted(
+        path.stem
+        for path in INTERVIEW_CONFIGS_DIRECTORY.glob("*.py")
+        if path.stem != "base_config" and not path.stem.startswith("_")
+    )
+
+
+def resolve_read_shard_keys(
+    mode: str,
+    *,
+    interview_type: str = "",
+    lookback_years=DEFAULT_SHARD_LOOKBACK_YEARS,
+    start_month=DEFAULT_ACADEMIC_YEAR_START_MONTH,
+    now_fn=time.localtime,
+) -> list[str]:
+    """Return the shards a federated read should touch, hottest first."""
+    if mode == "academic_year":
+        current_year = academic_year_for(start_month=start_month, now_fn=now_fn)
+        keys = [
+            shift_academic_year(current_year, -offset)
+            for offset in range(max(int(lookback_years), 0) + 1)
+        ]
+    elif mode == "interview_type":
+        keys = [interview_type.lower()] if interview_type else known_interview_types()
+    else:
+        return []
+    return keys[:MAX_ATTACHED_SHARDS]
+
+
+def build_attach_operations(
+    directory: str,
+    shard_keys: list[str],
+    table_columns: dict[str, list[str]],
+    include_unsharded: bool = True,
+) -> list[dict]:
+    """Attach the shard files that exist and expose each table as one federated view.
+
+    Run against an in-memory main database: nothing is created on the read
+    path, and the unsharded interviews.db is included by default so history
+    written before sharding was enabled stays readable. A shard without
+    the table, or without a later-added column, contributes nothing or NULLs.
+    """
+    databases = [
+        [f"shard_{index}", f"{directory}/{shard_filename(shard_key)}"]
+        for index, shard_key in enumerate(
+            [*shard_keys, None] if include_unsharded or not shard_keys else shard_keys
+        )
+    ]
+    return [{"type": "attach_existing", "databases": databases}] + [
+        {"type": "federated_view", "table": table, "columns": list(columns)}
+        for table, columns in table_columns.items()
+    ]
@@ -1,8 +1,8 @@
 import argparse
 import json
 
-from database import get_remote_database_location
-from remote_utils import close_ssh_connection, get_ssh_connection, run_remote_sql
+from database import get_federated_read_backend, get_read_shard_keys
+from database_shards import build_attach_operations
 
 
 INTERVIEW_COLUMNS = [
@@ -24,7 +24,6 @@ PROGRESS_COLUMNS = [
     "completion_timestamp",
 ]
 
-
 def build_parser():
     parser = argparse.ArgumentParser(
         description="Inspect interview data stored in the remote LIACS SQLite database."
@@ -77,9 +76,34 @@ def build_parser():
         action="store_true",
         help="Print results as JSON instead of tab-separated text.",
     )
+    parser.add_argument(
+        "--shard",
+        action="append",
+        default=[],
+        help=(
+            "Shard to read when DATABASE_SHARDING is enabled, e.g. 2025-2026 or "
+            "midterm_interview. Repeat to federate several shards."
+        ),
+    )
+    parser.add_argument(
+        "--all-shards",
+        action="store_true",
+        help="Federate every shard the app itself would read.",
+    )
     return parser
 
 
+def selected_columns(args):
+    if args.table == "interviews":
+        columns = list(INTERVIEW_COLUMNS)
+        if args.show_summary:
+            columns.append("summary")
+        if args.show_transcript:
+            columns.append("transcript")
+        return columns
+    return list(PROGRESS_COLUMNS)
+
+
 def build_query(args):
     params = []
     where_clauses = []
@@ -100,21 +124,13 @@ def build_query(args):
     if where_clauses:
         where_sql = " WHERE " + " AND ".join(where_clauses)
 
+    columns = selected_columns(args)
+    order_column = "timestamp" if args.table == "interviews" else "completion_timestamp"
+
     if args.count_only:
         query = f"SELECT COUNT(*) FROM {args.table}{where_sql}"
         return query, params, ["count"]
 
-    if args.table == "interviews":
-        columns = list(INTERVIEW_COLUMNS)
-        if args.show_summary:
-            columns.append("summary")
-        if args.show_transcript:
-            columns.append("transcript")
-        order_column = "timestamp"
-    else:
-        columns = list(PROGRESS_COLUMNS)
-        order_column = "completion_timestamp"
-
     query = (
         f"SELECT {', '.join(columns)} FROM {args.table}{where_sql} "
         f"ORDER BY {order_column} DESC LIMIT ?"
@@ -134,18 +150,36 @@ def print_rows(columns, rows, as_json=False):
         print("\t".join("" if value is None else str(value) for value in row))
 
 
+def resolve_shard_keys(args):
+    if args.shard:
+        return list(args.shard)
+    if args.all_shards:
+        return get_read_shard_keys()
+    return get_read_shard_keys(args.interview_type)
+
+
 def main():
     args = build_parser().parse_args()
-    _, db_path = get_remote_database_location()
     query, params, columns = build_query(args)
-
-    ssh = None
-    tmp_key_path = None
-    try:
-        ssh, tmp_key_path = get_ssh_connection()
-        rows = run_remote_sql(ssh, db_path, query, params, fetch="all") or []
-    finally:
-        close_ssh_connection(ssh, tmp_key_path)
+    backend = get_federated_read_backend()
+
+    results = backend.run_batch(
+        build_attach_operations(
+            backend.directory,
+            resolve_shard_keys(args),
+            {args.table: selected_columns(args)},
+            include_unsharded=not args.shard,
+        )
+        + [
+            {
+                "type": "execute",
+                "sql_query": query,
+                "params": params,
+                "fetch": "all",
+            }
+        ]
+    )
+    rows = (results[0] if results else None) or []
 
     if args.count_only:
         count = rows[0][0] if rows else 0
@@ -3,15 +3,25 @@ import html
 import importlib.util
 import os
 import random
-import re
 import tempfile
+import threading
 import time
 import uuid
+from functools import partial
 
 import streamlit as st
-from openai import NotFoundError, OpenAI
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 from streamlit_mic_recorder import mic_recorder
 
+from interview_async_provider import (
+    CancelToken,
+    StreamCancelledError,
+    get_queue_timeout_seconds,
+    preconnect_async_client,
+    resolve_concurrency_limit,
+    script_run_interrupted_check,
+    stream_reply,
+)
 from interview_completion import (
     INLINE_SURVEY_LEGEND,
     INLINE_SURVEY_OPTIONS,
@@ -21,13 +31,25 @@ from interview_completion import (
     initialize_completion_state,
     survey_option_index,
 )
+from interview_context import (
+    CONTEXT_SUMMARY_MAX_TOKENS,
+    ROLLING_SUMMARY_INSTRUCTIONS,
+    build_context_window,
+    submit_rolling_summary,
+)
+from interview_failover import (
+    HedgeOutcome,
+    create_failover_runtimes,
+    get_failover_timeout_seconds,
+    get_failover_ttft_seconds,
+    hedged_stream,
+)
 from interview_logic import (
     classify_assistant_reply,
     compose_system_prompt,
-    extract_anthropic_text,
-    extract_openai_stream_delta,
     filter_display_messages,
     find_closing_code,
+    get_closing_code_matcher,
     missing_query_params,
     normalize_query_value,
     resolve_query_params,
@@ -35,14 +57,44 @@ from interview_logic import (
     should_accept_user_input,
     should_finalize_interview,
 )
+from interview_metrics import StreamTiming, record_turn_metrics
+from interview_opening import (
+    get_cached_opening,
+    has_cached_opening,
+    opening_cache_key,
+    store_opening,
+)
+from interview_pacing import TypingPacer
 from interview_persistence import CompletionContext, persist_completion
 from interview_provider import (
+    SUMMARY_DEFAULT_MAX_TOKENS,
+    ModelSelection,
     apply_reasoning_level,
     apply_model_selection_to_openai_kwargs,
+    apply_prompt_cache_to_anthropic_kwargs,
+    apply_prompt_cache_to_openai_kwargs,
+    build_prompt_cache_key,
     create_provider_runtime,
+    get_cached_client,
+    preconnect_client,
     resolve_reasoning_experiment_level,
     supports_reasoning_experiment,
 )
+from interview_usage import (
+    MODEL_PRICES,
+    estimate_cost_usd,
+    interview_usage_totals,
+    load_model_prices,
+    total_usage,
+)
+from interview_rate_limit import PRIORITY_BACKGROUND, configure_rate_limits
+from interview_reasoning import (
+    ReasoningDecision,
+    choose_reasoning_level,
+    configure_reasoning_slo,
+    record_reasoning_latency,
+    resolve_reasoning_policy,
+)
 from interview_selection import get_context_transcript, load_interview_context_map
 from interview_smoke import (
     SMOKE_TEST_MODEL,
@@ -51,8 +103,16 @@ from interview_smoke import (
     smoke_noop,
     smoke_test_mode_enabled,
 )
+from interview_summary import build_summary_completion, summarize_transcript
+from interview_summary_jobs import SummaryJob, submit_summary_job
+from interview_warmup import (
+    config_path,
+    ensure_warmup,
+    load_interview_config,
+    preload_interview_configs,
+    resolve_warmup_interval,
+)
 INITIAL_USER_PROMPT = "Please begin the interview following the provided instructions."
-TYPING_CHARACTERS_PER_SECOND = 65
 REQUIRED_QUERY_PARAMS = ("name", "recipient_email")
 LAUNCH_QUERY_PARAM_KEYS = REQUIRED_QUERY_PARAMS + (
     "company",
@@ -82,12 +142,21 @@ def persist_completion_remote(*args, **kwargs):
 def update_interview_summary(*args, **kwargs):
     from database import update_interview_summary as impl
 
+    kwargs.setdefault("interview_type", config_name)
+    return impl(*args, **kwargs)
+
+
+def update_summary_status(*args, **kwargs):
+    from database import update_summary_status as impl
+
+    kwargs.setdefault("interview_type", config_name)
     return impl(*args, **kwargs)
 
 
 def record_email_delivery_remote(*args, **kwargs):
     from database import record_email_delivery_remote as impl
 
+    kwargs.setdefault("interview_type", config_name)
     return impl(*args, **kwargs)
 
 
@@ -114,11 +183,11 @@ def synthesize_speech_deepinfra(*args, **kwargs):
 
 
 def get_audio_client():
-    """Create an OpenAI client only when voice transcription is requested."""
+    """Return the shared OpenAI client only when voice transcription is requested."""
     api_key = st.secrets.get("API_KEY")
     if not api_key:
         raise RuntimeError("Voice transcription requires API_KEY in Streamlit secrets.")
-    return OpenAI(api_key=api_key)
+    return get_cached_client("openai", api_key)
 
 
 def transcribe(audio_bytes: bytes) -> str:
@@ -219,6 +288,92 @@ def _update_tts_audio():
         return False
 
 
+def warm_storage_connection():
+    from database import warm_storage_connection as impl
+
+    return impl()
+
+
+def _chat_request_kwargs(
+    runtime, selection, conversation, system_prompt: str, stream: bool = True
+) -> dict:
+    """Build provider-specific chat kwargs without touching session state."""
+    kwargs = {
+        "model": selection.model,
+        "max_tokens": config.MAX_OUTPUT_TOKENS,
+        "messages": conversation,
+        "stream": stream,
+    }
+    if config.TEMPERATURE is not None:
+        kwargs["temperature"] = config.TEMPERATURE
+    if runtime.api == "openai":
+        kwargs = apply_model_selection_to_openai_kwargs(kwargs, selection)
+        kwargs = apply_prompt_cache_to_openai_kwargs(
+            kwargs, runtime.provider, build_prompt_cache_key(config_name, selection.model)
+        )
+        if stream:
+            kwargs["stream_options"] = {"include_usage": True}
+    if runtime.api == "anthropic":
+        system_parts = [
+            message["content"] for message in conversation if message["role"] == "system"
+        ]
+        if system_prompt not in system_parts:
+            system_parts.insert(0, system_prompt)
+        kwargs["system"] = "\n\n".join(system_parts)
+        kwargs["messages"] = [
+            message for message in conversation if message["role"] != "system"
+        ]
+        kwargs = apply_prompt_cache_to_anthropic_kwargs(kwargs)
+    return kwargs
+
+
+def _prefill_opening_turn(runtime, concurrency_limit: int, queue_timeout: float) -> None:
+    """Generate the context-free opening turn once so no participant waits for it.
+
+    Runs on the warmup thread at background priority; later passes are a
+    no-op while the opening stays cached. Its tokens belong to no interview.
+    """
+    system_prompt = compose_system_prompt(
+        getattr(config, "SYSTEM_PROMPT", config.INTERVIEW_OUTLINE)
+    )
+    selection = runtime.model_selection
+    key = opening_cache_key(
+        config_name,
+        selection.model,
+        system_prompt,
+        INITIAL_USER_PROMPT,
+        selection.reasoning_level,
+    )
+    if has_cached_opening(key):
+        return
+    conversation = [{"role": "user", "content": INITIAL_USER_PROMPT}]
+    if runtime.api == "openai":
+        conversation.insert(0, {"role": "system", "content": system_prompt})
+    reply = "".join(
+        stream_reply(
+            runtime,
+            _chat_request_kwargs(runtime, selection, conversation, system_prompt),
+            {},
+            concurrency_limit=concurrency_limit,
+            queue_timeout=queue_timeout,
+            priority=PRIORITY_BACKGROUND,
+        )
+    )
+    if find_closing_code(reply, config.CLOSING_MESSAGES) is None:
+        store_opening(key, reply)
+
+
+def _build_warmup_steps(runtimes) -> dict:
+    """Warm configs, the pooled SSH connection, and every provider's client pools."""
+    steps = {"configs": preload_interview_configs, "storage": warm_storage_connection}
+    for runtime in runtimes:
+        steps[f"{runtime.provider}_client"] = partial(preconnect_client, runtime.client)
+        steps[f"{runtime.provider}_async_client"] = partial(
+            preconnect_async_client, runtime.async_client
+        )
+    return steps
+
+
 query_params = st.query_params
 raw_launch_params = {
     key: normalize_query_value(query_params.get(key)) for key in LAUNCH_QUERY_PARAM_KEYS
@@ -258,15 +413,10 @@ if raw_config_name == "Default":
     config_name = "Default"
 else:
     config_name = raw_config_name
-    config_path = os.path.join(
-        os.path.dirname(__file__), "interview_configs", f"{config_name}.py"
-    )
-    if not os.path.exists(config_path):
+    if not config_path(config_name).is_file():
         st.error(f"Configuration file {config_name}.py not found.")
         st.stop()
-    spec = importlib.util.spec_from_file_location("config", config_path)
-    config = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(config)
+    config = load_interview_config(config_name)
 
 
 if SMOKE_TEST_MODE:
@@ -275,6 +425,17 @@ if SMOKE_TEST_MODE:
     api = "smoke"
     client = None
     model_selection = None
+    summary_selection = ModelSelection(
+        model=SMOKE_TEST_MODEL, max_tokens=SUMMARY_DEFAULT_MAX_TOKENS
+    )
+    provider_runtime = None
+    failover_runtimes = []
+    failover_ttft_seconds = 0.0
+    failover_timeout_seconds = 0.0
+    provider_queue_timeout_seconds = 0.0
+    provider_concurrency_limits = {}
+    model_prices = MODEL_PRICES
+    reasoning_policy = "random"
 else:
     provider_runtime = create_provider_runtime(
         st.secrets,
@@ -286,6 +447,33 @@ else:
     api = provider_runtime.api
     client = provider_runtime.client
     model_selection = provider_runtime.model_selection
+    summary_selection = provider_runtime.summary_selection
+    failover_runtimes = create_failover_runtimes(
+        st.secrets,
+        config_name,
+        config.MAX_OUTPUT_TOKENS,
+        provider_runtime,
+    )
+    failover_ttft_seconds = get_failover_ttft_seconds(st.secrets)
+    failover_timeout_seconds = get_failover_timeout_seconds(st.secrets)
+    provider_queue_timeout_seconds = get_queue_timeout_seconds(st.secrets)
+    model_prices = load_model_prices(st.secrets.get("MODEL_PRICES_JSON"))
+    configure_rate_limits(st.secrets)
+    configure_reasoning_slo(st.secrets)
+    reasoning_policy = resolve_reasoning_policy(st.secrets)
+    provider_concurrency_limits = {
+        runtime.provider: resolve_concurrency_limit(st.secrets, runtime.provider)
+        for runtime in failover_runtimes
+    }
+    warmup_steps = _build_warmup_steps(failover_runtimes)
+    if getattr(config, "CACHE_OPENING_TURN", True):
+        warmup_steps[f"{config_name}_opening_turn"] = partial(
+            _prefill_opening_turn,
+            provider_runtime,
+            provider_concurrency_limits[provider_runtime.provider],
+            provider_queue_timeout_seconds,
+        )
+    ensure_warmup(warmup_steps, resolve_warmup_interval(st.secrets))
 
 
 def _get_param(name: str, default: str = "") -> str:
@@ -335,6 +523,26 @@ if "tts_played_nonce" not in st.session_state:
     st.session_state.tts_played_nonce = 0
 if "checkpoint_error" not in st.session_state:
     st.session_state.checkpoint_error = ""
+if "turn_usage" not in st.session_state:
+    # Per-turn metadata lives beside ``messages`` because those dicts are sent
+    # to the provider verbatim.
+    st.session_state.turn_usage = []
+if "turn_metrics_saved" not in st.session_state:
+    st.session_state.turn_metrics_saved = 0
+if "context_summary" not in st.session_state:
+    st.session_state.context_summary = ""
+if "context_summary_through" not in st.session_state:
+    st.session_state.context_summary_through = 0
+if "context_summary_future" not in st.session_state:
+    st.session_state.context_summary_future = None
+
+
+# A new run supersedes any stream the previous run left open for this session.
+if "stream_cancel_token" in st.session_state:
+    st.session_state.stream_cancel_token.cancel("superseded by a new script run")
+st.session_state.stream_cancel_token = CancelToken(
+    should_cancel=script_run_interrupted_check(get_script_run_ctx())
+)
 
 if model_selection is None:
     st.session_state.model_reasoning_level = "none"
@@ -345,138 +553,376 @@ else:
     experiment_active = random_reasoning_experiment and supports_reasoning_experiment(
         provider, config_name
     )
-    if experiment_active:
-        if (
-            st.session_state.get("model_reasoning_session_id")
-            != st.session_state.session_id
-        ):
-            st.session_state.model_reasoning_level = resolve_reasoning_experiment_level(
+    if (
+        st.session_state.get("model_reasoning_session_id")
+        != st.session_state.session_id
+    ):
+        if experiment_active:
+            assigned_level = resolve_reasoning_experiment_level(
                 random_reasoning_experiment,
                 provider,
                 config_name,
                 choice_fn=random.choice,
             )
-            st.session_state.model_reasoning_session_id = st.session_state.session_id
+            decision = ReasoningDecision(assigned_level, assigned_level, "random assignment")
+        else:
+            assigned_level = model_selection.reasoning_level
+            decision = ReasoningDecision(assigned_level, assigned_level, "configured level")
+        if reasoning_policy == "adaptive":
+            decision = choose_reasoning_level(provider, model, assigned_level)
+            print(
+                f"Reasoning level for session {st.session_state.session_id}: "
+                f"{decision.level} (assigned {decision.assigned_level}; {decision.reason})"
+            )
+        st.session_state.model_reasoning_assigned_level = decision.assigned_level
+        st.session_state.model_reasoning_level = decision.level
+        st.session_state.model_reasoning_reason = decision.reason
+        st.session_state.model_reasoning_session_id = st.session_state.session_id
+    if (
+        experiment_active
+        or st.session_state.model_reasoning_level != model_selection.reasoning_level
+    ):
         model_selection = apply_reasoning_level(
             model_selection, st.session_state.model_reasoning_level
         )
-    else:
-        st.session_state.model_reasoning_level = model_selection.reasoning_level
 
 model_reasoning_level = st.session_state.model_reasoning_level
 
 
+# Summary routing (model, reasoning payload) at background priority, shared
+# by the rolling context summary and the end-of-interview summary.
+_complete_summary_prompt = build_summary_completion(
+    provider, api, client, summary_selection
+)
+
+
+def _generate_rolling_summary(prompt: str) -> tuple:
+    """Fold aged-out turns into the running context summary; runs off the request path.
+
+    Returns ``(summary_text, usage)``.
+    """
+    if SMOKE_TEST_MODE:
+        return smoke_generate_summary(prompt), None
+    return _complete_summary_prompt(
+        ROLLING_SUMMARY_INSTRUCTIONS, prompt, CONTEXT_SUMMARY_MAX_TOKENS
+    )
+
+
+def _apply_finished_context_summary() -> None:
+    """Adopt the background summary once it has finished."""
+    future = st.session_state.context_summary_future
+    if future is None or not future.done():
+        return
+    st.session_state.context_summary_future = None
+    try:
+        summary, summary_through, usage = future.result()
+    except Exception as exc:
+        print(f"Context summary failed for {st.session_state.session_id}: {exc}")
+        return
+    if usage is not None:
+        _record_usage(
+            "context_summary",
+            provider,
+            summary_selection.model,
+            usage,
+            recorded_at=time.strftime("%Y-%m-%d %H:%M:%S", time.localtime()),
+        )
+    if not summary:
+        print(f"Context summary returned no text for {st.session_state.session_id}")
+        return
+    if summary_through > st.session_state.context_summary_through:
+        st.session_state.context_summary = summary
+        st.session_state.context_summary_through = summary_through
+
+
 def get_chat_messages():
-    """Return the current conversation in provider-compatible format."""
+    """Return the current conversation in provider-compatible format.
+
+    History beyond the config's ``CONTEXT_TOKEN_BUDGET`` is replaced by a
+    rolling summary that is refreshed in the background.
+    """
     if api == "anthropic":
-        return [
+        messages = [
             message
             for message in st.session_state.messages
             if message["role"] != "system"
         ]
-    return list(st.session_state.messages)
+    else:
+        messages = list(st.session_state.messages)
+    if SMOKE_TEST_MODE:
+        return messages
+
+    _apply_finished_context_summary()
+    window = build_context_window(
+        messages,
+        token_budget=getattr(config, "CONTEXT_TOKEN_BUDGET", None),
+        summary=st.session_state.context_summary,
+        summary_through=st.session_state.context_summary_through,
+    )
+    if (
+        window.pending_summary_through is not None
+        and st.session_state.context_summary_future is None
+    ):
+        st.session_state.context_summary_future = submit_rolling_summary(
+            _generate_rolling_summary,
+            st.session_state.context_summary,
+            [message for message in messages if message["role"] != "system"],
+            window.summary_through,
+            window.pending_summary_through,
+        )
+    return window.messages
 
 
-def build_chat_kwargs(messages=None, stream=True):
-    """Build provider-specific chat kwargs for the current conversation state."""
-    conversation = list(messages if messages is not None else get_chat_messages())
-    kwargs = {
-        "model": model,
-        "max_tokens": config.MAX_OUTPUT_TOKENS,
-        "messages": conversation,
-        "stream": stream,
-    }
-    if config.TEMPERATURE is not None:
-        kwargs["temperature"] = config.TEMPERATURE
-    if model_selection is not None and api == "openai":
-        kwargs = apply_model_selection_to_openai_kwargs(kwargs, model_selection)
-    if api == "anthropic":
-        kwargs["system"] = st.session_state.system_prompt
-        kwargs["messages"] = [
-            message for message in conversation if message["role"] != "system"
-        ]
-    return kwargs
+def _messages_for_api(messages, target_api: str):
+    """Adapt the conversation to the target API when a fallback uses the other format."""
+    if target_api != "openai" or any(
+        message["role"] == "system" for message in messages
+    ):
+        return messages
+    return [{"role": "system", "content": st.session_state.system_prompt}] + messages
 
 
-def _iter_paced_text(text: str):
-    """Yield text in small chunks so Streamlit can render it at a steady pace."""
-    for chunk in re.findall(r"\S+\s*|\s+", text):
-        if not chunk:
-            continue
-        yield chunk
-        time.sleep(max(len(chunk) / TYPING_CHARACTERS_PER_SECOND, 0.05))
+def build_chat_kwargs(messages=None, stream=True, runtime=None):
+    """Build provider-specific chat kwargs for the current conversation state.
+
+    ``runtime`` defaults to the primary provider; failover attempts pass
+    their own so the model, reasoning settings, and message format match.
+    """
+    runtime = runtime or provider_runtime
+    conversation = _messages_for_api(
+        list(messages if messages is not None else get_chat_messages()), runtime.api
+    )
+    selection = model_selection if runtime is provider_runtime else runtime.model_selection
+    return _chat_request_kwargs(
+        runtime, selection, conversation, st.session_state.system_prompt, stream
+    )
+
+
+def _iter_runtime_reply_chunks(
+    runtime,
+    request_kwargs: dict,
+    usage_state: dict,
+    cancel_token: CancelToken,
+    stop_event: threading.Event | None = None,
+):
+    """Yield response text from one provider via the shared async provider loop.
+
+    This runs on failover worker threads, so it must not touch session state;
+    ``request_kwargs`` and ``cancel_token`` are taken from it up front.
+    ``stop_event`` is the hedge's cancel event for this attempt.
+    """
+    return stream_reply(
+        runtime,
+        request_kwargs,
+        usage_state,
+        concurrency_limit=provider_concurrency_limits[runtime.provider],
+        queue_timeout=provider_queue_timeout_seconds,
+        cancel_token=cancel_token,
+        stop_event=stop_event,
+    )
 
 
-def _iter_provider_reply_chunks(messages=None):
-    """Yield provider response text chunks for the current conversation."""
+def _iter_provider_reply_chunks(messages=None, usage_state=None):
+    """Yield provider response text chunks for the current conversation.
+
+    With a failover chain configured, later providers are hedged in when the
+    current ones miss the TTFT deadline. ``usage_state`` receives the serving
+    provider and model, and its prompt-cache usage once the stream finishes.
+    """
+    usage_state = usage_state if usage_state is not None else {}
     if SMOKE_TEST_MODE:
+        usage_state.update(provider=provider, model=model)
         yield next_smoke_reply(messages if messages is not None else get_chat_messages())
         return
 
-    if api == "openai":
-        try:
-            stream = client.chat.completions.create(**build_chat_kwargs(messages=messages))
-        except NotFoundError as e:
-            raise RuntimeError(
-                "Model not available on OpenRouter. Check privacy settings at "
-                "https://openrouter.ai/settings/privacy and verify the configured model ID.\n\n"
-                f"Original error: {e}"
-            ) from e
-        for chunk in stream:
-            delta = extract_openai_stream_delta(chunk)
-            if delta:
-                yield delta
+    conversation = list(messages if messages is not None else get_chat_messages())
+    cancel_token = st.session_state.stream_cancel_token
+    if len(failover_runtimes) == 1:
+        usage_state.update(provider=provider, model=model)
+        yield from _iter_runtime_reply_chunks(
+            provider_runtime,
+            build_chat_kwargs(messages=conversation),
+            usage_state,
+            cancel_token,
+        )
         return
 
-    with client.messages.stream(**build_chat_kwargs(messages=messages)) as stream:
-        for delta in stream.text_stream:
-            if delta:
-                yield delta
+    attempt_usage = [{} for _ in failover_runtimes]
+    attempts = [
+        (
+            runtime.provider,
+            partial(
+                _iter_runtime_reply_chunks,
+                runtime,
+                build_chat_kwargs(messages=conversation, runtime=runtime),
+                attempt_usage[index],
+                cancel_token,
+            ),
+        )
+        for index, runtime in enumerate(failover_runtimes)
+    ]
+    outcome = HedgeOutcome()
+    try:
+        yield from hedged_stream(
+            attempts,
+            ttft_deadline_seconds=failover_ttft_seconds,
+            timeout_seconds=failover_timeout_seconds,
+            outcome=outcome,
+        )
+    finally:
+        if outcome.served_index is not None:
+            served = failover_runtimes[outcome.served_index]
+            usage_state.update(attempt_usage[outcome.served_index])
+            usage_state.update(
+                provider=served.provider,
+                model=(
+                    model if served is provider_runtime else served.model_selection.model
+                ),
+                hedged=outcome.hedged,
+            )
 
 
-def stream_assistant_reply(message_placeholder, messages=None) -> tuple[str, str | None]:
-    """Stream the assistant response with Streamlit's native write_stream."""
-    max_closing_code_length = max(
-        (len(code) for code in config.CLOSING_MESSAGES),
-        default=0,
+def _usage_entry(kind: str, served_provider: str, served_model: str, usage, **extra) -> dict:
+    return {
+        "kind": kind,
+        "provider": served_provider,
+        "model": served_model,
+        **extra,
+        **(usage.as_dict() if usage is not None else {}),
+        "cost_usd": estimate_cost_usd(served_model, usage, model_prices),
+    }
+
+
+def _record_usage(kind: str, served_provider: str, served_model: str, usage, **extra) -> dict:
+    """Append one provider call's token usage and cost to ``turn_usage``."""
+    entry = _usage_entry(kind, served_provider, served_model, usage, **extra)
+    st.session_state.turn_usage.append(entry)
+    return entry
+
+
+def _without_queue_wait(latency_ms: float | None, queue_wait_ms: float) -> float | None:
+    if latency_ms is None:
+        return None
+    return max(latency_ms - queue_wait_ms, 0.0)
+
+
+def record_turn_usage(usage_state: dict, timing: StreamTiming | None = None) -> None:
+    """Append this turn's serving provider, usage, cost, and timing to session state.
+
+    The timing is also added to the process-wide latency histograms, labelled
+    by the provider and model that served the turn, and to the rolling
+    windows the adaptive reasoning policy checks against its SLO, minus the
+    time the turn waited for a rate-limit or concurrency slot.
+    """
+    if "provider" not in usage_state:
+        return
+    chat_turns = sum(1 for entry in st.session_state.turn_usage if entry["kind"] == "chat")
+    usage = usage_state.get("usage")
+    timing_metrics = {
+        "queue_wait_ms": round(usage_state.get("queue_wait_seconds", 0.0) * 1000, 2),
+        **(
+            timing.as_dict(output_tokens=usage.output_tokens if usage else None)
+            if timing is not None
+            else {}
+        ),
+    }
+    _record_usage(
+        "chat",
+        usage_state["provider"],
+        usage_state["model"],
+        usage,
+        turn=chat_turns + 1,
+        recorded_at=time.strftime("%Y-%m-%d %H:%M:%S", time.localtime()),
+        reasoning_level=model_reasoning_level,
+        reasoning_assigned_level=st.session_state.get(
+            "model_reasoning_assigned_level", model_reasoning_level
+        ),
+        hedged=usage_state.get("hedged", False),
+        **timing_metrics,
+    )
+    record_turn_metrics(
+        timing_metrics,
+        provider=usage_state["provider"],
+        model=usage_state["model"],
+        reasoning_level=model_reasoning_level,
+    )
+    # Queueing is not something a lower reasoning level can fix, so the SLO
+    # only sees time spent at the provider.
+    queue_wait_ms = timing_metrics["queue_wait_ms"]
+    record_reasoning_latency(
+        usage_state["provider"],
+        usage_state["model"],
+        model_reasoning_level,
+        ttft_ms=_without_queue_wait(timing_metrics.get("ttft_ms"), queue_wait_ms),
+        total_ms=_without_queue_wait(timing_metrics.get("stream_ms"), queue_wait_ms),
     )
-    state = {"raw_reply": "", "closing_code": None}
 
-    def paced_stream():
-        pending_text = ""
-        holdback = max(max_closing_code_length - 1, 0)
 
-        for delta in _iter_provider_reply_chunks(messages=messages):
-            state["raw_reply"] += delta
-            pending_text += delta
+def record_cached_opening_usage() -> None:
+    """Record a cached opening turn as chat turn 1 without tokens or latency samples.
 
-            while True:
-                closing_code = find_closing_code(pending_text, config.CLOSING_MESSAGES)
-                if not closing_code:
-                    break
+    Its cost is zero rather than unknown so the interview total stays priced.
+    """
+    entry = _usage_entry(
+        "chat",
+        provider,
+        model,
+        None,
+        turn=1,
+        recorded_at=time.strftime("%Y-%m-%d %H:%M:%S", time.localtime()),
+        reasoning_level=model_reasoning_level,
+        hedged=False,
+        queue_wait_ms=0.0,
+        cached_opening=True,
+    )
+    entry["cost_usd"] = 0.0
+    st.session_state.turn_usage.append(entry)
 
-                code_index = pending_text.find(closing_code)
-                visible_prefix = pending_text[:code_index]
-                if visible_prefix:
-                    yield from _iter_paced_text(visible_prefix)
-                pending_text = pending_text[code_index + len(closing_code):]
 
-            safe_length = max(len(pending_text) - holdback, 0)
-            if safe_length:
-                yield from _iter_paced_text(pending_text[:safe_length])
-                pending_text = pending_text[safe_length:]
+def stream_assistant_reply(message_placeholder, messages=None) -> tuple[str, str | None]:
+    """Stream the assistant response with Streamlit's native write_stream."""
+    state = {"closing_code": None}
+    usage_state = {}
+    timing = StreamTiming()
+    pacer = TypingPacer(enabled=getattr(config, "TYPING_PACING", True))
+    scanner = get_closing_code_matcher(config.CLOSING_MESSAGES).scanner()
+
+    def paced_stream():
+        for delta in _iter_provider_reply_chunks(
+            messages=messages, usage_state=usage_state
+        ):
+            timing.mark_delta(delta)
+            safe_text = scanner.feed(delta)
+            if safe_text:
+                yield from pacer.feed(safe_text)
 
-        parsed_reply = classify_assistant_reply(state["raw_reply"], config.CLOSING_MESSAGES)
+        remaining_text = scanner.finish()
+        parsed_reply = scanner.classification()
         if parsed_reply.kind == "code_only_close":
             state["closing_code"] = parsed_reply.closing_code
             return
 
-        if pending_text:
-            yield from _iter_paced_text(pending_text)
+        if remaining_text:
+            yield from pacer.feed(remaining_text)
 
-    with message_placeholder.container():
-        visible_reply = st.write_stream(paced_stream())
+    def timed_stream():
+        for chunk in paced_stream():
+            timing.mark_visible()
+            yield chunk
+
+    timing.start()
+    try:
+        with message_placeholder.container():
+            visible_reply = st.write_stream(timed_stream())
+    except StreamCancelledError as exc:
+        print(f"Provider stream cancelled for {st.session_state.session_id}: {exc}")
+        # Clearing the placeholder is a Streamlit call, so a pending rerun or
+        # stop is honoured here; otherwise nothing is left to do this run.
+        message_placeholder.empty()
+        st.stop()
+    timing.finish()
 
+    record_turn_usage(usage_state, timing)
     return visible_reply or "", state["closing_code"]
 
 
@@ -499,6 +945,11 @@ def persist_interview_checkpoint():
     timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
     duration_minutes = f"{(time.time() - st.session_state.start_time) / 60:.2f}"
     transcript_text = serialize_transcript(st.session_state.messages)
+    # turn_metrics rows hold per-turn timing, so only chat turns are checkpointed;
+    # context summaries reach the saved totals through interview_usage_totals.
+    chat_turns = [
+        entry for entry in st.session_state.turn_usage if entry["kind"] == "chat"
+    ]
     try:
         persist_checkpoint_remote(
             st.session_state.session_id,
@@ -509,7 +960,9 @@ def persist_interview_checkpoint():
             timestamp,
             transcript_text,
             duration_minutes,
+            turn_metrics=chat_turns[st.session_state.turn_metrics_saved:],
         )
+        st.session_state.turn_metrics_saved = len(chat_turns)
         st.session_state.checkpoint_error = ""
     except Exception as exc:
         st.session_state.checkpoint_error = str(exc)
@@ -520,50 +973,62 @@ def persist_interview_checkpoint():
     return transcript_link, transcript_file
 
 
-def generate_summary(transcript_text: str) -> str:
-    """Generate a concise summary of the completed interview."""
+
+def generate_summary(transcript_text: str):
+    """Generate a concise summary of the completed interview.
+
+    Long transcripts are summarized in parallel chunks and merged. Returns
+    ``(summary_text, usage)``. Runs on a summary-job worker, so it must not
+    touch session state. Provider errors and empty results raise, so the job
+    retries and ends ``failed`` instead of saving an empty summary.
+    """
     if not transcript_text.strip():
-        return "No transcript available."
+        raise ValueError("No transcript available to summarize.")
     if SMOKE_TEST_MODE:
-        return smoke_generate_summary(transcript_text)
+        return smoke_generate_summary(transcript_text), None
 
-    summary_prompt = (
-        "Please provide a concise but detailed summary for the following interview transcript:\n\n"
-        + transcript_text
+    summary_text, usage, _ = summarize_transcript(
+        transcript_text, _complete_summary_prompt
+    )
+    if not summary_text.strip():
+        raise ValueError("Summary generation returned no text.")
+    return summary_text, usage
+
+
+def _save_generated_summary(job: SummaryJob, summary_text: str, usage) -> None:
+    update_interview_summary(
+        job.interview_id,
+        summary_text,
+        interview_type=job.interview_type,
+        timestamp=job.timestamp,
+        usage=total_usage(
+            [_usage_entry("summary", provider, summary_selection.model, usage)]
+        )
+        if usage is not None
+        else None,
+        summary_model=summary_selection.model,
     )
 
-    if api == "openai":
-        if provider == "deepinfra":
-            summary_messages = [{"role": "user", "content": summary_prompt}]
-        else:
-            summary_messages = [
-                {
-                    "role": "system",
-                    "content": "You create concise but detailed summaries of interview transcripts.",
-                },
-                {"role": "user", "content": summary_prompt},
-            ]
-        try:
-            response = client.chat.completions.create(
-                model=model,
-                messages=summary_messages,
-                max_tokens=200,
-                temperature=0.7,
-                stream=False,
-            )
-        except NotFoundError:
-            return ""
-        return (response.choices[0].message.content or "").strip()
 
-    response = client.messages.create(
-        model=model,
-        system="You create concise but detailed summaries of interview transcripts.",
-        messages=[{"role": "user", "content": summary_prompt}],
-        max_tokens=200,
-        temperature=0.7,
+def _save_summary_status(job: SummaryJob, status: str, *, attempts=0, error="") -> None:
+    update_summary_status(
+        job.interview_id,
+        status,
+        attempts=attempts,
+        error=error,
+        interview_type=job.interview_type,
+        timestamp=job.timestamp,
+    )
+
+
+def schedule_summary(job: SummaryJob):
+    """Generate and store the interview summary on a background worker."""
+    return submit_summary_job(
+        job,
+        summarize=generate_summary,
+        save_summary=_save_generated_summary,
+        save_status=_save_summary_status,
     )
-    summary_text = extract_anthropic_text(response)
-    return summary_text or "Summary generation returned no text."
 
 
 def finalize_interview(send_email=False, email_input=None):
@@ -584,6 +1049,7 @@ def finalize_interview(send_email=False, email_input=None):
         completion_responses=completion_responses,
         model=model,
         model_reasoning_level=model_reasoning_level,
+        usage=interview_usage_totals(st.session_state.turn_usage),
     )
     completion_result = persist_completion(
         completion_context,
@@ -592,10 +1058,7 @@ def finalize_interview(send_email=False, email_input=None):
         persist_remote_completion=smoke_noop
         if SMOKE_TEST_MODE
         else persist_completion_remote,
-        generate_summary=generate_summary,
-        update_interview_summary=smoke_noop
-        if SMOKE_TEST_MODE
-        else update_interview_summary,
+        schedule_summary=smoke_noop if SMOKE_TEST_MODE else schedule_summary,
         record_email_delivery=smoke_noop
         if SMOKE_TEST_MODE
         else record_email_delivery_remote,
@@ -862,11 +1325,36 @@ if not st.session_state.messages:
         st.session_state.messages.append({"role": "system", "content": system_prompt})
         initial_messages = list(st.session_state.messages) + initial_messages
 
+    opening_key = None
+    if (
+        context_transcript is None
+        and not SMOKE_TEST_MODE
+        and getattr(config, "CACHE_OPENING_TURN", True)
+    ):
+        opening_key = opening_cache_key(
+            config_name, model, system_prompt, INITIAL_USER_PROMPT, model_reasoning_level
+        )
+    cached_opening = get_cached_opening(opening_key) if opening_key else None
+
     with st.chat_message("assistant", avatar=config.AVATAR_INTERVIEWER):
         placeholder = st.empty()
-        first_reply, closing_code = stream_assistant_reply(
-            placeholder, messages=initial_messages
-        )
+        if cached_opening is not None:
+            placeholder.markdown(cached_opening)
+            first_reply, closing_code = cached_opening, None
+            record_cached_opening_usage()
+        else:
+            first_reply, closing_code = stream_assistant_reply(
+                placeholder, messages=initial_messages
+            )
+            served = st.session_state.turn_usage[-1] if st.session_state.turn_usage else {}
+            # Only the primary model's reply is cached; a failover greeting
+            # would otherwise be served under the primary's key.
+            if (
+                opening_key
+                and not closing_code
+                and (served.get("provider"), served.get("model")) == (provider, model)
+            ):
+                store_opening(opening_key, first_reply)
 
     if closing_code:
         first_reply = config.CLOSING_MESSAGES[closing_code]
@@ -0,0 +1,504 @@
+import asyncio
+import queue
+import threading
+import time
+from contextlib import asynccontextmanager, closing
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Iterator
+
+import httpx
+from openai import NotFoundError
+
+from interview_context import estimate_tokens
+from interview_logic import extract_openai_stream_delta
+from interview_provider import (
+    PRECONNECT_TIMEOUT_SECONDS,
+    ProviderRuntime,
+    preconnect_target,
+)
+from interview_rate_limit import (
+    DEFAULT_RATE_LIMIT_RETRIES,
+    PRIORITY_INTERACTIVE,
+    estimate_request_tokens,
+    get_rate_limit_scheduler,
+)
+from interview_usage import extract_anthropic_usage, extract_openai_usage
+
+
+DEFAULT_PROVIDER_CONCURRENCY = 8
+DEFAULT_PROVIDER_QUEUE_TIMEOUT_SECONDS = 60.0
+CANCEL_POLL_SECONDS = 0.1
+
+_LOOP: asyncio.AbstractEventLoop | None = None
+_LOOP_LOCK = threading.Lock()
+_LIMITERS: dict[str, "ProviderLimiter"] = {}
+_LIMITERS_LOCK = threading.Lock()
+_CANCELLATIONS: dict[tuple, "CancellationStats"] = {}
+_CANCELLATIONS_LOCK = threading.Lock()
+_SCRIPT_STATE_WARNED = threading.Event()
+
+
+class ProviderBusyError(RuntimeError):
+    """Raised when a request waited longer than the queue timeout for a provider slot."""
+
+
+class StreamCancelledError(RuntimeError):
+    """Raised when a session's cancel token stopped its stream before the reply finished."""
+
+
+class CancelToken:
+    """Per-session flag that stops that session's in-flight provider streams.
+
+    ``should_cancel`` is polled as well, so a token can follow an outside
+    signal (such as Streamlit asking the script run to stop) without anyone
+    calling ``cancel``. Safe to check from any thread.
+    """
+
+    def __init__(self, should_cancel: Callable[[], bool] | None = None):
+        self._event = threading.Event()
+        self._should_cancel = should_cancel
+        self.reason = ""
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        if not self._event.is_set() and self._should_cancel is not None:
+            try:
+                if self._should_cancel():
+                    self.cancel("script run interrupted")
+            except Exception as exc:
+                print(f"Cancel check failed, no longer polling it: {exc}")
+                self._should_cancel = None
+        return self._event.is_set()
+
+
+def script_run_interrupted_check(ctx) -> Callable[[], bool]:
+    """Return a check that is True once Streamlit asks ``ctx``'s run to stop or rerun.
+
+    The script thread only sees those requests at its next Streamlit call,
+    which never comes while it waits on a provider stream, so this reads the
+    private ``ScriptRequests._state`` of the Streamlit version pinned in
+    requirements.txt. If that field is missing the check logs once and never
+    fires; tests/test_interview_async_provider.py covers the pinned version.
+    """
+
+    def interrupted() -> bool:
+        requests = getattr(ctx, "script_requests", None)
+        state = getattr(requests, "_state", None)
+        if state is None:
+            if not _SCRIPT_STATE_WARNED.is_set():
+                _SCRIPT_STATE_WARNED.set()
+                print(
+                    "Streamlit script run state is unavailable; provider streams "
+                    "will not be cancelled when a run is stopped or rerun."
+                )
+            return False
+        return state.name != "CONTINUE"
+
+    return interrupted
+
+
+@dataclass
+class CancellationStats:
+    """Streams stopped early, per provider and model.
+
+    ``cancelled`` and the token counts cover streams stopped by a session's
+    cancel token; ``closed_early`` counts streams their consumer closed for
+    any other reason, such as the losing attempt of a hedged turn.
+    """
+
+    provider: str
+    model: str
+    cancelled: int = 0
+    streamed_tokens: int = 0
+    saved_tokens: int = 0
+    closed_early: int = 0
+
+    def as_dict(self) -> dict:
+        return {
+            "provider": self.provider,
+            "model": self.model,
+            "cancelled": self.cancelled,
+            "streamed_tokens": self.streamed_tokens,
+            "saved_tokens": self.saved_tokens,
+            "closed_early": self.closed_early,
+        }
+
+
+@dataclass
+class LimiterStats:
+    provider: str
+    limit: int
+    in_flight: int = 0
+    waiting: int = 0
+    acquired: int = 0
+    timeouts: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    def as_dict(self) -> dict:
+        mean_wait = self.total_wait_seconds / self.acquired if self.acquired else 0.0
+        return {
+            "provider": self.provider,
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "acquired": self.acquired,
+            "timeouts": self.timeouts,
+            "mean_wait_ms": round(mean_wait * 1000, 2),
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 2),
+        }
+
+
+class ProviderLimiter:
+    """Cap concurrent upstream streams for one provider and record queue waits.
+
+    Only used on the shared event loop, so the counters need no lock.
+    """
+
+    def __init__(self, provider: str, limit: int, clock=time.monotonic):
+        self.stats = LimiterStats(provider=provider, limit=limit)
+        self._semaphore = asyncio.Semaphore(limit)
+        self._clock = clock
+
+    @asynccontextmanager
+    async def slot(self, timeout: float | None = None):
+        """Wait for a free slot; yields the seconds spent queued."""
+        started = self._clock()
+        self.stats.waiting += 1
+        try:
+            if self._semaphore.locked():
+                await asyncio.wait_for(self._semaphore.acquire(), timeout)
+            else:
+                # A free slot is taken even when the turn's queue budget is spent.
+                await self._semaphore.acquire()
+        except asyncio.TimeoutError:
+            self.stats.timeouts += 1
+            raise ProviderBusyError(
+                f"All {self.stats.limit} {self.stats.provider} request slots stayed busy "
+                f"for {timeout:.0f}s; please try again in a moment."
+            ) from None
+        finally:
+            self.stats.waiting -= 1
+
+        waited = self._clock() - started
+        self.stats.acquired += 1
+        self.stats.total_wait_seconds += waited
+        self.stats.max_wait_seconds = max(self.stats.max_wait_seconds, waited)
+        self.stats.in_flight += 1
+        try:
+            yield waited
+        finally:
+            self.stats.in_flight -= 1
+            self._semaphore.release()
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Return the process-wide provider event loop, starting its thread on first use."""
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None or _LOOP.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="provider-event-loop", daemon=True
+            ).start()
+            _LOOP = loop
+        return _LOOP
+
+
+def preconnect_async_client(client, timeout: float = PRECONNECT_TIMEOUT_SECONDS) -> bool:
+    """Open a pooled connection for an asyncio SDK client on the shared provider loop.
+
+    The async pool is bound to the loop that uses it, so the warm connection
+    must be opened there rather than on the calling thread.
+    """
+    http_client, url = preconnect_target(client)
+    if not isinstance(http_client, httpx.AsyncClient) or not url:
+        return False
+    asyncio.run_coroutine_threadsafe(
+        http_client.head(url, timeout=timeout), get_event_loop()
+    ).result(timeout + 1)
+    return True
+
+
+def resolve_concurrency_limit(secrets, provider: str) -> int:
+    """Return ``<PROVIDER>_MAX_CONCURRENCY``, else ``PROVIDER_MAX_CONCURRENCY``."""
+    raw_limit = secrets.get(
+        f"{provider.upper()}_MAX_CONCURRENCY",
+        secrets.get("PROVIDER_MAX_CONCURRENCY", DEFAULT_PROVIDER_CONCURRENCY),
+    )
+    return max(int(raw_limit), 1)
+
+
+def get_queue_timeout_seconds(secrets) -> float:
+    return float(
+        secrets.get(
+            "PROVIDER_QUEUE_TIMEOUT_SECONDS", DEFAULT_PROVIDER_QUEUE_TIMEOUT_SECONDS
+        )
+    )
+
+
+def get_limiter(provider: str, limit: int = DEFAULT_PROVIDER_CONCURRENCY) -> ProviderLimiter:
+    """Return the shared limiter for a provider; the first caller fixes its limit."""
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(provider)
+        if limiter is None:
+            limiter = ProviderLimiter(provider, limit)
+            _LIMITERS[provider] = limiter
+        return limiter
+
+
+def get_limiter_stats() -> list[dict]:
+    with _LIMITERS_LOCK:
+        return [limiter.stats.as_dict() for limiter in _LIMITERS.values()]
+
+
+def reset_limiters() -> None:
+    with _LIMITERS_LOCK:
+        _LIMITERS.clear()
+
+
+def _cancellation_stats(provider: str, model: str) -> CancellationStats:
+    stats = _CANCELLATIONS.get((provider, model))
+    if stats is None:
+        stats = CancellationStats(provider=provider, model=model)
+        _CANCELLATIONS[(provider, model)] = stats
+    return stats
+
+
+def record_cancellation(
+    provider: str, model: str, *, streamed_tokens: int, max_tokens: int
+) -> int:
+    """Count one stream stopped by its cancel token; returns the tokens it saved.
+
+    Saved tokens are the unused part of the request's output allowance, an
+    upper bound on what the provider would still have generated and billed.
+    """
+    saved_tokens = max(int(max_tokens or 0) - streamed_tokens, 0)
+    with _CANCELLATIONS_LOCK:
+        stats = _cancellation_stats(provider, model)
+        stats.cancelled += 1
+        stats.streamed_tokens += streamed_tokens
+        stats.saved_tokens += saved_tokens
+    return saved_tokens
+
+
+def record_early_close(provider: str, model: str) -> None:
+    """Count one stream its consumer closed without a cancel token, e.g. a hedge loser."""
+    with _CANCELLATIONS_LOCK:
+        _cancellation_stats(provider, model).closed_early += 1
+
+
+def get_cancellation_stats() -> list[dict]:
+    with _CANCELLATIONS_LOCK:
+        return [stats.as_dict() for _, stats in sorted(_CANCELLATIONS.items())]
+
+
+def reset_cancellation_stats() -> None:
+    with _CANCELLATIONS_LOCK:
+        _CANCELLATIONS.clear()
+
+
+async def astream_reply(
+    runtime: ProviderRuntime, request_kwargs: dict, usage_state: dict
+) -> AsyncIterator[str]:
+    """Yield response text from one provider using its asyncio client."""
+    client = runtime.async_client
+    if runtime.api == "openai":
+        try:
+            stream = await client.chat.completions.create(**request_kwargs)
+        except NotFoundError as e:
+            raise RuntimeError(
+                "Model not available on OpenRouter. Check privacy settings at "
+                "https://openrouter.ai/settings/privacy and verify the configured model ID.\n\n"
+                f"Original error: {e}"
+            ) from e
+        response = getattr(stream, "response", None)
+        if response is not None:
+            usage_state["response_headers"] = response.headers
+        try:
+            async for chunk in stream:
+                usage = getattr(chunk, "usage", None)
+                if usage is not None:
+                    usage_state["usage"] = extract_openai_usage(usage)
+                delta = extract_openai_stream_delta(chunk)
+                if delta:
+                    yield delta
+        finally:
+            await stream.close()
+        return
+
+    async with client.messages.stream(**request_kwargs) as stream:
+        response = getattr(stream, "response", None)
+        if response is not None:
+            usage_state["response_headers"] = response.headers
+        async for delta in stream.text_stream:
+            if delta:
+                yield delta
+        final_message = await stream.get_final_message()
+        usage_state["usage"] = extract_anthropic_usage(
+            getattr(final_message, "usage", None)
+        )
+
+
+def iter_async_stream(
+    stream_factory: Callable[[], AsyncIterator[str]],
+    *,
+    limiter: ProviderLimiter,
+    queue_timeout: float | None = DEFAULT_PROVIDER_QUEUE_TIMEOUT_SECONDS,
+    usage_state: dict | None = None,
+    cancel_token: CancelToken | None = None,
+    stop_event: threading.Event | None = None,
+) -> Iterator[str]:
+    """Bridge an async provider stream to a plain iterator for the script thread.
+
+    The stream runs on the shared loop once the limiter grants a slot.
+    Closing this iterator cancels the task, which closes the upstream stream.
+    ``cancel_token`` and ``stop_event`` are checked between chunks and every
+    ``CANCEL_POLL_SECONDS`` while waiting, and raise
+    ``StreamCancelledError`` once set. ``stop_event`` lets another thread
+    end a stream it cannot close, such as a losing hedged attempt.
+    """
+    chunks: queue.Queue = queue.Queue()
+    usage_state = usage_state if usage_state is not None else {}
+
+    def stop_requested() -> str | None:
+        if cancel_token is not None and cancel_token.cancelled:
+            return cancel_token.reason
+        if stop_event is not None and stop_event.is_set():
+            return "stream no longer needed"
+        return None
+
+    reason = stop_requested()
+    if reason is not None:
+        raise StreamCancelledError(reason)
+
+    async def pump():
+        try:
+            async with limiter.slot(queue_timeout) as waited:
+                usage_state["queue_wait_seconds"] = (
+                    usage_state.get("rate_limit_wait_seconds", 0.0) + waited
+                )
+                async for chunk in stream_factory():
+                    chunks.put(("chunk", chunk))
+            chunks.put(("done", None))
+        except asyncio.CancelledError:
+            chunks.put(("done", None))
+            raise
+        except Exception as exc:
+            chunks.put(("error", exc))
+
+    future = asyncio.run_coroutine_threadsafe(pump(), get_event_loop())
+    poll_seconds = (
+        CANCEL_POLL_SECONDS
+        if cancel_token is not None or stop_event is not None
+        else None
+    )
+    try:
+        while True:
+            try:
+                kind, payload = chunks.get(timeout=poll_seconds)
+            except queue.Empty:
+                kind, payload = "poll", None
+            reason = stop_requested()
+            if reason is not None:
+                raise StreamCancelledError(reason)
+            if kind == "chunk":
+                yield payload
+            elif kind == "done":
+                return
+            elif kind == "error":
+                raise payload
+    finally:
+        future.cancel()
+
+
+def stream_reply(
+    runtime: ProviderRuntime,
+    request_kwargs: dict,
+    usage_state: dict,
+    *,
+    concurrency_limit: int = DEFAULT_PROVIDER_CONCURRENCY,
+    queue_timeout: float | None = DEFAULT_PROVIDER_QUEUE_TIMEOUT_SECONDS,
+    priority: int = PRIORITY_INTERACTIVE,
+    rate_limit_retries: int = DEFAULT_RATE_LIMIT_RETRIES,
+    cancel_token: CancelToken | None = None,
+    stop_event: threading.Event | None = None,
+) -> Iterator[str]:
+    """Stream one provider reply through the rate-limit scheduler and concurrency limiter.
+
+    A 429 before the first chunk pauses the provider/model for its
+    ``Retry-After`` and requeues the request, up to ``rate_limit_retries``
+    times; rate-limit headers of successful responses update the budget.
+    A stream stopped by ``cancel_token`` is counted as cancelled and flagged
+    in ``usage_state``; closing this iterator or setting ``stop_event``
+    counts as an early close, so hedging is not mistaken for abandoned turns.
+    """
+    scheduler = get_rate_limit_scheduler()
+    model = request_kwargs.get("model", runtime.model_selection.model)
+    estimated_tokens = estimate_request_tokens(request_kwargs)
+    usage_state["rate_limit_wait_seconds"] = 0.0
+
+    def remaining_timeout() -> float | None:
+        # One queue_timeout covers every rate-limit and concurrency wait of the turn.
+        if queue_timeout is None:
+            return None
+        return max(queue_timeout - usage_state["rate_limit_wait_seconds"], 0.0)
+
+    for attempt in range(rate_limit_retries + 1):
+        usage_state["rate_limit_wait_seconds"] += scheduler.acquire(
+            runtime.provider,
+            model,
+            tokens=estimated_tokens,
+            priority=priority,
+            timeout=remaining_timeout(),
+        )
+        streamed_text = []
+        try:
+            with closing(
+                iter_async_stream(
+                    lambda: astream_reply(runtime, request_kwargs, usage_state),
+                    limiter=get_limiter(runtime.provider, concurrency_limit),
+                    queue_timeout=remaining_timeout(),
+                    usage_state=usage_state,
+                    cancel_token=cancel_token,
+                    stop_event=stop_event,
+                )
+            ) as chunks:
+                for chunk in chunks:
+                    streamed_text.append(chunk)
+                    yield chunk
+        except (GeneratorExit, StreamCancelledError):
+            if cancel_token is not None and cancel_token.cancelled:
+                usage_state["cancelled"] = True
+                usage_state["saved_tokens"] = record_cancellation(
+                    runtime.provider,
+                    model,
+                    streamed_tokens=estimate_tokens("".join(streamed_text)),
+                    max_tokens=request_kwargs.get("max_tokens") or 0,
+                )
+            else:
+                record_early_close(runtime.provider, model)
+            raise
+        except Exception as exc:
+            rate_limited = scheduler.handle_error(runtime.provider, model, exc)
+            if streamed_text or not rate_limited or attempt == rate_limit_retries:
+                raise
+            continue
+        finally:
+            headers = usage_state.pop("response_headers", None)
+            if headers is not None:
+                scheduler.update_from_headers(runtime.provider, model, headers)
+        usage = usage_state.get("usage")
+        if usage is not None:
+            scheduler.record_usage(
+                runtime.provider,
+                model,
+                estimated_tokens=estimated_tokens,
+                actual_tokens=usage.input_tokens + usage.output_tokens,
+            )
+        return
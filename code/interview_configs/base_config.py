@@ -66,6 +66,15 @@ def build_system_prompt(interview_outline):
 # API parameters (defaults that can be overridden)
 TEMPERATURE = None  # (None for default value)
 MAX_OUTPUT_TOKENS = 1024
+# Input tokens sent per turn before older turns are replaced by a rolling
+# summary (None sends the full history)
+CONTEXT_TOKEN_BUDGET = 8000
+# Reveal replies at a typing pace that catches up with the provider; set to
+# False to show text as soon as it arrives
+TYPING_PACING = True
+# Reuse the first generated opening turn for sessions without a prior-interview
+# context; set to False for configs whose greeting should vary per session
+CACHE_OPENING_TURN = True
 
 # Display login screen with usernames and simple passwords for studies
 LOGINS = False
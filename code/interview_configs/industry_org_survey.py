@@ -13,6 +13,9 @@ from base_config import (
     build_system_prompt,
     TEMPERATURE,
     MAX_OUTPUT_TOKENS,
+    CONTEXT_TOKEN_BUDGET,
+    TYPING_PACING,
+    CACHE_OPENING_TURN,
     LOGINS,
     TRANSCRIPTS_DIRECTORY,
     TIMES_DIRECTORY,
@@ -0,0 +1,169 @@
+import importlib.util
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable
+
+
+DEFAULT_MIN_RECENT_MESSAGES = 6
+MESSAGE_OVERHEAD_TOKENS = 4
+CHARACTERS_PER_TOKEN = 4
+CONTEXT_SUMMARY_MAX_TOKENS = 500
+CONTEXT_SUMMARY_HEADER = "Summary of the earlier part of this interview:\n\n"
+ROLLING_SUMMARY_INSTRUCTIONS = (
+    "You maintain a running summary of an ongoing interview so the interviewer "
+    "can continue without the full transcript. Keep every topic already covered, "
+    "the respondent's concrete examples and stated views, and which outline "
+    "sections are finished. Write plain prose, no more than a few paragraphs."
+)
+
+# Module-level so it survives Streamlit reruns; the script itself is
+# re-executed on every interaction but imported modules are not.
+_SUMMARY_EXECUTOR = ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="context-summary"
+)
+
+
+@dataclass(frozen=True)
+class ContextWindow:
+    """Messages to send this turn, plus whether the rolling summary lags behind."""
+
+    messages: list[dict]
+    token_count: int
+    summary_through: int = 0
+    pending_summary_through: int | None = None
+
+
+@lru_cache(maxsize=1)
+def _load_encoding():
+    if importlib.util.find_spec("tiktoken") is None:
+        return None
+    try:
+        import tiktoken  # noqa: E402
+
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def estimate_tokens(text: str) -> int:
+    """Count tokens with tiktoken when available, else a characters-per-token estimate."""
+    if not text:
+        return 0
+    encoding = _load_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    return -(-len(text) // CHARACTERS_PER_TOKEN)
+
+
+def message_tokens(message: dict | None) -> int:
+    if not message:
+        return 0
+    content = message.get("content", "")
+    if isinstance(content, list):
+        content = "".join(
+            block.get("text", "") if isinstance(block, dict) else "" for block in content
+        )
+    return MESSAGE_OVERHEAD_TOKENS + estimate_tokens(str(content))
+
+
+def _recent_start(conversation: list[dict], budget: int, min_recent: int) -> int:
+    """Return the index where the newest messages that fit in ``budget`` begin."""
+    start = len(conversation)
+    used = 0
+    while start > 0:
+        cost = message_tokens(conversation[start - 1])
+        if used + cost > budget and len(conversation) - start >= min_recent:
+            break
+        used += cost
+        start -= 1
+    return start
+
+
+def build_context_window(
+    messages: list[dict],
+    *,
+    token_budget: int | None,
+    summary: str = "",
+    summary_through: int = 0,
+    min_recent_messages: int = DEFAULT_MIN_RECENT_MESSAGES,
+) -> ContextWindow:
+    """Keep system messages and recent turns verbatim; older turns come from the summary.
+
+    ``summary_through`` counts the non-system messages the summary already
+    covers. Turns that have fallen out of the budget but are not yet
+    summarized are still sent verbatim, and ``pending_summary_through``
+    tells the caller how far the background summary should advance.
+    """
+    system_messages = [message for message in messages if message["role"] == "system"]
+    conversation = [message for message in messages if message["role"] != "system"]
+    summary_through = min(summary_through, len(conversation)) if summary else 0
+
+    if not token_budget or token_budget <= 0:
+        return ContextWindow(
+            messages=list(messages),
+            token_count=sum(message_tokens(message) for message in messages),
+        )
+
+    summary_message = (
+        {"role": "system", "content": f"{CONTEXT_SUMMARY_HEADER}{summary}"}
+        if summary_through
+        else None
+    )
+    fixed_tokens = sum(message_tokens(message) for message in system_messages)
+    fixed_tokens += message_tokens(summary_message)
+    available = max(token_budget - fixed_tokens, 0)
+
+    pending_summary_through = None
+    if _recent_start(conversation, available, min_recent_messages) > summary_through:
+        # Summarize down to half the budget so the job does not rerun every turn.
+        target = _recent_start(conversation, available // 2, min_recent_messages)
+        pending_summary_through = max(target, summary_through + 1)
+
+    window_messages = list(system_messages)
+    if summary_message:
+        window_messages.append(summary_message)
+    window_messages.extend(conversation[summary_through:])
+    return ContextWindow(
+        messages=window_messages,
+        token_count=sum(message_tokens(message) for message in window_messages),
+        summary_through=summary_through,
+        pending_summary_through=pending_summary_through,
+    )
+
+
+def build_rolling_summary_prompt(previous_summary: str, messages: list[dict]) -> str:
+    """Return the prompt that folds newly aged-out turns into the running summary."""
+    transcript = "".join(
+        f"{message['role']}: {message['content']}\n" for message in messages
+    )
+    parts = []
+    if previous_summary:
+        parts.append(f"Summary so far:\n\n{previous_summary}")
+    parts.append(f"New interview turns to fold in:\n\n{transcript}")
+    parts.append("Return the updated summary only.")
+    return "\n\n".join(parts)
+
+
+def submit_rolling_summary(
+    summarize_fn: Callable[[str], tuple],
+    previous_summary: str,
+    conversation: list[dict],
+    summary_through: int,
+    target_through: int,
+) -> Future:
+    """Summarize ``conversation[summary_through:target_through]`` off the request path.
+
+    ``summarize_fn(prompt)`` returns ``(text, usage)``; the future resolves
+    to ``(summary, target_through, usage)``.
+    """
+    prompt = build_rolling_summary_prompt(
+        previous_summary, conversation[summary_through:target_through]
+    )
+
+    def run():
+        text, usage = summarize_fn(prompt)
+        return (text or "").strip(), target_through, usage
+
+    return _SUMMARY_EXECUTOR.submit(run)
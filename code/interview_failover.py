@@ -0,0 +1,220 @@
+import queue
+import threading
+import time
+from collections import ChainMap
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Iterator
+
+from interview_async_provider import StreamCancelledError
+from interview_provider import ProviderRuntime, create_provider_runtime
+
+
+DEFAULT_FAILOVER_TTFT_SECONDS = 6.0
+DEFAULT_FAILOVER_TIMEOUT_SECONDS = 60.0
+FAILOVER_PROVIDERS = ("openai", "deepinfra", "openrouter", "anthropic")
+PROVIDER_API_KEY_SECRETS = {
+    "openai": "API_KEY",
+    "deepinfra": "DEEPINFRA_API_KEY",
+    "openrouter": "OPENROUTER_API_KEY",
+    "anthropic": "ANTHROPIC_API_KEY",
+}
+
+
+class FailoverTimeoutError(RuntimeError):
+    """Raised when no hedged attempt produces a token before the overall deadline."""
+
+
+@dataclass
+class HedgeOutcome:
+    """Which attempt served a hedged turn, filled in while the stream runs."""
+
+    attempted: list[str] = field(default_factory=list)
+    served_by: str | None = None
+    served_index: int | None = None
+
+    @property
+    def hedged(self) -> bool:
+        return len(self.attempted) > 1
+
+
+def parse_failover_chain(raw_chain, primary_provider: str) -> list[str]:
+    """Return the primary provider followed by the configured fallbacks, de-duplicated."""
+    if isinstance(raw_chain, str):
+        entries = raw_chain.split(",")
+    else:
+        entries = list(raw_chain or [])
+
+    chain = [primary_provider]
+    for entry in entries:
+        name = str(entry).strip().lower()
+        if not name or name in chain:
+            continue
+        if name not in FAILOVER_PROVIDERS:
+            raise ValueError(
+                f"Unrecognized provider {name!r} in PROVIDER_FAILOVER_CHAIN."
+            )
+        chain.append(name)
+    return chain
+
+
+def get_failover_ttft_seconds(secrets) -> float:
+    return float(secrets.get("FAILOVER_TTFT_SECONDS", DEFAULT_FAILOVER_TTFT_SECONDS))
+
+
+def get_failover_timeout_seconds(secrets) -> float:
+    return float(
+        secrets.get("FAILOVER_TIMEOUT_SECONDS", DEFAULT_FAILOVER_TIMEOUT_SECONDS)
+    )
+
+
+def create_failover_runtimes(
+    secrets,
+    config_name: str,
+    default_max_tokens: int,
+    primary: ProviderRuntime,
+) -> list[ProviderRuntime]:
+    """Build runtimes for the primary provider and every usable fallback.
+
+    Fallbacks whose API key is not configured are skipped. A fallback may pin
+    its own model with ``<PROVIDER>_MODEL`` (e.g. ``DEEPINFRA_MODEL``);
+    otherwise it uses ``MODEL``.
+    """
+    runtimes = [primary]
+    for provider in parse_failover_chain(
+        secrets.get("PROVIDER_FAILOVER_CHAIN", ""), primary.provider
+    )[1:]:
+        if not secrets.get(PROVIDER_API_KEY_SECRETS[provider]):
+            continue
+        overrides = {"API_PROVIDER": provider}
+        provider_model = secrets.get(f"{provider.upper()}_MODEL")
+        if provider_model:
+            overrides["MODEL"] = provider_model
+        runtimes.append(
+            create_provider_runtime(
+                ChainMap(overrides, secrets), config_name, default_max_tokens
+            )
+        )
+    return runtimes
+
+
+def _pump_attempt(
+    index: int,
+    start_fn: Callable[[threading.Event], Iterable[str]],
+    events: queue.Queue,
+    cancel: threading.Event,
+) -> None:
+    source = None
+    try:
+        source = start_fn(cancel)
+        for chunk in source:
+            if cancel.is_set():
+                break
+            events.put((index, "chunk", chunk))
+        else:
+            events.put((index, "done", None))
+    except Exception as exc:
+        events.put((index, "error", exc))
+    finally:
+        close = getattr(source, "close", None)
+        if callable(close):
+            close()
+
+
+def hedged_stream(
+    attempts: list[tuple[str, Callable[[threading.Event], Iterable[str]]]],
+    *,
+    ttft_deadline_seconds: float,
+    timeout_seconds: float | None = None,
+    outcome: HedgeOutcome | None = None,
+    clock=time.monotonic,
+) -> Iterator[str]:
+    """Yield chunks from whichever attempt produces a token first.
+
+    Attempts start one at a time: the next is launched when the current ones
+    have produced nothing within ``ttft_deadline_seconds`` or have failed.
+    Each ``start_fn`` receives its attempt's cancel event and must stop its
+    stream, even before the first chunk, once the event is set; the others
+    are cancelled as soon as one attempt yields its first chunk. When no
+    attempt has produced a token within ``timeout_seconds``, every attempt
+    is cancelled and ``FailoverTimeoutError`` is raised.
+    """
+    if not attempts:
+        raise ValueError("hedged_stream needs at least one attempt.")
+
+    outcome = outcome if outcome is not None else HedgeOutcome()
+    events: queue.Queue = queue.Queue()
+    cancels: list[threading.Event] = []
+    errors: list[Exception] = []
+
+    def start_next() -> float:
+        index = len(cancels)
+        name, start_fn = attempts[index]
+        cancel = threading.Event()
+        cancels.append(cancel)
+        outcome.attempted.append(name)
+        threading.Thread(
+            target=_pump_attempt,
+            args=(index, start_fn, events, cancel),
+            name=f"hedge-{name}",
+            daemon=True,
+        ).start()
+        return clock() + ttft_deadline_seconds
+
+    def cancel_all(except_index=None) -> None:
+        for index, cancel in enumerate(cancels):
+            if index != except_index:
+                cancel.set()
+
+    overall_deadline = clock() + timeout_seconds if timeout_seconds else None
+    deadline = start_next()
+    winner = None
+    try:
+        while winner is None:
+            waits = []
+            if len(cancels) < len(attempts):
+                waits.append(deadline - clock())
+            if overall_deadline is not None:
+                waits.append(overall_deadline - clock())
+            timeout = max(min(waits), 0) if waits else None
+            try:
+                index, kind, payload = events.get(timeout=timeout)
+            except queue.Empty:
+                if overall_deadline is not None and clock() >= overall_deadline:
+                    raise FailoverTimeoutError(
+                        f"No provider produced a token within {timeout_seconds:g}s "
+                        f"(tried {', '.join(outcome.attempted)})."
+                    )
+                deadline = start_next()
+                continue
+
+            if kind == "error":
+                # A cancelled session wants no reply at all, not a fallback.
+                if isinstance(payload, StreamCancelledError):
+                    raise payload
+                errors.append(payload)
+                if len(cancels) < len(attempts):
+                    deadline = start_next()
+                elif len(errors) == len(cancels):
+                    raise errors[0]
+                continue
+
+            winner = index
+            outcome.served_by = attempts[index][0]
+            outcome.served_index = index
+            cancel_all(except_index=index)
+            if kind == "done":
+                return
+            yield payload
+
+        while True:
+            index, kind, payload = events.get()
+            if index != winner:
+                continue
+            if kind == "chunk":
+                yield payload
+            elif kind == "done":
+                return
+            else:
+                raise payload
+    finally:
+        cancel_all()
@@ -1,4 +1,6 @@
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 
 
 @dataclass(frozen=True)
@@ -32,14 +34,18 @@ def missing_query_params(params, required_keys):
 
 
 def compose_system_prompt(base_prompt: str, context_transcript: str | None = None) -> str:
-    """Compose the system prompt from config plus optional prior context."""
+    """Compose the system prompt from config plus optional prior context.
+
+    The static config prompt comes first so providers can reuse a cached
+    prefix across students; the per-student context follows it.
+    """
     if not context_transcript:
         return base_prompt
 
     return (
+        f"{base_prompt}\n\n"
         "Context Transcript Summary (provided as context for the interview):\n\n"
-        f"{context_transcript}\n\n"
-        f"{base_prompt}"
+        f"{context_transcript}"
     )
 
 
@@ -81,48 +87,176 @@ def serialize_transcript(messages) -> str:
     )
 
 
-def find_closing_code(message_text: str, closing_messages) -> str | None:
-    """Return the first configured closing code found in a message."""
-    for code in closing_messages:
-        if code in message_text:
-            return code
-    return None
+class ClosingCodeMatcher:
+    """Aho-Corasick automaton over the configured closing codes.
+
+    Built once per set of codes; ``scanner()`` returns a fresh streaming
+    scanner that shares the automaton.
+    """
+
+    def __init__(self, codes):
+        self.codes = tuple(code for code in codes if code)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail = [0]
+        self._match: list[str | None] = [None]
+        self.depth = [0]
+        for code in self.codes:
+            state = 0
+            for character in code:
+                if character not in self._goto[state]:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._match.append(None)
+                    self.depth.append(self.depth[state] + 1)
+                    self._goto[state][character] = len(self._goto) - 1
+                state = self._goto[state][character]
+            self._match[state] = code
+
+        first_characters = "".join(re.escape(character) for character in self._goto[0])
+        self._first_characters = (
+            re.compile(f"[{first_characters}]") if first_characters else None
+        )
 
+        # Breadth-first so every failure target is finished before it is used.
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for character, child in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and character not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(character, 0)
+                self._fail[child] = target if target != child else 0
+                if self._match[child] is None:
+                    self._match[child] = self._match[self._fail[child]]
+                queue.append(child)
+
+    @property
+    def max_holdback(self) -> int:
+        return max((len(code) - 1 for code in self.codes), default=0)
+
+    def next_code_start(self, text: str, start: int) -> int:
+        """Return the index of the next character that begins some code."""
+        if self._first_characters is None:
+            return len(text)
+        found = self._first_characters.search(text, start)
+        return found.start() if found else len(text)
+
+    def step(self, state: int, character: str) -> int:
+        while state and character not in self._goto[state]:
+            state = self._fail[state]
+        return self._goto[state].get(character, 0)
+
+    def match(self, state: int) -> str | None:
+        """Return the longest code that ends at ``state``, if any."""
+        return self._match[state]
+
+    def scanner(self) -> "ClosingCodeScanner":
+        return ClosingCodeScanner(self)
+
+
+class ClosingCodeScanner:
+    """Strip closing codes from a reply as it streams in.
+
+    ``feed`` returns the text that can no longer be part of a code. Only the
+    characters that still match the start of some code are held back, so the
+    holdback never exceeds the longest code minus one character.
+    """
+
+    def __init__(self, matcher: ClosingCodeMatcher):
+        self.matcher = matcher
+        self.codes: list[str] = []
+        self._state = 0
+        self._pending = ""
+        self._visible_parts: list[str] = []
+
+    def feed(self, delta: str) -> str:
+        released = []
+        index = 0
+        while index < len(delta):
+            if self._state == 0:
+                # Nothing is held back at the root, so jump straight to the
+                # next character that could start a code.
+                start = self.matcher.next_code_start(delta, index)
+                released.append(delta[index:start])
+                index = start
+                if index == len(delta):
+                    break
+
+            character = delta[index]
+            index += 1
+            self._pending += character
+            self._state = self.matcher.step(self._state, character)
+            code = self.matcher.match(self._state)
+            if code:
+                self.codes.append(code)
+                released.append(self._pending[: -len(code)])
+                self._pending = ""
+                self._state = 0
+                continue
+            keep = self.matcher.depth[self._state]
+            if len(self._pending) > keep:
+                cut = len(self._pending) - keep
+                released.append(self._pending[:cut])
+                self._pending = self._pending[cut:]
+        text = "".join(released)
+        if text:
+            self._visible_parts.append(text)
+        return text
 
-def classify_assistant_reply(
-    message_text: str, closing_messages
-) -> AssistantReplyClassification:
-    """Classify assistant text as a code-only close, mixed content, or normal text."""
-    text = message_text or ""
-    stripped_text = text.strip()
+    def finish(self) -> str:
+        """Release whatever was held back once the reply is complete."""
+        text, self._pending, self._state = self._pending, "", 0
+        if text:
+            self._visible_parts.append(text)
+        return text
 
-    for code in closing_messages:
-        if stripped_text == code:
+    def classification(self) -> AssistantReplyClassification:
+        """Classify the finished reply from what the scanner has seen."""
+        visible_text = "".join(self._visible_parts)
+        if not self.codes:
             return AssistantReplyClassification(
-                kind="code_only_close",
-                visible_text="",
-                closing_code=code,
+                kind="normal_text", visible_text=visible_text, closing_code=None
             )
 
-    visible_text = text
-    closing_code = None
-    for code in closing_messages:
-        if code in visible_text:
-            closing_code = closing_code or code
-            visible_text = visible_text.replace(code, "")
-
-    if closing_code:
+        visible_text = visible_text.strip()
+        closing_code = min(self.codes, key=self.matcher.codes.index)
+        if len(self.codes) == 1 and not visible_text:
+            return AssistantReplyClassification(
+                kind="code_only_close", visible_text="", closing_code=closing_code
+            )
         return AssistantReplyClassification(
             kind="mixed_content_with_code",
-            visible_text=visible_text.strip(),
+            visible_text=visible_text,
             closing_code=closing_code,
         )
 
-    return AssistantReplyClassification(
-        kind="normal_text",
-        visible_text=text,
-        closing_code=None,
-    )
+
+@lru_cache(maxsize=16)
+def _cached_closing_code_matcher(codes: tuple) -> ClosingCodeMatcher:
+    return ClosingCodeMatcher(codes)
+
+
+def get_closing_code_matcher(closing_messages) -> ClosingCodeMatcher:
+    """Return the shared matcher for a config's ``CLOSING_MESSAGES`` codes."""
+    return _cached_closing_code_matcher(tuple(closing_messages))
+
+
+def find_closing_code(message_text: str, closing_messages) -> str | None:
+    """Return the first configured closing code found in a message."""
+    scanner = get_closing_code_matcher(closing_messages).scanner()
+    scanner.feed(message_text or "")
+    return scanner.classification().closing_code
+
+
+def classify_assistant_reply(
+    message_text: str, closing_messages
+) -> AssistantReplyClassification:
+    """Classify assistant text as a code-only close, mixed content, or normal text."""
+    text = message_text or ""
+    scanner = get_closing_code_matcher(closing_messages).scanner()
+    scanner.feed(text)
+    scanner.finish()
+    return scanner.classification()
 
 
 def filter_display_messages(messages, closing_messages):
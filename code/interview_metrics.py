@@ -0,0 +1,203 @@
+import bisect
+import threading
+import time
+from dataclasses import dataclass, field
+
+from interview_context import CHARACTERS_PER_TOKEN
+
+
+LATENCY_BUCKETS_MS = (
+    50, 100, 250, 500, 750, 1000, 1500, 2000, 3000, 5000, 7500, 10000, 15000, 30000, 60000,
+)
+THROUGHPUT_BUCKETS = (5, 10, 20, 40, 60, 80, 120, 160, 240, 320, 500)
+
+# Metric name -> histogram bucket upper bounds. Only these keys of a turn's
+# timing are observed; the rest are stored with the turn but not aggregated.
+TURN_METRIC_BUCKETS = {
+    "queue_wait_ms": LATENCY_BUCKETS_MS,
+    "ttft_ms": LATENCY_BUCKETS_MS,
+    "first_visible_ms": LATENCY_BUCKETS_MS,
+    "holdback_ms": LATENCY_BUCKETS_MS,
+    "stream_ms": LATENCY_BUCKETS_MS,
+    "render_ms": LATENCY_BUCKETS_MS,
+    "pacing_ms": LATENCY_BUCKETS_MS,
+    "output_tokens_per_second": THROUGHPUT_BUCKETS,
+}
+
+# Module-level so histograms aggregate across Streamlit reruns and sessions.
+_HISTOGRAMS: dict[tuple, "Histogram"] = {}
+_HISTOGRAMS_LOCK = threading.Lock()
+
+
+def _elapsed_ms(start: float | None, end: float | None) -> float | None:
+    if start is None or end is None:
+        return None
+    return round((end - start) * 1000, 2)
+
+
+@dataclass
+class StreamTiming:
+    """Timestamps for one streamed turn, from request start to the end of rendering.
+
+    ``ttft_ms``/``stream_ms`` describe the provider; ``holdback_ms`` and
+    ``pacing_ms`` are time spent in our own closing-code holdback and typing
+    pacing, so slow turns can be attributed to one side or the other.
+    """
+
+    clock: object = time.monotonic
+    started: float | None = None
+    first_delta: float | None = None
+    first_visible: float | None = None
+    last_delta: float | None = None
+    finished: float | None = None
+    delta_count: int = 0
+    output_chars: int = 0
+
+    def start(self) -> None:
+        self.started = self.clock()
+
+    def mark_delta(self, text: str) -> None:
+        now = self.clock()
+        if self.first_delta is None:
+            self.first_delta = now
+        self.last_delta = now
+        self.delta_count += 1
+        self.output_chars += len(text)
+
+    def mark_visible(self) -> None:
+        if self.first_visible is None:
+            self.first_visible = self.clock()
+
+    def finish(self) -> None:
+        self.finished = self.clock()
+
+    def as_dict(self, output_tokens: int | None = None) -> dict:
+        """Return the turn's latency breakdown in milliseconds plus output throughput.
+
+        ``output_tokens`` comes from the provider's usage report; without it
+        the token count is estimated from the streamed characters.
+        """
+        if not output_tokens:
+            output_tokens = -(-self.output_chars // CHARACTERS_PER_TOKEN)
+        generation_seconds = (
+            self.last_delta - self.first_delta
+            if self.first_delta is not None and self.last_delta is not None
+            else 0.0
+        )
+        return {
+            "ttft_ms": _elapsed_ms(self.started, self.first_delta),
+            "first_visible_ms": _elapsed_ms(self.started, self.first_visible),
+            "holdback_ms": _elapsed_ms(self.first_delta, self.first_visible),
+            "stream_ms": _elapsed_ms(self.started, self.last_delta),
+            "render_ms": _elapsed_ms(self.started, self.finished),
+            "pacing_ms": _elapsed_ms(self.last_delta, self.finished),
+            "output_chars": self.output_chars,
+            "output_tokens_per_second": (
+                round(output_tokens / generation_seconds, 2)
+                if generation_seconds > 0
+                else None
+            ),
+        }
+
+
+@dataclass
+class Histogram:
+    """Fixed-bucket histogram; ``counts[i]`` holds values up to ``bounds[i]``."""
+
+    bounds: tuple
+    counts: list[int] = field(default_factory=list)
+    count: int = 0
+    total: float = 0.0
+    maximum: float = 0.0
+
+    def __post_init__(self):
+        if not self.counts:
+            self.counts = [0] * (len(self.bounds) + 1)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.maximum = max(self.maximum, value)
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate a quantile by interpolating inside the bucket that holds it."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = self.bounds[index - 1] if index else 0.0
+                upper = self.bounds[index] if index < len(self.bounds) else self.maximum
+                fraction = (rank - seen) / bucket_count
+                return round(min(lower + (upper - lower) * fraction, self.maximum), 2)
+            seen += bucket_count
+        return self.maximum
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 2) if self.count else None,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "max": round(self.maximum, 2) if self.count else None,
+        }
+
+
+def _histogram_key(name: str, provider: str, model: str, reasoning_level: str) -> tuple:
+    return (name, provider or "", model or "", reasoning_level or "none")
+
+
+def observe(name: str, value: float, *, provider: str, model: str, reasoning_level: str) -> None:
+    bounds = TURN_METRIC_BUCKETS[name]
+    key = _histogram_key(name, provider, model, reasoning_level)
+    with _HISTOGRAMS_LOCK:
+        histogram = _HISTOGRAMS.get(key)
+        if histogram is None:
+            histogram = Histogram(bounds=bounds)
+            _HISTOGRAMS[key] = histogram
+        histogram.observe(value)
+
+
+def record_turn_metrics(metrics: dict, *, provider: str, model: str, reasoning_level: str) -> None:
+    """Add every histogram-backed value of one turn's metrics to the registry."""
+    for name in TURN_METRIC_BUCKETS:
+        value = metrics.get(name)
+        if value is not None:
+            observe(
+                name,
+                value,
+                provider=provider,
+                model=model,
+                reasoning_level=reasoning_level,
+            )
+
+
+def get_histogram(
+    name: str, *, provider: str, model: str, reasoning_level: str
+) -> Histogram | None:
+    with _HISTOGRAMS_LOCK:
+        return _HISTOGRAMS.get(_histogram_key(name, provider, model, reasoning_level))
+
+
+def get_metrics_snapshot() -> list[dict]:
+    """Return one row per (metric, provider, model, reasoning level) with its quantiles."""
+    with _HISTOGRAMS_LOCK:
+        items = sorted(_HISTOGRAMS.items())
+        return [
+            {
+                "metric": name,
+                "provider": provider,
+                "model": model,
+                "reasoning_level": reasoning_level,
+                **histogram.as_dict(),
+            }
+            for (name, provider, model, reasoning_level), histogram in items
+        ]
+
+
+def reset_metrics() -> None:
+    with _HISTOGRAMS_LOCK:
+        _HISTOGRAMS.clear()
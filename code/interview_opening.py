@@ -0,0 +1,90 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+OPENING_CACHE_MAX_ENTRIES = 32
+
+
+def opening_cache_key(
+    config_name: str,
+    model: str,
+    system_prompt: str,
+    initial_prompt: str,
+    reasoning_level: str = "none",
+) -> tuple[str, str, str]:
+    """Return ``(config, model, prompt hash)`` for a context-free opening turn.
+
+    The hash covers everything else that shapes the reply, so editing the
+    prompt or switching reasoning level never serves a stale greeting.
+    """
+    digest = hashlib.sha256(
+        "\x00".join((system_prompt, initial_prompt, reasoning_level)).encode()
+    ).hexdigest()
+    return (config_name, model, digest)
+
+
+class OpeningTurnCache:
+    """Small LRU of generated opening turns, shared by every session in the process."""
+
+    def __init__(self, max_entries: int = OPENING_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key) -> str | None:
+        with self._lock:
+            text = self._entries.get(key)
+            if text is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return text
+
+    def contains(self, key) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def store(self, key, text: str) -> None:
+        if not text or not text.strip():
+            return
+        with self._lock:
+            self._entries[key] = text
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+# Module-level so cached openings survive Streamlit reruns and are shared by
+# every session; the script itself is re-executed on every interaction.
+_OPENING_CACHE = OpeningTurnCache()
+
+
+def get_cached_opening(key) -> str | None:
+    return _OPENING_CACHE.get(key)
+
+
+def has_cached_opening(key) -> bool:
+    """Return whether ``key`` is cached, without counting a hit or miss."""
+    return _OPENING_CACHE.contains(key)
+
+
+def store_opening(key, text: str) -> None:
+    _OPENING_CACHE.store(key, text)
+
+
+def get_opening_cache_stats() -> dict:
+    return _OPENING_CACHE.stats()
+
+
+def reset_opening_cache() -> None:
+    """Forget every cached opening turn; used by tests."""
+    global _OPENING_CACHE
+    _OPENING_CACHE = OpeningTurnCache()
@@ -0,0 +1,111 @@
+import math
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterator
+
+
+DEFAULT_TYPING_CHARACTERS_PER_SECOND = 65
+MAX_TYPING_CHARACTERS_PER_SECOND = 2000
+CATCH_UP_SECONDS = 1.0
+MAX_ADDED_DELAY_SECONDS = 4.0
+FRAME_SECONDS = 1 / 30
+# Pace slightly faster than the provider has been streaming so text that
+# piles up between reads does not turn into lag.
+PROVIDER_RATE_HEADROOM = 1.25
+# A frame may run this many characters past its size to finish a word.
+MAX_WORD_EXTENSION = 16
+
+
+@dataclass
+class TypingPacer:
+    """Reveal streamed text at a typing pace that never falls behind the provider.
+
+    The pace is the fastest of the base typing speed, the provider's observed
+    speed (plus headroom), and whatever drains the current backlog within
+    ``catch_up_seconds``. Text is released in frame-sized chunks, and once
+    ``max_added_delay_seconds`` of sleeping has been spent on a reply the
+    rest is shown as soon as it arrives. With ``enabled=False`` text is
+    passed through unchanged.
+    """
+
+    enabled: bool = True
+    base_cps: float = DEFAULT_TYPING_CHARACTERS_PER_SECOND
+    max_cps: float = MAX_TYPING_CHARACTERS_PER_SECOND
+    catch_up_seconds: float = CATCH_UP_SECONDS
+    max_added_delay_seconds: float = MAX_ADDED_DELAY_SECONDS
+    frame_seconds: float = FRAME_SECONDS
+    clock: Callable[[], float] = time.monotonic
+    sleep: Callable[[float], None] = time.sleep
+    received_chars: int = 0
+    displayed_chars: int = 0
+    frames: int = 0
+    added_delay_seconds: float = 0.0
+    first_received: float | None = None
+    _buffer: str = ""
+
+    @property
+    def backlog_chars(self) -> int:
+        """Characters received from the provider but not yet shown."""
+        return self.received_chars - self.displayed_chars
+
+    def provider_cps(self) -> float:
+        if self.first_received is None:
+            return 0.0
+        elapsed = self.clock() - self.first_received
+        if elapsed < self.frame_seconds:
+            return 0.0
+        return self.received_chars / elapsed
+
+    def current_cps(self) -> float:
+        return min(
+            max(
+                self.base_cps,
+                self.provider_cps() * PROVIDER_RATE_HEADROOM,
+                self.backlog_chars / self.catch_up_seconds,
+            ),
+            self.max_cps,
+        )
+
+    def feed(self, text: str) -> Iterator[str]:
+        """Accept newly received text and yield it in paced, frame-sized chunks."""
+        if not text:
+            return
+        if self.first_received is None:
+            self.first_received = self.clock()
+        self.received_chars += len(text)
+        self._buffer += text
+
+        while self._buffer:
+            if (
+                not self.enabled
+                or self.added_delay_seconds >= self.max_added_delay_seconds
+            ):
+                yield self._take(len(self._buffer))
+                return
+
+            cps = self.current_cps()
+            chunk = self._take(max(math.ceil(cps * self.frame_seconds), 1))
+            yield chunk
+            delay = min(
+                len(chunk) / cps,
+                self.max_added_delay_seconds - self.added_delay_seconds,
+            )
+            self.sleep(delay)
+            self.added_delay_seconds += delay
+
+    def _take(self, size: int) -> str:
+        if size < len(self._buffer) and not self._buffer[size - 1].isspace():
+            word_end = next(
+                (
+                    index
+                    for index in range(size, min(size + MAX_WORD_EXTENSION, len(self._buffer)))
+                    if self._buffer[index].isspace()
+                ),
+                None,
+            )
+            if word_end is not None:
+                size = word_end + 1
+        chunk, self._buffer = self._buffer[:size], self._buffer[size:]
+        self.displayed_chars += len(chunk)
+        self.frames += 1
+        return chunk
@@ -3,6 +3,7 @@ from time import localtime, strftime, time as current_time
 
 from interview_completion import CompletionResponses, has_inline_feedback
 from interview_logic import serialize_transcript
+from interview_summary_jobs import SummaryJob
 
 
 @dataclass(frozen=True)
@@ -18,6 +19,7 @@ class CompletionContext:
     completion_responses: CompletionResponses
     model: str = ""
     model_reasoning_level: str = "none"
+    usage: dict | None = None
 
 
 @dataclass(frozen=True)
@@ -27,7 +29,7 @@ class CompletionResult:
     transcript_text: str
     timestamp: str
     duration_minutes: str
-    summary_text: str
+    summary_status: str
     email_sent: bool
     remote_saved: bool
     remote_error: str
@@ -41,13 +43,17 @@ def persist_completion(
     persist_local_transcript,
     send_transcript_email,
     persist_remote_completion,
-    generate_summary,
-    update_interview_summary,
+    schedule_summary,
     record_email_delivery=lambda **kwargs: None,
     now_fn=current_time,
     timestamp_fn=None,
 ):
-    """Persist the completed interview using the provided side-effect callbacks."""
+    """Persist the completed interview using the provided side-effect callbacks.
+
+    The summary is not generated here: once the transcript is saved remotely
+    (with ``summary_status`` "pending"), ``schedule_summary`` receives a
+    ``SummaryJob`` to run in the background.
+    """
     timestamp_fn = timestamp_fn or (
         lambda: strftime("%Y-%m-%d %H:%M:%S", localtime(now_fn()))
     )
@@ -63,7 +69,8 @@ def persist_completion(
 
     remote_saved = True
     remote_error = ""
-    summary_text = ""
+    summary_status = ""
+    usage_kwargs = {"usage": context.usage} if context.usage else {}
     try:
         persist_remote_completion(
             context.interview_id,
@@ -82,6 +89,8 @@ def persist_completion(
             validation_rating=context.completion_responses.validation_rating,
             feedback=context.completion_responses.feedback,
             survey_timestamp=survey_timestamp,
+            summary_status="pending",
+            **usage_kwargs,
         )
     except Exception as exc:
         remote_saved = False
@@ -89,8 +98,15 @@ def persist_completion(
 
     if remote_saved:
         try:
-            summary_text = generate_summary(transcript_text)
-            update_interview_summary(context.interview_id, summary_text)
+            schedule_summary(
+                SummaryJob(
+                    interview_id=context.interview_id,
+                    interview_type=context.config_name,
+                    timestamp=timestamp,
+                    transcript_text=transcript_text,
+                )
+            )
+            summary_status = "pending"
         except Exception as exc:
             remote_error = str(exc)
 
@@ -129,6 +145,7 @@ def persist_completion(
                     status="sent" if email_sent else "failed",
                     attempted_at=timestamp,
                     error=email_error,
+                    interview_timestamp=timestamp,
                 )
             except Exception:
                 pass
@@ -139,7 +156,7 @@ def persist_completion(
         transcript_text=transcript_text,
         timestamp=timestamp,
         duration_minutes=duration_minutes,
-        summary_text=summary_text,
+        summary_status=summary_status,
         email_sent=email_sent,
         remote_saved=remote_saved,
         remote_error=remote_error,
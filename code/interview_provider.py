@@ -1,7 +1,12 @@
+import asyncio
+import hashlib
+import importlib.util
+import threading
 from dataclasses import dataclass
 from typing import Callable, Sequence
 
-from openai import OpenAI
+import httpx
+from openai import AsyncOpenAI, OpenAI
 
 
 OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
@@ -12,6 +17,20 @@ OPENROUTER_MIN_REASONING_MAX_TOKENS = 1536
 OPENROUTER_INDUSTRY_CONFIGS = {"industry_org_survey"}
 OPENROUTER_REASONING_EFFORTS = {"none", "minimal", "low", "medium", "high"}
 REASONING_EXPERIMENT_LEVELS = ("medium", "none")
+SUMMARY_DEFAULT_MAX_TOKENS = 200
+DEEPINFRA_BASE_URL = "https://api.deepinfra.com/v1/openai"
+CLIENT_MAX_CONNECTIONS = 50
+CLIENT_MAX_KEEPALIVE_CONNECTIONS = 20
+CLIENT_KEEPALIVE_EXPIRY_SECONDS = 120
+CLIENT_CONNECT_TIMEOUT_SECONDS = 10
+CLIENT_READ_TIMEOUT_SECONDS = 120
+PRECONNECT_TIMEOUT_SECONDS = 5.0
+
+PROMPT_CACHE_CONTROL = {"type": "ephemeral"}
+PROMPT_CACHE_KEY_PROVIDERS = {"openai", "openrouter"}
+
+_CLIENT_REGISTRY: dict[tuple, object] = {}
+_CLIENT_REGISTRY_LOCK = threading.Lock()
 
 
 @dataclass(frozen=True)
@@ -28,6 +47,8 @@ class ProviderRuntime:
     api: str
     client: object
     model_selection: ModelSelection
+    async_client: object = None
+    summary_selection: ModelSelection | None = None
 
 
 def normalize_provider(provider_name: str, model_name: str = "") -> str:
@@ -96,6 +117,128 @@ def build_openrouter_headers(secrets) -> dict[str, str]:
     return headers
 
 
+def http2_supported() -> bool:
+    """Return whether httpx can negotiate HTTP/2 (the optional h2 package is installed)."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def build_http_client(asynchronous: bool = False) -> httpx.Client | httpx.AsyncClient:
+    """Build a pooled httpx client tuned for many concurrent streaming sessions."""
+    client_class = httpx.AsyncClient if asynchronous else httpx.Client
+    return client_class(
+        http2=http2_supported(),
+        limits=httpx.Limits(
+            max_connections=CLIENT_MAX_CONNECTIONS,
+            max_keepalive_connections=CLIENT_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=CLIENT_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+        timeout=httpx.Timeout(
+            CLIENT_READ_TIMEOUT_SECONDS,
+            connect=CLIENT_CONNECT_TIMEOUT_SECONDS,
+        ),
+        follow_redirects=True,
+    )
+
+
+def client_registry_key(
+    provider: str,
+    api_key: str,
+    base_url: str | None = None,
+    headers: dict | None = None,
+    *,
+    asynchronous: bool = False,
+) -> tuple:
+    """Return the registry key for a client; the API key is stored only as a hash."""
+    key_hash = hashlib.sha256(str(api_key).encode()).hexdigest()
+    return (
+        provider,
+        base_url or "",
+        key_hash,
+        tuple(sorted((headers or {}).items())),
+        asynchronous,
+    )
+
+
+def get_cached_client(
+    provider: str,
+    api_key: str,
+    *,
+    base_url: str | None = None,
+    headers: dict | None = None,
+    asynchronous: bool = False,
+):
+    """Return the process-wide SDK client for these settings, creating it once.
+
+    Streamlit reruns the script on every interaction, so sharing the client
+    (and its httpx connection pool) across reruns and sessions avoids a new
+    TLS handshake per turn. ``asynchronous`` selects the asyncio client used
+    by ``interview_async_provider``.
+    """
+    key = client_registry_key(
+        provider, api_key, base_url, headers, asynchronous=asynchronous
+    )
+    with _CLIENT_REGISTRY_LOCK:
+        client = _CLIENT_REGISTRY.get(key)
+        if client is not None:
+            return client
+
+        http_client = build_http_client(asynchronous)
+        if provider == "anthropic":
+            import anthropic  # noqa: E402
+
+            client_class = anthropic.AsyncAnthropic if asynchronous else anthropic.Anthropic
+            client_kwargs = {"api_key": api_key, "http_client": http_client}
+            if base_url:
+                client_kwargs["base_url"] = base_url
+            client = client_class(**client_kwargs)
+        else:
+            client_kwargs = {"api_key": api_key, "http_client": http_client}
+            if base_url:
+                client_kwargs["base_url"] = base_url
+            if base_url or headers is not None:
+                client_kwargs["default_headers"] = headers or None
+            client = (AsyncOpenAI if asynchronous else OpenAI)(**client_kwargs)
+
+        _CLIENT_REGISTRY[key] = client
+        return client
+
+
+def clear_client_registry() -> None:
+    """Close and forget every cached client."""
+    with _CLIENT_REGISTRY_LOCK:
+        clients = list(_CLIENT_REGISTRY.values())
+        _CLIENT_REGISTRY.clear()
+    for client in clients:
+        close = getattr(client, "close", None)
+        if callable(close):
+            try:
+                result = close()
+                if asyncio.iscoroutine(result):
+                    # Async clients are closed with their event loop; drop the coroutine.
+                    result.close()
+            except Exception:
+                pass
+
+
+def preconnect_target(client) -> tuple:
+    """Return ``(http_client, url)`` for warming an SDK client's connection pool.
+
+    The SDKs keep the httpx client passed in by ``get_cached_client`` on
+    ``_client``; a HEAD to the base URL completes DNS, TCP and TLS without
+    authenticating or spending tokens, and leaves the connection pooled.
+    """
+    return getattr(client, "_client", None), str(getattr(client, "base_url", ""))
+
+
+def preconnect_client(client, timeout: float = PRECONNECT_TIMEOUT_SECONDS) -> bool:
+    """Open a pooled connection for a synchronous SDK client; returns False if it cannot."""
+    http_client, url = preconnect_target(client)
+    if not isinstance(http_client, httpx.Client) or not url:
+        return False
+    http_client.head(url, timeout=timeout)
+    return True
+
+
 def apply_model_selection_to_openai_kwargs(kwargs: dict, model_selection: ModelSelection) -> dict:
     """Apply model-selection overrides to an OpenAI-compatible request payload."""
     updated = dict(kwargs)
@@ -106,6 +249,55 @@ def apply_model_selection_to_openai_kwargs(kwargs: dict, model_selection: ModelS
     return updated
 
 
+def build_prompt_cache_key(config_name: str, model: str) -> str:
+    """Return a stable cache-routing key for requests that share a system prompt prefix."""
+    digest = hashlib.sha256(f"{config_name}:{model}".encode()).hexdigest()
+    return f"interview-{digest[:16]}"
+
+
+def apply_prompt_cache_to_openai_kwargs(
+    kwargs: dict, provider: str, cache_key: str
+) -> dict:
+    """Attach a prompt-cache key so repeated prefixes land on a warm cache."""
+    if provider not in PROMPT_CACHE_KEY_PROVIDERS:
+        return kwargs
+    updated = dict(kwargs)
+    updated["extra_body"] = {
+        **(kwargs.get("extra_body") or {}),
+        "prompt_cache_key": cache_key,
+    }
+    return updated
+
+
+def _as_cached_text_blocks(content) -> list[dict]:
+    if isinstance(content, list):
+        blocks = [dict(block) for block in content]
+    else:
+        blocks = [{"type": "text", "text": str(content)}]
+    if blocks:
+        blocks[-1]["cache_control"] = dict(PROMPT_CACHE_CONTROL)
+    return blocks
+
+
+def apply_prompt_cache_to_anthropic_kwargs(kwargs: dict) -> dict:
+    """Mark the system prompt and the conversation so far as cacheable.
+
+    The message dicts come straight from session state, so the last one is
+    copied rather than annotated in place.
+    """
+    updated = dict(kwargs)
+    if updated.get("system"):
+        updated["system"] = _as_cached_text_blocks(updated["system"])
+    messages = list(updated.get("messages") or [])
+    if messages:
+        messages[-1] = {
+            **messages[-1],
+            "content": _as_cached_text_blocks(messages[-1]["content"]),
+        }
+        updated["messages"] = messages
+    return updated
+
+
 def resolve_model_selection(provider: str, config_name: str, secrets, default_max_tokens: int) -> ModelSelection:
     """Select the active model and request settings for the given provider/config."""
     if provider != "openrouter":
@@ -147,6 +339,53 @@ def resolve_model_selection(provider: str, config_name: str, secrets, default_ma
     )
 
 
+def _config_secret(secrets, key: str, config_name: str, default=None):
+    """Return ``<KEY>_<CONFIG_NAME>`` when set, else ``<KEY>``, else ``default``."""
+    if config_name:
+        value = secrets.get(f"{key}_{config_name.upper()}")
+        if value not in (None, ""):
+            return value
+    value = secrets.get(key)
+    return default if value in (None, "") else value
+
+
+def resolve_summary_model_selection(
+    provider: str, config_name: str, secrets, interview_selection: ModelSelection
+) -> ModelSelection:
+    """Select the model for post-interview summaries, separate from the interview model.
+
+    ``SUMMARY_MODEL``, ``SUMMARY_MAX_TOKENS`` and ``SUMMARY_REASONING_EFFORT``
+    set the policy for every config; a ``_<CONFIG_NAME>`` suffix (e.g.
+    ``SUMMARY_MODEL_INDUSTRY_ORG_SURVEY``) overrides one config. Without
+    them OpenRouter summaries use the baseline ``OPENROUTER_DEFAULT_MODEL``
+    with reasoning off, and other providers reuse the interview model.
+    """
+    if provider == "openrouter":
+        default_model = str(
+            secrets.get("OPENROUTER_DEFAULT_MODEL", OPENROUTER_DEFAULT_MODEL)
+        )
+    else:
+        default_model = interview_selection.model
+    max_tokens = int(
+        _config_secret(
+            secrets, "SUMMARY_MAX_TOKENS", config_name, SUMMARY_DEFAULT_MAX_TOKENS
+        )
+    )
+    model = str(_config_secret(secrets, "SUMMARY_MODEL", config_name, default_model))
+    if provider != "openrouter":
+        return ModelSelection(model=model, max_tokens=max_tokens, reasoning_level="none")
+
+    reasoning_level = _normalize_reasoning_effort(
+        str(_config_secret(secrets, "SUMMARY_REASONING_EFFORT", config_name, "none"))
+    )
+    return ModelSelection(
+        model=model,
+        max_tokens=max_tokens,
+        reasoning=reasoning_payload_for_level(reasoning_level),
+        reasoning_level=reasoning_level,
+    )
+
+
 def create_provider_runtime(secrets, config_name: str, default_max_tokens: int) -> ProviderRuntime:
     """Create the active client/runtime tuple for the interview app."""
     configured_provider = str(secrets.get("API_PROVIDER", "openai"))
@@ -161,45 +400,38 @@ def create_provider_runtime(secrets, config_name: str, default_max_tokens: int)
     )
 
     if provider == "openai":
+        api, client_options = "openai", {"api_key": secrets["API_KEY"]}
+    elif provider == "deepinfra":
+        api, client_options = "openai", {
+            "api_key": secrets["DEEPINFRA_API_KEY"],
+            "base_url": DEEPINFRA_BASE_URL,
+        }
+    elif provider == "openrouter":
+        api, client_options = "openai", {
+            "api_key": secrets["OPENROUTER_API_KEY"],
+            "base_url": OPENROUTER_BASE_URL,
+            "headers": build_openrouter_headers(secrets),
+        }
+    elif provider == "anthropic":
+        api, client_options = "anthropic", {"api_key": secrets["ANTHROPIC_API_KEY"]}
+    else:
+        client_options = None
+
+    if client_options is not None:
+        # A base-URL secret points the provider at another endpoint, e.g. the
+        # local mock_provider_server.py used for offline load tests.
+        base_url_override = str(secrets.get(f"{provider.upper()}_BASE_URL", "") or "").strip()
+        if base_url_override:
+            client_options["base_url"] = base_url_override
         return ProviderRuntime(
             provider=provider,
-            api="openai",
-            client=OpenAI(api_key=secrets["API_KEY"]),
-            model_selection=model_selection,
-        )
-
-    if provider == "deepinfra":
-        return ProviderRuntime(
-            provider=provider,
-            api="openai",
-            client=OpenAI(
-                api_key=secrets["DEEPINFRA_API_KEY"],
-                base_url="https://api.deepinfra.com/v1/openai",
-            ),
+            api=api,
+            client=get_cached_client(provider, **client_options),
             model_selection=model_selection,
-        )
-
-    if provider == "openrouter":
-        headers = build_openrouter_headers(secrets)
-        return ProviderRuntime(
-            provider=provider,
-            api="openai",
-            client=OpenAI(
-                api_key=secrets["OPENROUTER_API_KEY"],
-                base_url=OPENROUTER_BASE_URL,
-                default_headers=headers or None,
+            async_client=get_cached_client(provider, asynchronous=True, **client_options),
+            summary_selection=resolve_summary_model_selection(
+                provider, config_name, secrets, model_selection
             ),
-            model_selection=model_selection,
-        )
-
-    if provider == "anthropic":
-        import anthropic  # noqa: E402
-
-        return ProviderRuntime(
-            provider=provider,
-            api="anthropic",
-            client=anthropic.Anthropic(api_key=secrets["ANTHROPIC_API_KEY"]),
-            model_selection=model_selection,
         )
 
     raise ValueError(
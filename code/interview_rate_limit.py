@@ -0,0 +1,461 @@
+import heapq
+import itertools
+import json
+import re
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+
+from interview_context import estimate_tokens
+
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 10
+DEFAULT_RATE_LIMIT_RETRIES = 2
+DEFAULT_RATE_LIMITED_BACKOFF_SECONDS = 2.0
+BACKGROUND_RATE_LIMIT_TIMEOUT_SECONDS = 300.0
+MAX_RETRY_AFTER_SECONDS = 120.0
+RATE_LIMITED_PROVIDERS = ("openai", "deepinfra", "openrouter", "anthropic")
+
+# (remaining header, reset header, bucket kind) as sent by OpenAI/DeepInfra,
+# OpenRouter and Anthropic. Reset values are durations ("6m0s"), epoch
+# timestamps, or RFC 3339 dates depending on the provider.
+RATE_LIMIT_HEADER_PAIRS = (
+    ("x-ratelimit-remaining-requests", "x-ratelimit-reset-requests", "requests"),
+    ("x-ratelimit-remaining-tokens", "x-ratelimit-reset-tokens", "tokens"),
+    ("x-ratelimit-remaining", "x-ratelimit-reset", "requests"),
+    ("anthropic-ratelimit-requests-remaining", "anthropic-ratelimit-requests-reset", "requests"),
+    ("anthropic-ratelimit-tokens-remaining", "anthropic-ratelimit-tokens-reset", "tokens"),
+)
+
+_DURATION_PATTERN = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_TEXT_PATTERN = re.compile(r"(?:\d+(?:\.\d+)?(?:ms|s|m|h))+")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+class RateLimitTimeoutError(RuntimeError):
+    """Raised when a request stayed queued behind a provider rate limit past its timeout."""
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Per-minute budgets for one provider or provider:model key; 0 means unlimited."""
+
+    requests_per_minute: float = 0.0
+    tokens_per_minute: float = 0.0
+
+
+@dataclass
+class TokenBucket:
+    """Refill ``per_minute`` units evenly, holding at most one minute's worth.
+
+    ``level`` may go negative when a request used more tokens than were
+    reserved for it; later requests then wait for the debt to refill.
+    """
+
+    per_minute: float
+    updated: float
+    level: float | None = None
+
+    def __post_init__(self):
+        if self.level is None:
+            self.level = self.per_minute
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(now - self.updated, 0.0)
+        self.level = min(self.per_minute, self.level + elapsed * self.per_minute / 60)
+        self.updated = now
+
+    def wait_seconds(self, amount: float, now: float) -> float:
+        self._refill(now)
+        # A request larger than the whole bucket only waits for a full bucket.
+        needed = min(amount, self.per_minute)
+        if self.level >= needed:
+            return 0.0
+        return (needed - self.level) * 60 / self.per_minute
+
+    def take(self, amount: float, now: float) -> None:
+        self._refill(now)
+        self.level -= amount
+
+    def cap(self, remaining: float, now: float) -> None:
+        self._refill(now)
+        self.level = min(self.level, remaining)
+
+
+@dataclass
+class RateLimitStats:
+    provider: str
+    model: str
+    max_queued: int = 0
+    granted: int = 0
+    timeouts: int = 0
+    rate_limited: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    def as_dict(self) -> dict:
+        mean_wait = self.total_wait_seconds / self.granted if self.granted else 0.0
+        return {
+            "provider": self.provider,
+            "model": self.model,
+            "max_queued": self.max_queued,
+            "granted": self.granted,
+            "timeouts": self.timeouts,
+            "rate_limited": self.rate_limited,
+            "mean_wait_ms": round(mean_wait * 1000, 2),
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 2),
+        }
+
+
+def parse_reset_seconds(value, now_epoch: float) -> float | None:
+    """Return seconds until a rate-limit reset given as a duration, epoch, or date."""
+    if value is None:
+        return None
+    text = str(value).strip()
+    if not text:
+        return None
+    if _DURATION_TEXT_PATTERN.fullmatch(text):
+        return sum(
+            float(amount) * _DURATION_UNITS[unit]
+            for amount, unit in _DURATION_PATTERN.findall(text)
+        )
+    try:
+        number = float(text)
+    except ValueError:
+        number = None
+    if number is not None:
+        if number > 1e12:
+            return max(number / 1000 - now_epoch, 0.0)
+        if number > 1e9:
+            return max(number - now_epoch, 0.0)
+        return max(number, 0.0)
+    try:
+        moment = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            moment = parsedate_to_datetime(text)
+        except (TypeError, ValueError):
+            return None
+    if moment.tzinfo is None:
+        return None
+    return max(moment.timestamp() - now_epoch, 0.0)
+
+
+def _normalize_headers(headers) -> dict[str, str]:
+    return {str(name).lower(): str(value) for name, value in (headers or {}).items()}
+
+
+def retry_after_seconds(headers, now_epoch: float) -> float | None:
+    """Return the server's ``Retry-After`` (or ``retry-after-ms``) in seconds, if any."""
+    headers = _normalize_headers(headers)
+    if headers.get("retry-after-ms"):
+        try:
+            return max(float(headers["retry-after-ms"]) / 1000, 0.0)
+        except ValueError:
+            pass
+    return parse_reset_seconds(headers.get("retry-after"), now_epoch)
+
+
+def rate_limit_error_headers(exc: BaseException):
+    """Return the response headers of a 429 provider error, or None for other errors."""
+    response = getattr(exc, "response", None)
+    status = getattr(exc, "status_code", None) or getattr(response, "status_code", None)
+    if status != 429:
+        return None
+    return getattr(response, "headers", None) or {}
+
+
+def _content_text(content) -> str:
+    if isinstance(content, list):
+        return "".join(str(block.get("text", "")) for block in content)
+    return str(content or "")
+
+
+def estimate_request_tokens(request_kwargs: dict) -> int:
+    """Estimate a chat request's prompt tokens plus its output allowance."""
+    parts = [_content_text(request_kwargs.get("system"))]
+    parts.extend(
+        _content_text(message.get("content"))
+        for message in request_kwargs.get("messages") or []
+    )
+    return estimate_tokens("".join(parts)) + int(request_kwargs.get("max_tokens") or 0)
+
+
+def parse_rate_limits(secrets) -> dict[str, RateLimit]:
+    """Read ``<PROVIDER>_REQUESTS_PER_MINUTE``/``_TOKENS_PER_MINUTE`` and ``RATE_LIMITS_JSON``.
+
+    The JSON maps ``provider`` or ``provider:model`` to ``{"rpm": ..., "tpm": ...}``;
+    a model entry applies on top of its provider's budget.
+    """
+    limits = {}
+    for provider in RATE_LIMITED_PROVIDERS:
+        rpm = secrets.get(f"{provider.upper()}_REQUESTS_PER_MINUTE")
+        tpm = secrets.get(f"{provider.upper()}_TOKENS_PER_MINUTE")
+        if rpm or tpm:
+            limits[provider] = RateLimit(float(rpm or 0), float(tpm or 0))
+    raw_limits = secrets.get("RATE_LIMITS_JSON")
+    if raw_limits:
+        overrides = json.loads(raw_limits) if isinstance(raw_limits, str) else raw_limits
+        for key, limit in overrides.items():
+            limits[str(key).strip()] = RateLimit(
+                float(limit.get("rpm") or 0), float(limit.get("tpm") or 0)
+            )
+    return limits
+
+
+class RateLimitScheduler:
+    """Admit provider requests under per-minute request and token budgets.
+
+    Requests for one provider queue in priority order (live turns before
+    background summaries, then first come first served) across all of its
+    models, because the provider-level budget is shared by them. A request
+    only overtakes an earlier one that is held back by its own model's
+    pause or budget. Budgets come from configured limits, the provider's
+    remaining-quota headers, and ``Retry-After`` on 429 responses.
+    Thread-safe: callers block on a condition variable, so it must not be
+    called from the provider event loop.
+    """
+
+    def __init__(self, limits=None, *, clock=time.monotonic, wall_clock=time.time):
+        self._limits: dict[str, RateLimit] = dict(limits or {})
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._condition = threading.Condition()
+        self._buckets: dict[tuple, TokenBucket] = {}
+        self._blocked_until: dict[tuple, float] = {}
+        self._waiters: dict[tuple, list] = {}
+        self._stats: dict[tuple, RateLimitStats] = {}
+        self._sequence = itertools.count()
+
+    def configure(self, limits) -> None:
+        """Replace the configured limits; unchanged limits keep their current budgets."""
+        limits = dict(limits or {})
+        with self._condition:
+            if limits == self._limits:
+                return
+            self._limits = limits
+            self._buckets.clear()
+            self._condition.notify_all()
+
+    def _stats_for(self, key: tuple) -> RateLimitStats:
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = RateLimitStats(provider=key[0], model=key[1])
+            self._stats[key] = stats
+        return stats
+
+    def _buckets_for(
+        self, key: tuple, now: float, *, levels=("provider", "model")
+    ) -> list[tuple[TokenBucket, str]]:
+        provider, model = key
+        limit_keys = {"provider": provider, "model": f"{provider}:{model}"}
+        buckets = []
+        for limit_key in (limit_keys[level] for level in levels):
+            limit = self._limits.get(limit_key)
+            if limit is None:
+                continue
+            for kind, per_minute in (
+                ("requests", limit.requests_per_minute),
+                ("tokens", limit.tokens_per_minute),
+            ):
+                if per_minute <= 0:
+                    continue
+                bucket = self._buckets.get((limit_key, kind))
+                if bucket is None:
+                    bucket = TokenBucket(per_minute=per_minute, updated=now)
+                    self._buckets[(limit_key, kind)] = bucket
+                buckets.append((bucket, kind))
+        return buckets
+
+    def _wait_seconds(self, key: tuple, tokens: int, now: float, levels) -> float:
+        wait = 0.0
+        if "model" in levels:
+            wait = max(self._blocked_until.get(key, 0.0) - now, 0.0)
+        for bucket, kind in self._buckets_for(key, now, levels=levels):
+            wait = max(wait, bucket.wait_seconds(1 if kind == "requests" else tokens, now))
+        return wait
+
+    def _admission_wait(self, waiters: list, ticket: tuple, now: float) -> float | None:
+        """Return how long ``ticket`` must wait for budget, or None while it must queue.
+
+        An earlier ticket holds this one back unless it is for another model
+        and waits only on that model's own pause or budget.
+        """
+        _, _, key, tokens = ticket
+        for ahead in sorted(waiters):
+            if ahead == ticket:
+                break
+            _, _, ahead_key, ahead_tokens = ahead
+            if (
+                ahead_key == key
+                or self._wait_seconds(ahead_key, ahead_tokens, now, ("provider",)) > 0
+                or self._wait_seconds(ahead_key, ahead_tokens, now, ("model",)) <= 0
+            ):
+                return None
+        return self._wait_seconds(key, tokens, now, ("provider", "model"))
+
+    def acquire(
+        self,
+        provider: str,
+        model: str,
+        *,
+        tokens: int = 0,
+        priority: int = PRIORITY_INTERACTIVE,
+        timeout: float | None = None,
+    ) -> float:
+        """Block until this request may start; returns the seconds spent queued.
+
+        ``tokens`` is the request's estimated prompt plus output tokens.
+        """
+        key = (provider, model or "")
+        with self._condition:
+            started = self._clock()
+            deadline = None if timeout is None else started + timeout
+            ticket = (priority, next(self._sequence), key, tokens)
+            waiters = self._waiters.setdefault(provider, [])
+            heapq.heappush(waiters, ticket)
+            stats = self._stats_for(key)
+            stats.max_queued = max(stats.max_queued, len(waiters))
+            try:
+                while True:
+                    now = self._clock()
+                    wait = self._admission_wait(waiters, ticket, now)
+                    if wait is not None and wait <= 0:
+                        for bucket, kind in self._buckets_for(key, now):
+                            bucket.take(1 if kind == "requests" else tokens, now)
+                        break
+                    if deadline is not None and now >= deadline:
+                        stats.timeouts += 1
+                        raise RateLimitTimeoutError(
+                            f"{provider} is rate limited and this request waited "
+                            f"{timeout:.0f}s for capacity; please try again in a moment."
+                        )
+                    timeouts = [
+                        value
+                        for value in (wait, None if deadline is None else deadline - now)
+                        if value is not None
+                    ]
+                    self._condition.wait(min(timeouts) if timeouts else None)
+            finally:
+                waiters.remove(ticket)
+                heapq.heapify(waiters)
+                self._condition.notify_all()
+            waited = self._clock() - started
+            stats.granted += 1
+            stats.total_wait_seconds += waited
+            stats.max_wait_seconds = max(stats.max_wait_seconds, waited)
+        return waited
+
+    def record_usage(
+        self, provider: str, model: str, *, estimated_tokens: int, actual_tokens: int
+    ) -> None:
+        """Settle the token budget once the provider reports what a request really used."""
+        key = (provider, model or "")
+        with self._condition:
+            now = self._clock()
+            for bucket, kind in self._buckets_for(key, now):
+                if kind == "tokens":
+                    bucket.take(actual_tokens - estimated_tokens, now)
+            self._condition.notify_all()
+
+    def _block(self, key: tuple, seconds: float, now: float) -> None:
+        seconds = min(seconds, MAX_RETRY_AFTER_SECONDS)
+        self._blocked_until[key] = max(self._blocked_until.get(key, 0.0), now + seconds)
+        self._condition.notify_all()
+
+    def update_from_headers(self, provider: str, model: str, headers) -> float:
+        """Apply a response's remaining-quota headers; returns how long the key is paused."""
+        headers = _normalize_headers(headers)
+        if not headers:
+            return 0.0
+        key = (provider, model or "")
+        now_epoch = self._wall_clock()
+        pause = retry_after_seconds(headers, now_epoch) or 0.0
+        with self._condition:
+            now = self._clock()
+            for remaining_name, reset_name, kind in RATE_LIMIT_HEADER_PAIRS:
+                try:
+                    remaining = float(headers[remaining_name])
+                except (KeyError, ValueError):
+                    continue
+                reset = parse_reset_seconds(headers.get(reset_name), now_epoch)
+                if remaining <= 0 and reset:
+                    pause = max(pause, reset)
+                elif kind == "tokens":
+                    for bucket, bucket_kind in self._buckets_for(key, now):
+                        if bucket_kind == "tokens":
+                            bucket.cap(remaining, now)
+            if pause > 0:
+                self._block(key, pause, now)
+        return min(pause, MAX_RETRY_AFTER_SECONDS)
+
+    def record_rate_limited(self, provider: str, model: str, headers=None) -> float:
+        """Pause a provider/model after a 429, honouring ``Retry-After`` when present."""
+        key = (provider, model or "")
+        pause = self.update_from_headers(provider, model, headers)
+        with self._condition:
+            self._stats_for(key).rate_limited += 1
+            if pause <= 0:
+                pause = DEFAULT_RATE_LIMITED_BACKOFF_SECONDS
+                self._block(key, pause, self._clock())
+        return pause
+
+    def handle_error(self, provider: str, model: str, exc: BaseException) -> bool:
+        """Record a 429 error; returns whether ``exc`` was a rate-limit response."""
+        headers = rate_limit_error_headers(exc)
+        if headers is None:
+            return False
+        self.record_rate_limited(provider, model, headers)
+        return True
+
+    def stats(self) -> list[dict]:
+        with self._condition:
+            now = self._clock()
+            rows = []
+            for key, stats in self._stats.items():
+                priorities = [
+                    ticket[0]
+                    for ticket in self._waiters.get(key[0], [])
+                    if ticket[2] == key
+                ]
+                rows.append(
+                    {
+                        **stats.as_dict(),
+                        "queued": len(priorities),
+                        "queued_interactive": sum(
+                            1 for priority in priorities if priority <= PRIORITY_INTERACTIVE
+                        ),
+                        "queued_background": sum(
+                            1 for priority in priorities if priority > PRIORITY_INTERACTIVE
+                        ),
+                        "paused_ms": round(
+                            max(self._blocked_until.get(key, 0.0) - now, 0.0) * 1000, 2
+                        ),
+                    }
+                )
+            return rows
+
+
+# Module-level so queues and budgets are shared by every Streamlit session
+# and background worker in this process.
+_SCHEDULER = RateLimitScheduler()
+
+
+def get_rate_limit_scheduler() -> RateLimitScheduler:
+    return _SCHEDULER
+
+
+def configure_rate_limits(secrets) -> None:
+    _SCHEDULER.configure(parse_rate_limits(secrets))
+
+
+def get_rate_limit_stats() -> list[dict]:
+    return _SCHEDULER.stats()
+
+
+def reset_rate_limits() -> None:
+    global _SCHEDULER
+    _SCHEDULER = RateLimitScheduler()
@@ -0,0 +1,224 @@
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+
+
+REASONING_POLICIES = ("random", "adaptive")
+# Cheapest last; the adaptive policy steps down this list one level at a time.
+REASONING_LEVEL_ORDER = ("high", "medium", "low", "minimal", "none")
+DEFAULT_SLO_WINDOW_SECONDS = 600.0
+DEFAULT_SLO_MIN_SAMPLES = 20
+LATENCY_WINDOW_MAX_SAMPLES = 500
+
+
+@dataclass(frozen=True)
+class LatencySlo:
+    """p95 targets in milliseconds; a target of None is not enforced."""
+
+    ttft_p95_ms: float | None = None
+    total_p95_ms: float | None = None
+    window_seconds: float = DEFAULT_SLO_WINDOW_SECONDS
+    min_samples: int = DEFAULT_SLO_MIN_SAMPLES
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttft_p95_ms is not None or self.total_p95_ms is not None
+
+
+@dataclass(frozen=True)
+class ReasoningDecision:
+    assigned_level: str
+    level: str
+    reason: str
+
+    @property
+    def downgraded(self) -> bool:
+        return self.level != self.assigned_level
+
+
+def percentile(values, q: float) -> float | None:
+    """Nearest-rank percentile of ``values``."""
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    return ordered[max(math.ceil(q * len(ordered)) - 1, 0)]
+
+
+class LatencyWindow:
+    """TTFT and total-latency samples from the last ``window_seconds``."""
+
+    def __init__(self, window_seconds: float, max_samples: int = LATENCY_WINDOW_MAX_SAMPLES):
+        self.window_seconds = window_seconds
+        self.samples = deque(maxlen=max_samples)
+
+    def _expire(self, now: float) -> None:
+        while self.samples and now - self.samples[0][0] > self.window_seconds:
+            self.samples.popleft()
+
+    def add(self, now: float, ttft_ms: float | None, total_ms: float | None) -> None:
+        self.samples.append((now, ttft_ms, total_ms))
+        self._expire(now)
+
+    def p95(self, now: float) -> tuple[int, float | None, float | None]:
+        """Return ``(sample count, TTFT p95, total p95)`` over the live window."""
+        self._expire(now)
+        ttft = [sample[1] for sample in self.samples if sample[1] is not None]
+        total = [sample[2] for sample in self.samples if sample[2] is not None]
+        return len(self.samples), percentile(ttft, 0.95), percentile(total, 0.95)
+
+
+class AdaptiveReasoningPolicy:
+    """Lower a session's reasoning level while that level's rolling p95 latency breaches the SLO.
+
+    Levels without enough recent samples are trusted, so a level is probed
+    again once its slow samples age out of the window.
+    """
+
+    def __init__(self, slo: LatencySlo | None = None, *, clock=time.monotonic):
+        self.slo = slo or LatencySlo()
+        self.clock = clock
+        self._windows: dict[tuple, LatencyWindow] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, slo: LatencySlo) -> None:
+        with self._lock:
+            if slo == self.slo:
+                return
+            self.slo = slo
+            for window in self._windows.values():
+                window.window_seconds = slo.window_seconds
+
+    def record(
+        self,
+        provider: str,
+        model: str,
+        reasoning_level: str,
+        *,
+        ttft_ms: float | None,
+        total_ms: float | None,
+    ) -> None:
+        if ttft_ms is None and total_ms is None:
+            return
+        key = (provider or "", model or "", reasoning_level or "none")
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None:
+                window = LatencyWindow(self.slo.window_seconds)
+                self._windows[key] = window
+            window.add(self.clock(), ttft_ms, total_ms)
+
+    def _breach(self, provider: str, model: str, level: str) -> str:
+        """Return why ``level`` breaches the SLO, or an empty string when it does not."""
+        window = self._windows.get((provider or "", model or "", level))
+        if window is None:
+            return ""
+        count, ttft_p95, total_p95 = window.p95(self.clock())
+        if count < self.slo.min_samples:
+            return ""
+        for name, observed, target in (
+            ("ttft", ttft_p95, self.slo.ttft_p95_ms),
+            ("total", total_p95, self.slo.total_p95_ms),
+        ):
+            if target is not None and observed is not None and observed > target:
+                return f"{level} {name} p95 {observed:.0f}ms > {target:.0f}ms"
+        return ""
+
+    def choose(self, provider: str, model: str, assigned_level: str) -> ReasoningDecision:
+        """Return the highest level at or below ``assigned_level`` that meets the SLO."""
+        if not self.slo.enabled:
+            return ReasoningDecision(assigned_level, assigned_level, "no latency SLO configured")
+        if assigned_level not in REASONING_LEVEL_ORDER:
+            return ReasoningDecision(assigned_level, assigned_level, "level not adaptable")
+
+        breaches = []
+        with self._lock:
+            for level in REASONING_LEVEL_ORDER[REASONING_LEVEL_ORDER.index(assigned_level):]:
+                breach = self._breach(provider, model, level) if level != "none" else ""
+                if not breach:
+                    reason = "; ".join(breaches) or "within latency SLO"
+                    return ReasoningDecision(assigned_level, level, reason)
+                breaches.append(breach)
+        return ReasoningDecision(assigned_level, "none", "; ".join(breaches))
+
+    def stats(self) -> list[dict]:
+        with self._lock:
+            now = self.clock()
+            rows = []
+            for (provider, model, level), window in sorted(self._windows.items()):
+                count, ttft_p95, total_p95 = window.p95(now)
+                rows.append(
+                    {
+                        "provider": provider,
+                        "model": model,
+                        "reasoning_level": level,
+                        "samples": count,
+                        "ttft_p95_ms": ttft_p95,
+                        "total_p95_ms": total_p95,
+                    }
+                )
+            return rows
+
+
+def _optional_float(value) -> float | None:
+    try:
+        parsed = float(value)
+    except (TypeError, ValueError):
+        return None
+    return parsed if parsed > 0 else None
+
+
+def resolve_reasoning_policy(secrets) -> str:
+    """Return REASONING_POLICY: random (default) or adaptive."""
+    policy = str(secrets.get("REASONING_POLICY", "random") or "random").strip().lower()
+    return policy if policy in REASONING_POLICIES else "random"
+
+
+def parse_latency_slo(secrets) -> LatencySlo:
+    """Read REASONING_TTFT_P95_SLO_MS, REASONING_TOTAL_P95_SLO_MS and the window settings."""
+    window_seconds = _optional_float(secrets.get("REASONING_SLO_WINDOW_SECONDS"))
+    min_samples = _optional_float(secrets.get("REASONING_SLO_MIN_SAMPLES"))
+    return LatencySlo(
+        ttft_p95_ms=_optional_float(secrets.get("REASONING_TTFT_P95_SLO_MS")),
+        total_p95_ms=_optional_float(secrets.get("REASONING_TOTAL_P95_SLO_MS")),
+        window_seconds=window_seconds or DEFAULT_SLO_WINDOW_SECONDS,
+        min_samples=int(min_samples) if min_samples else DEFAULT_SLO_MIN_SAMPLES,
+    )
+
+
+# Module-level so the rolling windows aggregate across Streamlit reruns and
+# sessions; the script itself is re-executed on every interaction.
+_POLICY = AdaptiveReasoningPolicy()
+
+
+def get_reasoning_policy() -> AdaptiveReasoningPolicy:
+    return _POLICY
+
+
+def configure_reasoning_slo(secrets) -> None:
+    _POLICY.configure(parse_latency_slo(secrets))
+
+
+def record_reasoning_latency(
+    provider: str,
+    model: str,
+    reasoning_level: str,
+    *,
+    ttft_ms: float | None,
+    total_ms: float | None,
+) -> None:
+    _POLICY.record(provider, model, reasoning_level, ttft_ms=ttft_ms, total_ms=total_ms)
+
+
+def choose_reasoning_level(provider: str, model: str, assigned_level: str) -> ReasoningDecision:
+    return _POLICY.choose(provider, model, assigned_level)
+
+
+def get_reasoning_latency_stats() -> list[dict]:
+    return _POLICY.stats()
+
+
+def reset_reasoning_policy() -> None:
+    global _POLICY
+    _POLICY = AdaptiveReasoningPolicy()
@@ -0,0 +1,249 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from interview_context import estimate_tokens
+from interview_logic import extract_anthropic_text
+from interview_rate_limit import (
+    BACKGROUND_RATE_LIMIT_TIMEOUT_SECONDS,
+    PRIORITY_BACKGROUND,
+    get_rate_limit_scheduler,
+)
+from interview_usage import extract_anthropic_usage, extract_openai_usage
+
+
+SUMMARY_SYSTEM_PROMPT = (
+    "You create concise but detailed summaries of interview transcripts."
+)
+SUMMARY_PROMPT_PREFIX = (
+    "Please provide a concise but detailed summary for the following interview transcript:\n\n"
+)
+CHUNK_SUMMARY_PROMPT_PREFIX = (
+    "The following is one consecutive part ({index} of {total}) of a longer interview "
+    "transcript. Summarize it in detail: keep every topic covered, the respondent's "
+    "concrete examples and stated views, and any outline part it belongs to.\n\n"
+)
+REDUCE_PROMPT_PREFIX = (
+    "The following are summaries of consecutive parts of one interview, in order. "
+    "Combine them into a single concise but detailed summary of the whole interview, "
+    "without repeating points:\n\n"
+)
+SUMMARY_MAX_TOKENS = 200
+SUMMARY_TEMPERATURE = 0.7
+# Transcripts above this many tokens are summarized in chunks and merged.
+DEFAULT_SINGLE_SHOT_TOKEN_LIMIT = 12000
+DEFAULT_CHUNK_TOKENS = 4000
+CHUNK_SUMMARY_MAX_TOKENS = 400
+# A new interview part starts a new chunk once the current one is at least
+# this fraction of the chunk budget, so chunks follow the outline.
+PART_BOUNDARY_MIN_FILL = 0.25
+
+TURN_START_PATTERN = re.compile(r"^(?:user|assistant): ", re.MULTILINE)
+PART_HEADING_PATTERN = re.compile(r"\bPart\s+[IVX]+\b")
+
+# Module-level so it survives Streamlit reruns; the script itself is
+# re-executed on every interaction but imported modules are not.
+_SUMMARY_MAP_EXECUTOR = ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="summary-map"
+)
+
+
+def split_transcript_turns(transcript_text: str) -> list[str]:
+    """Split a serialized transcript into ``role: content`` turns, keeping multi-line turns whole."""
+    starts = [match.start() for match in TURN_START_PATTERN.finditer(transcript_text)]
+    if not starts or starts[0] != 0:
+        starts.insert(0, 0)
+    bounds = starts[1:] + [len(transcript_text)]
+    return [
+        transcript_text[start:end]
+        for start, end in zip(starts, bounds)
+        if transcript_text[start:end]
+    ]
+
+
+def chunk_transcript(
+    transcript_text: str, chunk_tokens: int = DEFAULT_CHUNK_TOKENS
+) -> list[str]:
+    """Group turns into chunks of at most ``chunk_tokens``, preferring interview-part boundaries.
+
+    A single turn longer than the budget becomes its own chunk.
+    """
+    chunks = []
+    current: list[str] = []
+    current_tokens = 0
+    for turn in split_transcript_turns(transcript_text):
+        turn_tokens = estimate_tokens(turn)
+        starts_part = turn.startswith("assistant: ") and PART_HEADING_PATTERN.search(turn)
+        if current and (
+            current_tokens + turn_tokens > chunk_tokens
+            or (starts_part and current_tokens >= chunk_tokens * PART_BOUNDARY_MIN_FILL)
+        ):
+            chunks.append("".join(current))
+            current, current_tokens = [], 0
+        current.append(turn)
+        current_tokens += turn_tokens
+    if current:
+        chunks.append("".join(current))
+    return chunks
+
+
+def _group_by_tokens(texts: list[str], budget: int) -> list[str]:
+    groups = []
+    current: list[str] = []
+    current_tokens = 0
+    for text in texts:
+        tokens = estimate_tokens(text)
+        if current and current_tokens + tokens > budget:
+            groups.append("".join(current))
+            current, current_tokens = [], 0
+        current.append(text)
+        current_tokens += tokens
+    if current:
+        groups.append("".join(current))
+    return groups
+
+
+def build_summary_completion(
+    provider: str, api: str, client, model_selection
+) -> Callable[[str, str, int | None], tuple]:
+    """Return a ``complete(system_prompt, prompt, max_tokens)`` for ``summarize_transcript``.
+
+    ``model_selection`` is the summary routing from
+    ``interview_provider.resolve_summary_model_selection``; its max_tokens
+    is the default for calls that do not set one. Each call is one
+    non-streaming request returning ``(text, usage)``, queued behind live
+    interview turns by the rate-limit scheduler. DeepInfra models get the
+    prompt as a single user message.
+    """
+    model = model_selection.model
+    default_max_tokens = model_selection.max_tokens or SUMMARY_MAX_TOKENS
+
+    def complete(system_prompt: str, prompt: str, max_tokens: int | None):
+        max_tokens = max_tokens or default_max_tokens
+        scheduler = get_rate_limit_scheduler()
+        estimated_tokens = estimate_tokens(system_prompt + prompt) + max_tokens
+        scheduler.acquire(
+            provider,
+            model,
+            tokens=estimated_tokens,
+            priority=PRIORITY_BACKGROUND,
+            timeout=BACKGROUND_RATE_LIMIT_TIMEOUT_SECONDS,
+        )
+        try:
+            text, usage = send(system_prompt, prompt, max_tokens)
+        except Exception as exc:
+            scheduler.handle_error(provider, model, exc)
+            raise
+        if usage is not None:
+            scheduler.record_usage(
+                provider,
+                model,
+                estimated_tokens=estimated_tokens,
+                actual_tokens=usage.input_tokens + usage.output_tokens,
+            )
+        return text, usage
+
+    def send(system_prompt: str, prompt: str, max_tokens: int):
+        if api == "openai":
+            if provider == "deepinfra":
+                summary_messages = [{"role": "user", "content": prompt}]
+            else:
+                summary_messages = [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": prompt},
+                ]
+            request_kwargs = {
+                "model": model,
+                "messages": summary_messages,
+                "max_tokens": max_tokens,
+                "temperature": SUMMARY_TEMPERATURE,
+                "stream": False,
+            }
+            if model_selection.reasoning:
+                request_kwargs["extra_body"] = {
+                    "reasoning": dict(model_selection.reasoning)
+                }
+            response = client.chat.completions.create(**request_kwargs)
+            return (
+                (response.choices[0].message.content or "").strip(),
+                extract_openai_usage(getattr(response, "usage", None)),
+            )
+
+        response = client.messages.create(
+            model=model,
+            system=system_prompt,
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=max_tokens,
+            temperature=SUMMARY_TEMPERATURE,
+        )
+        return (
+            extract_anthropic_text(response),
+            extract_anthropic_usage(getattr(response, "usage", None)),
+        )
+
+    return complete
+
+
+def _add_usage(total, usage):
+    if usage is None:
+        return total
+    return usage if total is None else total + usage
+
+
+def summarize_transcript(
+    transcript_text: str,
+    complete: Callable[[str, str, int | None], tuple],
+    *,
+    single_shot_token_limit: int = DEFAULT_SINGLE_SHOT_TOKEN_LIMIT,
+    chunk_tokens: int = DEFAULT_CHUNK_TOKENS,
+    executor=None,
+) -> tuple[str, object, str]:
+    """Summarize a transcript in one call, or map-reduce it when it is too long.
+
+    ``complete(system_prompt, user_prompt, max_tokens)`` makes one provider
+    call and returns ``(text, usage)``; ``max_tokens=None`` keeps the
+    caller's default. Chunk summaries run in parallel on ``executor`` and
+    are merged in order. Returns ``(summary, total_usage, mode)`` where
+    mode is "single" or "map_reduce".
+    """
+    if estimate_tokens(transcript_text) <= single_shot_token_limit:
+        text, usage = complete(
+            SUMMARY_SYSTEM_PROMPT, SUMMARY_PROMPT_PREFIX + transcript_text, None
+        )
+        return text, usage, "single"
+
+    executor = executor or _SUMMARY_MAP_EXECUTOR
+    total_usage = None
+    parts = chunk_transcript(transcript_text, chunk_tokens)
+    # Reduce in rounds so a very long interview never produces a merge
+    # prompt that is itself over the limit.
+    while True:
+        futures = [
+            executor.submit(
+                complete,
+                SUMMARY_SYSTEM_PROMPT,
+                CHUNK_SUMMARY_PROMPT_PREFIX.format(index=index, total=len(parts)) + part,
+                CHUNK_SUMMARY_MAX_TOKENS,
+            )
+            for index, part in enumerate(parts, start=1)
+        ]
+        partial_summaries = []
+        for future in futures:
+            text, usage = future.result()
+            partial_summaries.append(text.strip())
+            total_usage = _add_usage(total_usage, usage)
+
+        labelled = [
+            f"Part {index}:\n{summary}\n\n"
+            for index, summary in enumerate(partial_summaries, start=1)
+        ]
+        merged = "".join(labelled)
+        if len(parts) == 1 or estimate_tokens(merged) <= single_shot_token_limit:
+            break
+        grouped = _group_by_tokens(labelled, chunk_tokens)
+        if len(grouped) >= len(parts):
+            break
+        parts = grouped
+
+    text, usage = complete(SUMMARY_SYSTEM_PROMPT, REDUCE_PROMPT_PREFIX + merged, None)
+    return text, _add_usage(total_usage, usage), "map_reduce"
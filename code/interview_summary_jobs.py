@@ -0,0 +1,82 @@
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable
+
+
+DEFAULT_SUMMARY_JOB_ATTEMPTS = 3
+SUMMARY_RETRY_BASE_SECONDS = 5.0
+SUMMARY_STATUSES = ("pending", "running", "retrying", "done", "failed")
+
+# Module-level so queued jobs survive Streamlit reruns; the script itself is
+# re-executed on every interaction but imported modules are not.
+_SUMMARY_JOB_EXECUTOR = ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="summary-job"
+)
+
+
+@dataclass(frozen=True)
+class SummaryJob:
+    """Everything a worker needs to summarize one saved interview.
+
+    Built on the script thread at completion time, so the worker never reads
+    Streamlit session state or secrets.
+    """
+
+    interview_id: str
+    interview_type: str
+    timestamp: str
+    transcript_text: str
+
+
+def summary_retry_delay(attempt: int, base_seconds: float = SUMMARY_RETRY_BASE_SECONDS) -> float:
+    """Exponential backoff before retry ``attempt`` (1-based): 5s, 10s, 20s, ..."""
+    return base_seconds * 2 ** (attempt - 1)
+
+
+def run_summary_job(
+    job: SummaryJob,
+    *,
+    summarize: Callable[[str], tuple],
+    save_summary: Callable,
+    save_status: Callable,
+    max_attempts: int = DEFAULT_SUMMARY_JOB_ATTEMPTS,
+    sleep: Callable[[float], None] = time.sleep,
+) -> str:
+    """Generate and store one summary, retrying failures; returns the final status.
+
+    ``summarize(transcript_text)`` returns ``(summary_text, usage)`` and
+    ``save_summary(job, summary_text, usage)`` writes it (and marks the job
+    done). ``save_status(job, status, attempts=..., error=...)`` records
+    progress; a failure to record status never aborts the job.
+    """
+
+    def record(status: str, attempts: int, error: str = "") -> None:
+        try:
+            save_status(job, status, attempts=attempts, error=error)
+        except Exception as exc:
+            print(f"Summary status update failed for {job.interview_id}: {exc}")
+
+    last_error = ""
+    for attempt in range(1, max(max_attempts, 1) + 1):
+        record("running", attempt)
+        try:
+            summary_text, usage = summarize(job.transcript_text)
+            save_summary(job, summary_text, usage)
+            return "done"
+        except Exception as exc:
+            last_error = str(exc)
+            print(
+                f"Summary attempt {attempt} failed for {job.interview_id}: {last_error}"
+            )
+        if attempt < max_attempts:
+            record("retrying", attempt, last_error)
+            sleep(summary_retry_delay(attempt))
+
+    record("failed", max(max_attempts, 1), last_error)
+    return "failed"
+
+
+def submit_summary_job(job: SummaryJob, **kwargs) -> Future:
+    """Queue ``run_summary_job`` on the shared background worker pool."""
+    return _SUMMARY_JOB_EXECUTOR.submit(run_summary_job, job, **kwargs)
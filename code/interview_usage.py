@@ -0,0 +1,225 @@
+import json
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class TokenUsage:
+    """Token counts for one provider call, normalized across APIs.
+
+    ``input_tokens`` is the full prompt, including cache reads and writes;
+    ``reasoning_tokens`` are already counted in ``output_tokens``.
+    """
+
+    input_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    output_tokens: int = 0
+    reasoning_tokens: int = 0
+
+    @property
+    def cache_miss_tokens(self) -> int:
+        return max(self.input_tokens - self.cache_read_tokens, 0)
+
+    def __add__(self, other: "TokenUsage") -> "TokenUsage":
+        return TokenUsage(
+            input_tokens=self.input_tokens + other.input_tokens,
+            cache_read_tokens=self.cache_read_tokens + other.cache_read_tokens,
+            cache_write_tokens=self.cache_write_tokens + other.cache_write_tokens,
+            output_tokens=self.output_tokens + other.output_tokens,
+            reasoning_tokens=self.reasoning_tokens + other.reasoning_tokens,
+        )
+
+    def as_dict(self) -> dict:
+        return {
+            "input_tokens": self.input_tokens,
+            "cache_hit_tokens": self.cache_read_tokens,
+            "cache_miss_tokens": self.cache_miss_tokens,
+            "cache_write_tokens": self.cache_write_tokens,
+            "output_tokens": self.output_tokens,
+            "reasoning_tokens": self.reasoning_tokens,
+        }
+
+
+@dataclass(frozen=True)
+class ModelPrice:
+    """USD per million tokens."""
+
+    input: float
+    cached_input: float
+    output: float
+    cache_write: float | None = None
+
+
+# List prices in USD per million tokens. Models missing here get no cost;
+# add or correct entries with the MODEL_PRICES_JSON secret.
+MODEL_PRICES = {
+    "gpt-4o": ModelPrice(input=2.50, cached_input=1.25, output=10.00),
+    "gpt-4o-mini": ModelPrice(input=0.15, cached_input=0.075, output=0.60),
+    "gpt-4.1": ModelPrice(input=2.00, cached_input=0.50, output=8.00),
+    "gpt-4.1-mini": ModelPrice(input=0.40, cached_input=0.10, output=1.60),
+    "gpt-5": ModelPrice(input=1.25, cached_input=0.125, output=10.00),
+    "gpt-5-mini": ModelPrice(input=0.25, cached_input=0.025, output=2.00),
+    "gpt-5.4": ModelPrice(input=2.50, cached_input=0.25, output=15.00),
+    "gpt-5.4-mini": ModelPrice(input=0.75, cached_input=0.075, output=4.50),
+    "gpt-5.4-nano": ModelPrice(input=0.20, cached_input=0.02, output=1.25),
+    "qwen3.5-35b-a3b": ModelPrice(input=0.25, cached_input=0.25, output=2.00),
+    "claude-3-5-haiku": ModelPrice(
+        input=0.80, cached_input=0.08, output=4.00, cache_write=1.00
+    ),
+    "claude-3-5-sonnet": ModelPrice(
+        input=3.00, cached_input=0.30, output=15.00, cache_write=3.75
+    ),
+    "claude-sonnet-4": ModelPrice(
+        input=3.00, cached_input=0.30, output=15.00, cache_write=3.75
+    ),
+}
+
+# Session calls whose usage counts toward the interview's saved totals. The
+# post-interview summary is added separately when its job saves the summary.
+BILLABLE_USAGE_KINDS = ("chat", "context_summary")
+
+USAGE_TOTAL_KEYS = (
+    "input_tokens",
+    "cached_input_tokens",
+    "cache_write_tokens",
+    "output_tokens",
+    "reasoning_tokens",
+    "cost_usd",
+)
+
+
+def _usage_value(usage, name: str) -> int:
+    if usage is None:
+        return 0
+    value = usage.get(name) if isinstance(usage, dict) else getattr(usage, name, None)
+    return int(value or 0)
+
+
+def _usage_field(usage, name: str):
+    return usage.get(name) if isinstance(usage, dict) else getattr(usage, name, None)
+
+
+def extract_openai_usage(usage) -> TokenUsage | None:
+    """Read token counts from an OpenAI-compatible usage payload."""
+    if usage is None:
+        return None
+    prompt_details = _usage_field(usage, "prompt_tokens_details")
+    completion_details = _usage_field(usage, "completion_tokens_details")
+    return TokenUsage(
+        input_tokens=_usage_value(usage, "prompt_tokens"),
+        cache_read_tokens=_usage_value(prompt_details, "cached_tokens"),
+        cache_write_tokens=_usage_value(prompt_details, "cache_write_tokens"),
+        output_tokens=_usage_value(usage, "completion_tokens"),
+        reasoning_tokens=_usage_value(completion_details, "reasoning_tokens"),
+    )
+
+
+def extract_anthropic_usage(usage) -> TokenUsage | None:
+    """Read token counts from an Anthropic usage payload.
+
+    Anthropic reports uncached input separately from cache reads and writes,
+    so the three are summed to get the full prompt size.
+    """
+    if usage is None:
+        return None
+    cache_read_tokens = _usage_value(usage, "cache_read_input_tokens")
+    cache_write_tokens = _usage_value(usage, "cache_creation_input_tokens")
+    return TokenUsage(
+        input_tokens=(
+            _usage_value(usage, "input_tokens") + cache_read_tokens + cache_write_tokens
+        ),
+        cache_read_tokens=cache_read_tokens,
+        cache_write_tokens=cache_write_tokens,
+        output_tokens=_usage_value(usage, "output_tokens"),
+    )
+
+
+def load_model_prices(raw_overrides=None) -> dict[str, ModelPrice]:
+    """Return the price table with ``MODEL_PRICES_JSON`` entries merged on top.
+
+    The override is a JSON object mapping model names to objects with
+    ``input``, ``cached_input``, ``output`` and optional ``cache_write``.
+    """
+    prices = dict(MODEL_PRICES)
+    if not raw_overrides:
+        return prices
+    overrides = json.loads(raw_overrides) if isinstance(raw_overrides, str) else raw_overrides
+    for model_name, price in overrides.items():
+        prices[str(model_name).lower()] = ModelPrice(
+            input=float(price["input"]),
+            cached_input=float(price.get("cached_input", price["input"])),
+            output=float(price["output"]),
+            cache_write=(
+                float(price["cache_write"]) if price.get("cache_write") is not None else None
+            ),
+        )
+    return prices
+
+
+def resolve_model_price(model: str, prices=None) -> ModelPrice | None:
+    """Find the price entry for a model, ignoring vendor prefixes and date suffixes.
+
+    The longest matching key wins, so ``gpt-5.4-2026-03-05`` is priced as
+    ``gpt-5.4`` rather than ``gpt-5``; a dotted version with no entry of its
+    own (``gpt-5.5``) is left unpriced instead of borrowing another's price.
+    """
+    prices = MODEL_PRICES if prices is None else prices
+    name = (model or "").strip().lower()
+    candidates = [name]
+    if "/" in name:
+        candidates.append(name.split("/", 1)[1])
+    for candidate in candidates:
+        if candidate in prices:
+            return prices[candidate]
+    for candidate in candidates:
+        matches = [key for key in prices if candidate.startswith(f"{key}-")]
+        if matches:
+            return prices[max(matches, key=len)]
+    return None
+
+
+def estimate_cost_usd(model: str, usage: TokenUsage, prices=None) -> float | None:
+    """Return the USD cost of one call, or None when the model has no price."""
+    price = resolve_model_price(model, prices)
+    if price is None or usage is None:
+        return None
+    uncached_input = max(
+        usage.input_tokens - usage.cache_read_tokens - usage.cache_write_tokens, 0
+    )
+    cache_write_price = price.cache_write if price.cache_write is not None else price.input
+    cost = (
+        uncached_input * price.input
+        + usage.cache_read_tokens * price.cached_input
+        + usage.cache_write_tokens * cache_write_price
+        + usage.output_tokens * price.output
+    ) / 1_000_000
+    return round(cost, 6)
+
+
+def total_usage(entries) -> dict:
+    """Sum recorded usage entries into the per-interview totals that are persisted.
+
+    ``cost_usd`` is None when any entry could not be priced, so a partial
+    total is never mistaken for the full cost.
+    """
+    totals = {key: 0 for key in USAGE_TOTAL_KEYS}
+    totals["cost_usd"] = 0.0
+    for entry in entries:
+        totals["input_tokens"] += int(entry.get("input_tokens", 0) or 0)
+        totals["cached_input_tokens"] += int(entry.get("cache_hit_tokens", 0) or 0)
+        totals["cache_write_tokens"] += int(entry.get("cache_write_tokens", 0) or 0)
+        totals["output_tokens"] += int(entry.get("output_tokens", 0) or 0)
+        totals["reasoning_tokens"] += int(entry.get("reasoning_tokens", 0) or 0)
+        if totals["cost_usd"] is not None:
+            cost = entry.get("cost_usd")
+            totals["cost_usd"] = None if cost is None else totals["cost_usd"] + cost
+    if totals["cost_usd"] is not None:
+        totals["cost_usd"] = round(totals["cost_usd"], 6)
+    return totals
+
+
+def interview_usage_totals(turn_usage) -> dict:
+    """Sum a session's billable ``turn_usage`` entries into interview totals."""
+    return total_usage(
+        entry for entry in turn_usage if entry.get("kind") in BILLABLE_USAGE_KINDS
+    )
@@ -0,0 +1,178 @@
+import importlib.util
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable
+
+
+CONFIG_DIRECTORY = Path(__file__).resolve().parent / "interview_configs"
+NON_INTERVIEW_CONFIG_MODULES = {"__init__", "base_config"}
+DEFAULT_WARMUP_INTERVAL_SECONDS = 240.0
+
+# Module-level so loaded configs and the warmup thread survive Streamlit
+# reruns; the script itself is re-executed on every interaction.
+_CONFIG_CACHE: dict[str, tuple[int, object]] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+
+def config_path(config_name: str) -> Path:
+    return CONFIG_DIRECTORY / f"{config_name}.py"
+
+
+def available_config_names() -> list[str]:
+    return sorted(
+        path.stem
+        for path in CONFIG_DIRECTORY.glob("*.py")
+        if path.stem not in NON_INTERVIEW_CONFIG_MODULES
+    )
+
+
+def load_interview_config(config_name: str):
+    """Return the config module, executing its file again only after it changes."""
+    path = config_path(config_name)
+    modified = path.stat().st_mtime_ns
+    with _CONFIG_CACHE_LOCK:
+        cached = _CONFIG_CACHE.get(config_name)
+        if cached is not None and cached[0] == modified:
+            return cached[1]
+
+        spec = importlib.util.spec_from_file_location("config", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _CONFIG_CACHE[config_name] = (modified, module)
+        return module
+
+
+def preload_interview_configs() -> list[str]:
+    """Load every interview config so no session pays for the first import."""
+    names = available_config_names()
+    for name in names:
+        load_interview_config(name)
+    return names
+
+
+@dataclass(frozen=True)
+class WarmupStepResult:
+    name: str
+    ok: bool
+    seconds: float
+    error: str = ""
+
+
+class WarmupRunner:
+    """Run named warmup steps once at startup and again on every keepalive tick.
+
+    ``ready`` is True once the latest pass finished with every step
+    succeeding; a failed step is retried on the next tick.
+    """
+
+    def __init__(self, *, clock=time.monotonic, wall_clock=time.time):
+        self.clock = clock
+        self.wall_clock = wall_clock
+        self.steps: dict[str, Callable] = {}
+        self.interval_seconds = DEFAULT_WARMUP_INTERVAL_SECONDS
+        self.results: list[WarmupStepResult] = []
+        self.runs = 0
+        self.last_run_at = None
+        self.ready = False
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def _run_step(self, name: str, step: Callable) -> WarmupStepResult:
+        started = self.clock()
+        try:
+            step()
+        except Exception as exc:
+            return WarmupStepResult(name, False, round(self.clock() - started, 3), str(exc))
+        return WarmupStepResult(name, True, round(self.clock() - started, 3))
+
+    def run_once(self) -> list[WarmupStepResult]:
+        """Run every step concurrently so one slow connect does not delay the rest."""
+        with self._lock:
+            steps = dict(self.steps)
+        if steps:
+            with ThreadPoolExecutor(
+                max_workers=len(steps), thread_name_prefix="warmup"
+            ) as executor:
+                results = list(
+                    executor.map(lambda item: self._run_step(*item), steps.items())
+                )
+        else:
+            results = []
+        with self._lock:
+            self.results = results
+            self.runs += 1
+            self.last_run_at = self.wall_clock()
+            self.ready = all(result.ok for result in results)
+        for result in results:
+            if not result.ok:
+                print(f"Warmup step {result.name} failed: {result.error}")
+        return results
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            self.run_once()
+            if self.interval_seconds <= 0 or self._stop.wait(self.interval_seconds):
+                return
+
+    def ensure_started(self, steps: dict[str, Callable], interval_seconds: float) -> None:
+        """Start the background warmup once; later calls only refresh its steps."""
+        with self._lock:
+            self.steps = dict(steps)
+            self.interval_seconds = interval_seconds
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(
+                target=self._loop, name="interview-warmup", daemon=True
+            )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def status(self) -> dict:
+        with self._lock:
+            return {
+                "ready": self.ready,
+                "runs": self.runs,
+                "last_run_at": self.last_run_at,
+                "steps": [asdict(result) for result in self.results],
+            }
+
+
+_WARMUP = WarmupRunner()
+
+
+def resolve_warmup_interval(secrets) -> float:
+    """Seconds between keepalive passes (WARMUP_INTERVAL_SECONDS; 0 runs only at startup)."""
+    try:
+        return max(
+            float(secrets.get("WARMUP_INTERVAL_SECONDS", DEFAULT_WARMUP_INTERVAL_SECONDS)),
+            0.0,
+        )
+    except (TypeError, ValueError):
+        return DEFAULT_WARMUP_INTERVAL_SECONDS
+
+
+def ensure_warmup(steps: dict[str, Callable], interval_seconds: float) -> None:
+    _WARMUP.ensure_started(steps, interval_seconds)
+
+
+def is_warm() -> bool:
+    return _WARMUP.ready
+
+
+def get_warmup_status() -> dict:
+    return _WARMUP.status()
+
+
+def reset_warmup() -> None:
+    """Stop the keepalive thread and forget its state; used by tests."""
+    global _WARMUP
+    _WARMUP.stop()
+    _WARMUP = WarmupRunner()
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE.clear()
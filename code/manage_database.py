@@ -0,0 +1,175 @@
+import argparse
+import json
+
+from database import backfill_latest_summaries, get_storage_backend
+from database_maintenance import (
+    DEFAULT_ABANDONED_AFTER_HOURS,
+    DEFAULT_ANALYSIS_LIMIT,
+    DEFAULT_CHECKPOINT_RETENTION_DAYS,
+    DEFAULT_INCREMENTAL_VACUUM_PAGES,
+    DEFAULT_MAX_SECONDS,
+    DEFAULT_MAX_VACUUM_BYTES,
+    INTEGRITY_CHECK_MODES,
+    abandoned_interviews_report,
+    archive_checkpoints,
+    pending_summaries_report,
+    run_maintenance,
+)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Run one-off and scheduled jobs against the interview database."
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print results as JSON instead of plain text.",
+    )
+    parser.add_argument(
+        "--shard",
+        default="",
+        help="Run against one shard file (e.g. 2025-2026) instead of interviews.db.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser(
+        "backfill-summaries",
+        help="Populate latest_summaries from the full interview history.",
+    )
+
+    maintain_parser = subparsers.add_parser(
+        "maintain",
+        help="Run ANALYZE, incremental VACUUM and an integrity check within budgets.",
+    )
+    maintain_parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=DEFAULT_MAX_SECONDS,
+        help="Skip remaining steps once this much time has been spent.",
+    )
+    maintain_parser.add_argument(
+        "--max-vacuum-mb",
+        type=float,
+        default=DEFAULT_MAX_VACUUM_BYTES / (1024 * 1024),
+        help="Largest database that may be fully VACUUMed to enable incremental auto_vacuum.",
+    )
+    maintain_parser.add_argument(
+        "--incremental-pages",
+        type=int,
+        default=DEFAULT_INCREMENTAL_VACUUM_PAGES,
+        help="Maximum free pages to release per run (0 disables the step).",
+    )
+    maintain_parser.add_argument(
+        "--analysis-limit",
+        type=int,
+        default=DEFAULT_ANALYSIS_LIMIT,
+        help="Rows sampled per index by ANALYZE.",
+    )
+    maintain_parser.add_argument(
+        "--integrity-check",
+        choices=INTEGRITY_CHECK_MODES,
+        default="quick",
+        help="Which integrity check to run.",
+    )
+
+    archive_parser = subparsers.add_parser(
+        "archive-checkpoints",
+        help="Archive completed and expired checkpoints, then prune them.",
+    )
+    archive_parser.add_argument(
+        "--older-than-days",
+        type=float,
+        default=DEFAULT_CHECKPOINT_RETENTION_DAYS,
+        help="Archive unfinished checkpoints not updated for this many days.",
+    )
+    archive_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only count the checkpoints that would be archived.",
+    )
+
+    report_parser = subparsers.add_parser(
+        "abandoned-report",
+        help="List checkpoints that never became completed interviews.",
+    )
+    report_parser.add_argument(
+        "--older-than-hours",
+        type=float,
+        default=DEFAULT_ABANDONED_AFTER_HOURS,
+        help="Only include checkpoints idle for at least this many hours.",
+    )
+    report_parser.add_argument(
+        "--limit",
+        type=int,
+        default=50,
+        help="How many rows to return.",
+    )
+
+    pending_parser = subparsers.add_parser(
+        "pending-summaries",
+        help="List completed interviews whose background summary is unfinished or failed.",
+    )
+    pending_parser.add_argument(
+        "--limit",
+        type=int,
+        default=50,
+        help="How many rows to return.",
+    )
+    return parser
+
+
+def print_result(result: dict, as_json=False):
+    if as_json:
+        print(json.dumps(result, indent=2))
+        return
+
+    for key, value in result.items():
+        if isinstance(value, list):
+            for item in value:
+                print(f"{key}\t" + "\t".join(str(part) for part in item.values()))
+        elif isinstance(value, dict):
+            for sub_key, sub_value in value.items():
+                print(f"{key}.{sub_key}\t{sub_value}")
+        else:
+            print(f"{key}\t{value}")
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    shard_key = args.shard or None
+    backend = get_storage_backend(shard_key=shard_key)
+
+    if args.command == "backfill-summaries":
+        result = {"latest_summaries": backfill_latest_summaries(shard_key)}
+    elif args.command == "maintain":
+        result = run_maintenance(
+            backend,
+            max_seconds=args.max_seconds,
+            max_vacuum_bytes=int(args.max_vacuum_mb * 1024 * 1024),
+            incremental_vacuum_pages=args.incremental_pages,
+            analysis_limit=args.analysis_limit,
+            integrity_check=args.integrity_check,
+        ).as_dict()
+    elif args.command == "archive-checkpoints":
+        result = archive_checkpoints(
+            backend,
+            retention_days=args.older_than_days,
+            dry_run=args.dry_run,
+        )
+    elif args.command == "abandoned-report":
+        result = {
+            "abandoned": abandoned_interviews_report(
+                backend,
+                older_than_hours=args.older_than_hours,
+                limit=args.limit,
+            )
+        }
+
+    elif args.command == "pending-summaries":
+        result = {"pending": pending_summaries_report(backend, limit=args.limit)}
+
+    print_result(result, as_json=args.json)
+
+
+if __name__ == "__main__":
+    main()
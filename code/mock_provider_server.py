@@ -0,0 +1,453 @@
+import argparse
+import itertools
+import json
+import random
+import threading
+import time
+from dataclasses import asdict, dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from interview_context import estimate_tokens
+
+
+DEFAULT_MOCK_HOST = "127.0.0.1"
+DEFAULT_MOCK_PORT = 8765
+MOCK_REPLY_WORDS = (
+    "Thanks for sharing that. Could you tell me a bit more about what happened "
+    "next, who was involved, and what you would do differently next time?"
+).split()
+
+
+@dataclass(frozen=True)
+class MockProviderSettings:
+    """How the mock provider behaves; every request draws its faults independently."""
+
+    tokens_per_second: float = 40.0
+    ttft_seconds: float = 0.4
+    reply_tokens: int = 60
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after_seconds: float = 1.0
+    seed: int | None = None
+
+
+@dataclass
+class MockServerStats:
+    requests: int = 0
+    streamed: int = 0
+    errors: int = 0
+    rate_limited: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def build_mock_reply(reply_tokens: int) -> list[str]:
+    """Return the reply as one delta per word, the way providers stream it."""
+    words = itertools.islice(itertools.cycle(MOCK_REPLY_WORDS), max(reply_tokens, 1))
+    return [f"{word} " for word in words]
+
+
+def _prompt_tokens(payload: dict) -> int:
+    parts = [str(payload.get("system") or "")]
+    for message in payload.get("messages") or []:
+        content = message.get("content")
+        if isinstance(content, list):
+            parts.extend(str(block.get("text", "")) for block in content)
+        else:
+            parts.append(str(content or ""))
+    return estimate_tokens("".join(parts))
+
+
+class MockProviderHandler(BaseHTTPRequestHandler):
+    """Serve OpenAI ``/v1/chat/completions`` and Anthropic ``/v1/messages``, streamed or not."""
+
+    protocol_version = "HTTP/1.1"
+    server: "MockProviderHTTPServer"
+
+    def log_message(self, format, *args):
+        del format, args
+
+    def _send_json(self, status: int, body: dict, headers: dict | None = None) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _start_event_stream(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+    def _write_chunk(self, text: str) -> None:
+        data = text.encode("utf-8")
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+    def _end_event_stream(self) -> None:
+        self.wfile.write(b"0\r\n\r\n")
+        self.wfile.flush()
+
+    def do_GET(self):
+        if self.path.rstrip("/") in {"/stats", "/v1/stats"}:
+            self._send_json(200, self.server.stats_snapshot())
+        elif self.path.rstrip("/") == "/health":
+            self._send_json(200, {"status": "ok"})
+        else:
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+
+    def do_HEAD(self):
+        # Clients preconnect with a HEAD to the base URL; answer it on a kept-alive connection.
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        path = self.path.split("?", 1)[0].rstrip("/")
+        if path.endswith("/chat/completions"):
+            api = "openai"
+        elif path.endswith("/messages"):
+            api = "anthropic"
+        else:
+            self._send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+            return
+
+        self.server.begin_request()
+        try:
+            fault = self.server.draw_fault()
+            if fault == "rate_limited":
+                self._send_error(api, 429, "rate_limit_error", "Mock rate limit exceeded.")
+            elif fault == "error":
+                self._send_error(api, 500, "api_error", "Mock upstream failure.")
+            elif api == "openai":
+                self._serve_openai(payload)
+            else:
+                self._serve_anthropic(payload)
+        finally:
+            self.server.end_request()
+
+    def _send_error(self, api: str, status: int, error_type: str, message: str) -> None:
+        headers = {}
+        if status == 429:
+            headers["Retry-After"] = f"{self.server.settings.retry_after_seconds:g}"
+        if api == "anthropic":
+            body = {"type": "error", "error": {"type": error_type, "message": message}}
+        else:
+            body = {"error": {"type": error_type, "message": message, "code": status}}
+        self._send_json(status, body, headers)
+
+    def _paced_deltas(self):
+        settings = self.server.settings
+        time.sleep(max(settings.ttft_seconds, 0.0))
+        interval = 1 / settings.tokens_per_second if settings.tokens_per_second > 0 else 0.0
+        for index, delta in enumerate(build_mock_reply(settings.reply_tokens)):
+            if index and interval:
+                time.sleep(interval)
+            yield delta
+
+    def _serve_openai(self, payload: dict) -> None:
+        model = payload.get("model", "mock-model")
+        completion_id = f"chatcmpl-mock-{self.server.next_id()}"
+        created = int(time.time())
+        prompt_tokens = _prompt_tokens(payload)
+        deltas = list(self._paced_deltas()) if not payload.get("stream") else None
+
+        if deltas is not None:
+            self._send_json(
+                200,
+                {
+                    "id": completion_id,
+                    "object": "chat.completion",
+                    "created": created,
+                    "model": model,
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": "".join(deltas).strip()},
+                            "finish_reason": "stop",
+                        }
+                    ],
+                    "usage": {
+                        "prompt_tokens": prompt_tokens,
+                        "completion_tokens": len(deltas),
+                        "total_tokens": prompt_tokens + len(deltas),
+                    },
+                },
+            )
+            return
+
+        def chunk(choices, **extra) -> str:
+            body = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": choices,
+                **extra,
+            }
+            return f"data: {json.dumps(body)}\n\n"
+
+        self.server.count_streamed()
+        self._start_event_stream()
+        completion_tokens = 0
+        for delta in self._paced_deltas():
+            completion_tokens += 1
+            self._write_chunk(
+                chunk([{"index": 0, "delta": {"role": "assistant", "content": delta}, "finish_reason": None}])
+            )
+        self._write_chunk(chunk([{"index": 0, "delta": {}, "finish_reason": "stop"}]))
+        if (payload.get("stream_options") or {}).get("include_usage"):
+            self._write_chunk(
+                chunk(
+                    [],
+                    usage={
+                        "prompt_tokens": prompt_tokens,
+                        "completion_tokens": completion_tokens,
+                        "total_tokens": prompt_tokens + completion_tokens,
+                    },
+                )
+            )
+        self._write_chunk("data: [DONE]\n\n")
+        self._end_event_stream()
+
+    def _serve_anthropic(self, payload: dict) -> None:
+        model = payload.get("model", "mock-model")
+        message_id = f"msg_mock_{self.server.next_id()}"
+        input_tokens = _prompt_tokens(payload)
+
+        if not payload.get("stream"):
+            deltas = list(self._paced_deltas())
+            self._send_json(
+                200,
+                {
+                    "id": message_id,
+                    "type": "message",
+                    "role": "assistant",
+                    "model": model,
+                    "content": [{"type": "text", "text": "".join(deltas).strip()}],
+                    "stop_reason": "end_turn",
+                    "stop_sequence": None,
+                    "usage": {"input_tokens": input_tokens, "output_tokens": len(deltas)},
+                },
+            )
+            return
+
+        def event(name: str, body: dict) -> str:
+            return f"event: {name}\ndata: {json.dumps({'type': name, **body})}\n\n"
+
+        self.server.count_streamed()
+        self._start_event_stream()
+        self._write_chunk(
+            event(
+                "message_start",
+                {
+                    "message": {
+                        "id": message_id,
+                        "type": "message",
+                        "role": "assistant",
+                        "model": model,
+                        "content": [],
+                        "stop_reason": None,
+                        "stop_sequence": None,
+                        "usage": {"input_tokens": input_tokens, "output_tokens": 1},
+                    }
+                },
+            )
+        )
+        self._write_chunk(
+            event("content_block_start", {"index": 0, "content_block": {"type": "text", "text": ""}})
+        )
+        output_tokens = 0
+        for delta in self._paced_deltas():
+            output_tokens += 1
+            self._write_chunk(
+                event(
+                    "content_block_delta",
+                    {"index": 0, "delta": {"type": "text_delta", "text": delta}},
+                )
+            )
+        self._write_chunk(event("content_block_stop", {"index": 0}))
+        self._write_chunk(
+            event(
+                "message_delta",
+                {
+                    "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                    "usage": {"output_tokens": output_tokens},
+                },
+            )
+        )
+        self._write_chunk(event("message_stop", {}))
+        self._end_event_stream()
+
+
+class MockProviderHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, settings: MockProviderSettings):
+        super().__init__(address, MockProviderHandler)
+        self.settings = settings
+        self.stats = MockServerStats()
+        self._lock = threading.Lock()
+        self._random = random.Random(settings.seed)
+        self._ids = itertools.count(1)
+
+    def next_id(self) -> int:
+        with self._lock:
+            return next(self._ids)
+
+    def draw_fault(self) -> str | None:
+        with self._lock:
+            roll = self._random.random()
+            if roll < self.settings.rate_limit_rate:
+                self.stats.rate_limited += 1
+                return "rate_limited"
+            if roll < self.settings.rate_limit_rate + self.settings.error_rate:
+                self.stats.errors += 1
+                return "error"
+            return None
+
+    def begin_request(self) -> None:
+        with self._lock:
+            self.stats.requests += 1
+            self.stats.in_flight += 1
+            self.stats.max_in_flight = max(self.stats.max_in_flight, self.stats.in_flight)
+
+    def end_request(self) -> None:
+        with self._lock:
+            self.stats.in_flight -= 1
+
+    def count_streamed(self) -> None:
+        with self._lock:
+            self.stats.streamed += 1
+
+    def stats_snapshot(self) -> dict:
+        with self._lock:
+            return {**self.stats.as_dict(), "settings": asdict(self.settings)}
+
+
+class MockProviderServer:
+    """Run the mock provider on a background thread, e.g. inside tests or benchmarks."""
+
+    def __init__(
+        self,
+        settings: MockProviderSettings | None = None,
+        *,
+        host: str = DEFAULT_MOCK_HOST,
+        port: int = 0,
+    ):
+        self.httpd = MockProviderHTTPServer((host, port), settings or MockProviderSettings())
+        self._thread = None
+
+    @property
+    def root_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def base_url(self) -> str:
+        """The OpenAI-compatible base URL; Anthropic clients use ``root_url``."""
+        return f"{self.root_url}/v1"
+
+    def start(self) -> "MockProviderServer":
+        self._thread = threading.Thread(
+            target=self.httpd.serve_forever, name="mock-provider", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> "MockProviderServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description=(
+            "Serve a local OpenAI-compatible and Anthropic-style mock provider with "
+            "configurable latency, token rate, errors and 429s for offline load tests."
+        )
+    )
+    parser.add_argument("--host", default=DEFAULT_MOCK_HOST, help="Interface to bind.")
+    parser.add_argument("--port", type=int, default=DEFAULT_MOCK_PORT, help="Port to bind.")
+    parser.add_argument(
+        "--tokens-per-second",
+        type=float,
+        default=MockProviderSettings.tokens_per_second,
+        help="Streaming rate after the first token (0 sends all tokens at once).",
+    )
+    parser.add_argument(
+        "--ttft-seconds",
+        type=float,
+        default=MockProviderSettings.ttft_seconds,
+        help="Delay before the first token.",
+    )
+    parser.add_argument(
+        "--reply-tokens",
+        type=int,
+        default=MockProviderSettings.reply_tokens,
+        help="Tokens (words) per reply.",
+    )
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=MockProviderSettings.error_rate,
+        help="Fraction of requests answered with HTTP 500.",
+    )
+    parser.add_argument(
+        "--rate-limit-rate",
+        type=float,
+        default=MockProviderSettings.rate_limit_rate,
+        help="Fraction of requests answered with HTTP 429.",
+    )
+    parser.add_argument(
+        "--retry-after-seconds",
+        type=float,
+        default=MockProviderSettings.retry_after_seconds,
+        help="Retry-After sent with injected 429s.",
+    )
+    parser.add_argument("--seed", type=int, default=None, help="Seed for fault injection.")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    settings = MockProviderSettings(
+        tokens_per_second=args.tokens_per_second,
+        ttft_seconds=args.ttft_seconds,
+        reply_tokens=args.reply_tokens,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after_seconds=args.retry_after_seconds,
+        seed=args.seed,
+    )
+    httpd = MockProviderHTTPServer((args.host, args.port), settings)
+    host, port = httpd.server_address[:2]
+    print(f"Mock provider listening on http://{host}:{port} (OpenAI base URL http://{host}:{port}/v1)")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
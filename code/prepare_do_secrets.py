@@ -37,6 +37,41 @@ STRING_KEYS = [
     "OPENROUTER_INDUSTRY_MODEL",
     "OPENROUTER_INDUSTRY_REASONING_EFFORT",
     "OPENROUTER_REASONING_MAX_TOKENS",
+    "SUMMARY_MODEL",
+    "SUMMARY_MODEL_INDUSTRY_ORG_SURVEY",
+    "SUMMARY_MAX_TOKENS",
+    "SUMMARY_REASONING_EFFORT",
+    "PROVIDER_FAILOVER_CHAIN",
+    "FAILOVER_TTFT_SECONDS",
+    "FAILOVER_TIMEOUT_SECONDS",
+    "DEEPINFRA_MODEL",
+    "OPENAI_MODEL",
+    "ANTHROPIC_MODEL",
+    "PROVIDER_MAX_CONCURRENCY",
+    "OPENAI_MAX_CONCURRENCY",
+    "DEEPINFRA_MAX_CONCURRENCY",
+    "OPENROUTER_MAX_CONCURRENCY",
+    "ANTHROPIC_MAX_CONCURRENCY",
+    "PROVIDER_QUEUE_TIMEOUT_SECONDS",
+    "OPENAI_REQUESTS_PER_MINUTE",
+    "OPENAI_TOKENS_PER_MINUTE",
+    "DEEPINFRA_REQUESTS_PER_MINUTE",
+    "DEEPINFRA_TOKENS_PER_MINUTE",
+    "OPENROUTER_REQUESTS_PER_MINUTE",
+    "OPENROUTER_TOKENS_PER_MINUTE",
+    "ANTHROPIC_REQUESTS_PER_MINUTE",
+    "ANTHROPIC_TOKENS_PER_MINUTE",
+    "RATE_LIMITS_JSON",
+    "OPENAI_BASE_URL",
+    "DEEPINFRA_BASE_URL",
+    "OPENROUTER_BASE_URL",
+    "ANTHROPIC_BASE_URL",
+    "REASONING_POLICY",
+    "REASONING_TTFT_P95_SLO_MS",
+    "REASONING_TOTAL_P95_SLO_MS",
+    "REASONING_SLO_WINDOW_SECONDS",
+    "REASONING_SLO_MIN_SAMPLES",
+    "MODEL_PRICES_JSON",
     "TTS_MODEL",
     "TTS_VOICE",
     "EMAIL_PASSWORD",
@@ -46,11 +81,17 @@ STRING_KEYS = [
     "REMOTE_SSH_USERNAME",
     "REMOTE_SSH_KEY",
     "REMOTE_DATABASE_DIRECTORY",
+    "DATABASE_BACKEND",
+    "LOCAL_DATABASE_DIRECTORY",
+    "DATABASE_SHARDING",
+    "ACADEMIC_YEAR_START_MONTH",
+    "DATABASE_SHARD_LOOKBACK_YEARS",
+    "WARMUP_INTERVAL_SECONDS",
 ]
 
 # Keys whose values must be rendered as TOML booleans, not strings. A quoted
 # string like "false" would be truthy in Python, so these must be real booleans.
-BOOLEAN_KEYS = ["USE_LIACS_EMAIL", "EMAIL_FALLBACK_TO_GMAIL"]
+BOOLEAN_KEYS = ["USE_LIACS_EMAIL", "EMAIL_FALLBACK_TO_GMAIL", "SSH_CONNECTION_POOL"]
 
 _TRUE_VALUES = {"1", "true", "yes", "on"}
 
@@ -1,8 +1,10 @@
 import base64
+import hashlib
 import json
 import os
 import shlex
 import tempfile
+import threading
 import time
 from dataclasses import dataclass
 
@@ -14,6 +16,13 @@ from secrets_utils import get_secret
 DEFAULT_SSH_HOST = "ssh.liacs.nl"
 SSH_TIMEOUT_SECONDS = 15
 SSH_CONNECT_RETRIES = 2
+SSH_KEEPALIVE_SECONDS = 30
+
+# Module-level so the pooled connection survives Streamlit reruns and is
+# shared by every session; paramiko multiplexes concurrent commands as
+# separate channels over one transport.
+_SSH_POOL: dict[tuple, object] = {}
+_SSH_POOL_LOCK = threading.Lock()
 
 
 @dataclass(frozen=True)
@@ -140,6 +149,61 @@ def close_ssh_connection(ssh, tmp_key_path: str | None) -> None:
             os.remove(tmp_key_path)
 
 
+def _ssh_transport_active(ssh) -> bool:
+    transport = ssh.get_transport() if ssh is not None else None
+    return bool(transport is not None and transport.is_active())
+
+
+def get_pooled_ssh_connection(timeout_seconds: int | None = None, retries: int | None = None):
+    """Return the process-wide SSH connection, reconnecting if its transport dropped.
+
+    Same return shape as ``get_ssh_connection``; the key file is removed as
+    soon as the connection is up, so the second item is always None.
+    """
+    settings = resolve_ssh_settings()
+    key = (
+        settings.host,
+        settings.username,
+        hashlib.sha256(settings.key.encode()).hexdigest(),
+    )
+    with _SSH_POOL_LOCK:
+        ssh = _SSH_POOL.get(key)
+        if _ssh_transport_active(ssh):
+            return ssh, None
+        if ssh is not None:
+            close_ssh_connection(ssh, None)
+
+        ssh, tmp_key_path = get_ssh_connection(timeout_seconds, retries)
+        close_ssh_connection(None, tmp_key_path)
+        ssh.get_transport().set_keepalive(SSH_KEEPALIVE_SECONDS)
+        _SSH_POOL[key] = ssh
+        return ssh, None
+
+
+def release_pooled_ssh_connection(ssh, tmp_key_path: str | None) -> None:
+    """Keep a pooled connection open for the next caller; drop it once it has died."""
+    close_ssh_connection(None, tmp_key_path)
+    if _ssh_transport_active(ssh):
+        return
+    with _SSH_POOL_LOCK:
+        for key, pooled in list(_SSH_POOL.items()):
+            if pooled is ssh:
+                del _SSH_POOL[key]
+    close_ssh_connection(ssh, None)
+
+
+def close_ssh_pool() -> None:
+    """Close every pooled SSH connection."""
+    with _SSH_POOL_LOCK:
+        connections = list(_SSH_POOL.values())
+        _SSH_POOL.clear()
+    for ssh in connections:
+        try:
+            close_ssh_connection(ssh, None)
+        except Exception:
+            pass
+
+
 def ensure_remote_directory(ssh, remote_directory: str) -> None:
     """Create a remote directory if it does not exist."""
     mkdir_cmd = f"mkdir -p {shlex.quote(remote_directory)}"
@@ -209,11 +273,23 @@ def run_remote_sql_batch(ssh, db_path: str, operations: list[dict]):
     python_code = f"""
 import base64
 import json
+import os
 import re
 import sqlite3
+import zlib
 
 payload = json.loads(base64.b64decode({encoded_payload!r}).decode())
 conn = sqlite3.connect(payload["db_path"])
+conn.create_function(
+    "zlib_compress",
+    1,
+    lambda value: None if value is None else zlib.compress(str(value).encode("utf-8")),
+)
+conn.create_function(
+    "zlib_decompress",
+    1,
+    lambda value: None if value is None else zlib.decompress(value).decode("utf-8"),
+)
 cursor = conn.cursor()
 results = []
 
@@ -242,6 +318,40 @@ for operation in payload["operations"]:
                 cursor.execute(
                     f"ALTER TABLE {{table_name}} ADD COLUMN {{column_name}} {{column_type}}"
                 )
+    elif op_type == "attach_existing":
+        attached = {{row[1] for row in cursor.execute("PRAGMA database_list")}}
+        for schema, path in operation["databases"]:
+            validate_identifier(schema, "schema")
+            if schema not in attached and os.path.isfile(path):
+                cursor.execute(f"ATTACH DATABASE ? AS {{schema}}", [path])
+    elif op_type == "federated_view":
+        table_name = validate_identifier(operation["table"], "table")
+        columns = [validate_identifier(column, "column") for column in operation["columns"]]
+        selects = []
+        for row in cursor.execute("PRAGMA database_list").fetchall():
+            schema = row[1]
+            if schema == "temp":
+                continue
+            existing_column_names = {{
+                info[1]
+                for info in cursor.execute(
+                    f"PRAGMA {{schema}}.table_info({{table_name}})"
+                ).fetchall()
+            }}
+            if existing_column_names:
+                selects.append(
+                    "SELECT "
+                    + ", ".join(
+                        column if column in existing_column_names else f"NULL AS {{column}}"
+                        for column in columns
+                    )
+                    + f" FROM {{schema}}.{{table_name}}"
+                )
+        if not selects:
+            selects.append(
+                "SELECT " + ", ".join(f"NULL AS {{column}}" for column in columns) + " WHERE 0"
+            )
+        cursor.execute(f"CREATE TEMP VIEW {{table_name}} AS " + " UNION ALL ".join(selects))
     else:
         raise ValueError(f"Unsupported batch operation type: {{op_type!r}}")
 
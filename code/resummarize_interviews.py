@@ -0,0 +1,396 @@
+import argparse
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+from database import get_storage_backend, save_summary_results
+from database_maintenance import (
+    DEFAULT_BACKFILL_PAGE_SIZE,
+    SUMMARY_BACKFILL_MODES,
+    summary_backfill_candidates,
+)
+from interview_configs.base_config import MAX_OUTPUT_TOKENS
+from interview_provider import create_provider_runtime
+from interview_rate_limit import configure_rate_limits
+from interview_summary import build_summary_completion, summarize_transcript
+from interview_summary_jobs import DEFAULT_SUMMARY_JOB_ATTEMPTS, SummaryJob, run_summary_job
+from interview_usage import estimate_cost_usd, load_model_prices, total_usage
+from secrets_utils import load_local_secrets
+
+
+DEFAULT_CHECKPOINT_PATH = (
+    Path(__file__).resolve().parents[1] / "data" / "resummarize_checkpoint.json"
+)
+DEFAULT_WORKERS = 4
+DEFAULT_REQUESTS_PER_MINUTE = 60
+DEFAULT_WRITE_BATCH_SIZE = 10
+CHECKPOINT_SETTING_KEYS = ("mode", "interview_type", "shard")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description=(
+            "Generate summaries for saved interviews whose summary is missing or "
+            "failed, or re-summarize every interview after a prompt change."
+        )
+    )
+    parser.add_argument(
+        "--mode",
+        choices=SUMMARY_BACKFILL_MODES,
+        default="missing",
+        help="missing: empty or failed summaries only; all: every saved interview.",
+    )
+    parser.add_argument(
+        "--interview-type",
+        default="",
+        help="Only include interviews of this config (e.g. midterm_interview).",
+    )
+    parser.add_argument(
+        "--shard",
+        default="",
+        help="Run against one shard file (e.g. 2025-2026) instead of interviews.db.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="How many interviews to summarize concurrently.",
+    )
+    parser.add_argument(
+        "--requests-per-minute",
+        type=float,
+        default=DEFAULT_REQUESTS_PER_MINUTE,
+        help="Upper bound on provider calls started per minute (0 disables pacing).",
+    )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=DEFAULT_BACKFILL_PAGE_SIZE,
+        help="Rows read from the database per page; the checkpoint advances per page.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_WRITE_BATCH_SIZE,
+        help="Summaries written back per database transaction.",
+    )
+    parser.add_argument(
+        "--max-attempts",
+        type=int,
+        default=DEFAULT_SUMMARY_JOB_ATTEMPTS,
+        help="Attempts per interview before it is marked failed.",
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=0,
+        help="Stop after this many interviews (0 processes every candidate).",
+    )
+    parser.add_argument(
+        "--checkpoint-file",
+        default=str(DEFAULT_CHECKPOINT_PATH),
+        help="Where progress is saved so an interrupted run can resume.",
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Ignore an existing checkpoint and start from the first interview.",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print results as JSON instead of plain text.",
+    )
+    return parser
+
+
+class RequestPacer:
+    """Space provider calls evenly so concurrent workers stay under a per-minute limit."""
+
+    def __init__(self, requests_per_minute: float, *, clock=time.monotonic, sleep=time.sleep):
+        self.interval = 60.0 / requests_per_minute if requests_per_minute > 0 else 0.0
+        self.clock = clock
+        self.sleep = sleep
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if not self.interval:
+            return
+        with self._lock:
+            now = self.clock()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            self.sleep(slot - now)
+
+    def wrap(self, complete: Callable) -> Callable:
+        def paced_complete(system_prompt, prompt, max_tokens):
+            self.acquire()
+            return complete(system_prompt, prompt, max_tokens)
+
+        return paced_complete
+
+
+def load_checkpoint(path, settings: dict) -> dict:
+    """Return the saved progress for these settings, or a fresh state.
+
+    A finished checkpoint starts a new pass; one written with different
+    settings is refused so two backfills never share a cursor.
+    """
+    fresh = {**settings, "after_interview_id": "", "processed": 0, "done": 0, "failed": 0}
+    path = Path(path)
+    if not path.is_file():
+        return fresh
+    state = json.loads(path.read_text(encoding="utf-8"))
+    if state.get("finished"):
+        return fresh
+    mismatched = [
+        key for key in CHECKPOINT_SETTING_KEYS if state.get(key) != settings.get(key)
+    ]
+    if mismatched:
+        raise ValueError(
+            f"Checkpoint {path} was written with different {', '.join(mismatched)}; "
+            "pass --restart or another --checkpoint-file."
+        )
+    return {**fresh, **state}
+
+
+def save_checkpoint(path, state: dict) -> None:
+    """Write the checkpoint atomically so an interrupted run never leaves half a file."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = path.with_name(f"{path.name}.tmp")
+    temporary_path.write_text(json.dumps(state, indent=2), encoding="utf-8")
+    os.replace(temporary_path, path)
+
+
+def summarize_rows(
+    rows: list[dict],
+    *,
+    summarize_for: Callable[[str], tuple],
+    executor,
+    max_attempts: int = DEFAULT_SUMMARY_JOB_ATTEMPTS,
+    sleep: Callable[[float], None] = time.sleep,
+) -> list[dict]:
+    """Summarize one page of candidate rows concurrently; results keep the row order.
+
+    ``summarize_for(interview_type)`` returns ``(summary_model, summarize)``
+    for that config, where ``summarize(transcript)`` returns
+    ``(summary_text, usage)``. Intermediate statuses are not written: each
+    row ends up either "done" with its summary or "failed" with the error.
+    """
+
+    def run(row: dict) -> dict:
+        result = {"interview_id": row["interview_id"], "status": "failed"}
+        summary_model, summarize = summarize_for(row.get("interview_type") or "")
+
+        def save_summary(job, summary_text, usage):
+            result.update(
+                status="done",
+                summary=summary_text,
+                usage=usage,
+                summary_model=summary_model,
+            )
+
+        def save_status(job, status, *, attempts, error=""):
+            result.update(attempts=attempts, error=error)
+
+        run_summary_job(
+            SummaryJob(
+                interview_id=row["interview_id"],
+                interview_type=row.get("interview_type") or "",
+                timestamp=row.get("timestamp") or "",
+                transcript_text=row["transcript"],
+            ),
+            summarize=summarize,
+            save_summary=save_summary,
+            save_status=save_status,
+            max_attempts=max_attempts,
+            sleep=sleep,
+        )
+        return result
+
+    return list(executor.map(run, rows))
+
+
+def run_backfill(
+    *,
+    fetch_page: Callable,
+    summarize_for: Callable[[str], tuple],
+    write_results: Callable[[list[dict]], None],
+    checkpoint_path,
+    settings: dict,
+    workers: int = DEFAULT_WORKERS,
+    page_size: int = DEFAULT_BACKFILL_PAGE_SIZE,
+    batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+    limit: int = 0,
+    max_attempts: int = DEFAULT_SUMMARY_JOB_ATTEMPTS,
+    restart: bool = False,
+    sleep: Callable[[float], None] = time.sleep,
+    clock=time.monotonic,
+) -> dict:
+    """Stream candidate pages, summarize them concurrently, and write them back in groups.
+
+    ``fetch_page(after_interview_id, limit)`` returns the next candidate
+    rows ordered by interview_id. The checkpoint moves past a page only
+    after all of its results are written, so an interrupted run resumes at
+    the first page that was not fully saved.
+    """
+    state = (
+        {**settings, "after_interview_id": "", "processed": 0, "done": 0, "failed": 0}
+        if restart
+        else load_checkpoint(checkpoint_path, settings)
+    )
+    state["finished"] = False
+    started = clock()
+    processed_this_run = 0
+    with ThreadPoolExecutor(
+        max_workers=max(workers, 1), thread_name_prefix="resummarize"
+    ) as executor:
+        while not limit or processed_this_run < limit:
+            page_limit = page_size if not limit else min(page_size, limit - processed_this_run)
+            rows = fetch_page(state["after_interview_id"], page_limit)
+            if not rows:
+                state["finished"] = True
+                break
+            results = summarize_rows(
+                rows,
+                summarize_for=summarize_for,
+                executor=executor,
+                max_attempts=max_attempts,
+                sleep=sleep,
+            )
+            for start in range(0, len(results), max(batch_size, 1)):
+                write_results(results[start:start + max(batch_size, 1)])
+            done = sum(1 for result in results if result["status"] == "done")
+            processed_this_run += len(rows)
+            state.update(
+                after_interview_id=rows[-1]["interview_id"],
+                processed=state["processed"] + len(rows),
+                done=state["done"] + done,
+                failed=state["failed"] + len(rows) - done,
+            )
+            save_checkpoint(checkpoint_path, state)
+    save_checkpoint(checkpoint_path, state)
+    return {
+        **state,
+        "processed_this_run": processed_this_run,
+        "elapsed_seconds": round(clock() - started, 3),
+    }
+
+
+def build_summarizer_factory(secrets, pacer: RequestPacer, model_prices=None):
+    """Return ``summarize_for(interview_type)`` using the app's summary routing per config."""
+    summarizers = {}
+    lock = threading.Lock()
+
+    def summarize_for(interview_type: str):
+        with lock:
+            if interview_type not in summarizers:
+                runtime = create_provider_runtime(
+                    secrets, interview_type, MAX_OUTPUT_TOKENS
+                )
+                summarizers[interview_type] = _build_summarizer(
+                    runtime, pacer, model_prices
+                )
+            return summarizers[interview_type]
+
+    return summarize_for
+
+
+def _build_summarizer(runtime, pacer: RequestPacer, model_prices):
+    model = runtime.summary_selection.model
+    complete = pacer.wrap(
+        build_summary_completion(
+            runtime.provider, runtime.api, runtime.client, runtime.summary_selection
+        )
+    )
+
+    def summarize(transcript_text: str):
+        summary_text, usage, _ = summarize_transcript(transcript_text, complete)
+        if not summary_text:
+            raise ValueError("Summary generation returned no text.")
+        if usage is None:
+            return summary_text, None
+        return summary_text, total_usage(
+            [
+                {
+                    "kind": "summary",
+                    "provider": runtime.provider,
+                    "model": model,
+                    **usage.as_dict(),
+                    "cost_usd": estimate_cost_usd(model, usage, model_prices),
+                }
+            ]
+        )
+
+    return model, summarize
+
+
+def print_result(result: dict, as_json=False):
+    if as_json:
+        print(json.dumps(result, indent=2))
+        return
+
+    for key, value in result.items():
+        print(f"{key}\t{value}")
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    shard_key = args.shard or None
+    backend = get_storage_backend(shard_key=shard_key)
+    secrets = load_local_secrets()
+    settings = {
+        "mode": args.mode,
+        "interview_type": args.interview_type,
+        "shard": args.shard,
+    }
+
+    if not args.restart:
+        try:
+            load_checkpoint(args.checkpoint_file, settings)
+        except ValueError as exc:
+            parser.error(str(exc))
+    configure_rate_limits(secrets)
+
+    def fetch_page(after_interview_id, limit):
+        return summary_backfill_candidates(
+            backend,
+            mode=args.mode,
+            after_interview_id=after_interview_id,
+            interview_type=args.interview_type,
+            limit=limit,
+        )
+
+    result = run_backfill(
+        fetch_page=fetch_page,
+        summarize_for=build_summarizer_factory(
+            secrets,
+            RequestPacer(args.requests_per_minute),
+            load_model_prices(secrets.get("MODEL_PRICES_JSON")),
+        ),
+        write_results=lambda results: save_summary_results(
+            results, shard_key=shard_key
+        ),
+        checkpoint_path=args.checkpoint_file,
+        settings=settings,
+        workers=args.workers,
+        page_size=args.page_size,
+        batch_size=args.batch_size,
+        limit=args.limit,
+        max_attempts=args.max_attempts,
+        restart=args.restart,
+    )
+
+    print_result(result, as_json=args.json)
+
+
+if __name__ == "__main__":
+    main()
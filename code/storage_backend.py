@@ -0,0 +1,244 @@
+import re
+import sqlite3
+import zlib
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+from remote_utils import (
+    close_ssh_connection,
+    ensure_remote_directory,
+    get_ssh_connection,
+    run_remote_sql,
+    run_remote_sql_batch,
+)
+
+
+DATABASE_FILENAME = "interviews.db"
+DEFAULT_LOCAL_DATABASE_DIRECTORY = (
+    Path(__file__).resolve().parents[1] / "data" / "database"
+)
+LOCAL_SQLITE_TIMEOUT_SECONDS = 15
+STORAGE_BACKENDS = {"ssh", "local"}
+
+_IDENTIFIER_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+def _validate_identifier(identifier: str, kind: str) -> str:
+    if not _IDENTIFIER_PATTERN.fullmatch(identifier):
+        raise ValueError(f"Invalid {kind} identifier: {identifier!r}")
+    return identifier
+
+
+def register_sql_functions(conn) -> None:
+    """Register the helper SQL functions the remote batch runner also provides."""
+    conn.create_function(
+        "zlib_compress",
+        1,
+        lambda value: None if value is None else zlib.compress(str(value).encode("utf-8")),
+    )
+    conn.create_function(
+        "zlib_decompress",
+        1,
+        lambda value: None if value is None else zlib.decompress(value).decode("utf-8"),
+    )
+
+
+def _as_json_row(row):
+    return list(row) if row is not None else None
+
+
+def apply_sql_operations(cursor, operations: list[dict]) -> list:
+    """Apply batch operations locally with the same semantics as the remote runner."""
+    results = []
+    for operation in operations:
+        op_type = operation["type"]
+
+        if op_type == "execute":
+            cursor.execute(operation["sql_query"], operation.get("params", []))
+            fetch = operation.get("fetch")
+            if fetch == "one":
+                results.append(_as_json_row(cursor.fetchone()))
+            elif fetch == "all":
+                results.append([_as_json_row(row) for row in cursor.fetchall()])
+        elif op_type == "ensure_columns":
+            table_name = _validate_identifier(operation["table"], "table")
+            cursor.execute(f"PRAGMA table_info({table_name})")
+            existing_column_names = {row[1] for row in cursor.fetchall()}
+            for column_name, column_type in operation["columns"].items():
+                _validate_identifier(column_name, "column")
+                if column_name not in existing_column_names:
+                    cursor.execute(
+                        f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_type}"
+                    )
+        elif op_type == "attach_existing":
+            attached = {row[1] for row in cursor.execute("PRAGMA database_list")}
+            for schema, path in operation["databases"]:
+                _validate_identifier(schema, "schema")
+                if schema not in attached and Path(path).is_file():
+                    cursor.execute(f"ATTACH DATABASE ? AS {schema}", [path])
+        elif op_type == "federated_view":
+            table_name = _validate_identifier(operation["table"], "table")
+            columns = [
+                _validate_identifier(column, "column") for column in operation["columns"]
+            ]
+            selects = []
+            for row in cursor.execute("PRAGMA database_list").fetchall():
+                schema = row[1]
+                if schema == "temp":
+                    continue
+                existing_column_names = {
+                    info[1]
+                    for info in cursor.execute(
+                        f"PRAGMA {schema}.table_info({table_name})"
+                    ).fetchall()
+                }
+                if existing_column_names:
+                    selects.append(
+                        "SELECT "
+                        + ", ".join(
+                            column if column in existing_column_names else f"NULL AS {column}"
+                            for column in columns
+                        )
+                        + f" FROM {schema}.{table_name}"
+                    )
+            if not selects:
+                selects.append(
+                    "SELECT "
+                    + ", ".join(f"NULL AS {column}" for column in columns)
+                    + " WHERE 0"
+                )
+            cursor.execute(
+                f"CREATE TEMP VIEW {table_name} AS " + " UNION ALL ".join(selects)
+            )
+        else:
+            raise ValueError(f"Unsupported batch operation type: {op_type!r}")
+    return results
+
+
+@dataclass(frozen=True)
+class LocalSqliteBackend:
+    """Run interview-database operations against a SQLite file on this machine."""
+
+    directory: str
+    db_path: str
+    name: str = "local"
+
+    @contextmanager
+    def session(self, timeout=None, retries=None):
+        """Yield a reusable connection handle; local batches open their own."""
+        del timeout, retries
+        yield None
+
+    def _connect(self, timeout=None):
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=timeout or LOCAL_SQLITE_TIMEOUT_SECONDS,
+        )
+        register_sql_functions(conn)
+        return conn
+
+    def run_batch(
+        self,
+        operations: list[dict],
+        *,
+        ensure_directory=False,
+        timeout=None,
+        retries=None,
+        connection=None,
+    ) -> list:
+        del retries, connection
+        if ensure_directory:
+            Path(self.directory).mkdir(parents=True, exist_ok=True)
+
+        conn = self._connect(timeout)
+        try:
+            results = apply_sql_operations(conn.cursor(), operations)
+            conn.commit()
+            return results
+        finally:
+            conn.close()
+
+    def query(self, sql_query: str, params=None, fetch=None, *, connection=None):
+        del connection
+        results = self.run_batch(
+            [
+                {
+                    "type": "execute",
+                    "sql_query": sql_query,
+                    "params": params or [],
+                    "fetch": fetch,
+                }
+            ]
+        )
+        return results[0] if fetch else None
+
+
+@dataclass(frozen=True)
+class SshSqliteBackend:
+    """Run interview-database operations on the remote host over SSH."""
+
+    directory: str
+    db_path: str
+    connect: Callable = get_ssh_connection
+    close: Callable = close_ssh_connection
+    ensure_remote_dir: Callable = ensure_remote_directory
+    run_remote_batch: Callable = run_remote_sql_batch
+    run_remote_query: Callable = run_remote_sql
+    name: str = "ssh"
+
+    @contextmanager
+    def session(self, timeout=None, retries=None):
+        """Yield one SSH connection that several batches can share."""
+        ssh, tmp_key_path = self.connect(timeout_seconds=timeout, retries=retries)
+        try:
+            yield ssh
+        finally:
+            self.close(ssh, tmp_key_path)
+
+    def run_batch(
+        self,
+        operations: list[dict],
+        *,
+        ensure_directory=False,
+        timeout=None,
+        retries=None,
+        connection=None,
+    ) -> list:
+        if connection is not None:
+            if ensure_directory:
+                self.ensure_remote_dir(connection, self.directory)
+            return self.run_remote_batch(connection, self.db_path, operations)
+
+        ssh, tmp_key_path = self.connect(timeout_seconds=timeout, retries=retries)
+        try:
+            if ensure_directory:
+                self.ensure_remote_dir(ssh, self.directory)
+            return self.run_remote_batch(ssh, self.db_path, operations)
+        finally:
+            self.close(ssh, tmp_key_path)
+
+    def query(self, sql_query: str, params=None, fetch=None, *, connection=None):
+        if connection is not None:
+            return self.run_remote_query(
+                connection, self.db_path, sql_query, params, fetch=fetch
+            )
+
+        ssh, tmp_key_path = self.connect()
+        try:
+            return self.run_remote_query(
+                ssh, self.db_path, sql_query, params, fetch=fetch
+            )
+        finally:
+            self.close(ssh, tmp_key_path)
+
+
+def normalize_backend_name(raw_name) -> str:
+    """Normalize the configured storage backend, defaulting to SSH."""
+    backend_name = str(raw_name or "ssh").strip().lower() or "ssh"
+    if backend_name not in STORAGE_BACKENDS:
+        raise ValueError(
+            "Unrecognized DATABASE_BACKEND; supported values are ssh and local."
+        )
+    return backend_name
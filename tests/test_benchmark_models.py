@@ -0,0 +1,214 @@
+import pytest
+
+import benchmark_models
+import database
+import interview_async_provider
+import interview_rate_limit
+from benchmark_models import (
+    ReplayTarget,
+    ReplayTranscript,
+    REPLAY_SUMMARY_PLACEHOLDER,
+    build_replay_kwargs,
+    build_report,
+    create_target_runtime,
+    load_database_transcripts,
+    load_local_transcripts,
+    main,
+    parse_target,
+    parse_transcript,
+    replay_turns,
+    run_replay,
+)
+from interview_warmup import load_interview_config
+from interview_provider import clear_client_registry
+from mock_provider_server import MockProviderServer, MockProviderSettings
+
+
+TRANSCRIPT = (
+    "assistant: Welcome to the interview.\n"
+    "user: I worked on the data pipeline.\n"
+    "It took most of the term.\n"
+    "assistant: What was the hardest part?\n"
+    "user: Testing it.\n"
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_provider_state():
+    interview_async_provider.reset_limiters()
+    interview_rate_limit.reset_rate_limits()
+    yield
+    interview_async_provider.reset_limiters()
+    interview_rate_limit.reset_rate_limits()
+    clear_client_registry()
+
+
+def test_parse_target_and_transcript():
+    assert parse_target("OpenRouter=openai/gpt-5.4@Minimal") == ReplayTarget(
+        "openrouter", "openai/gpt-5.4", "minimal"
+    )
+    assert parse_target("deepinfra").label == "deepinfra"
+    with pytest.raises(ValueError, match="reasoning"):
+        parse_target("openai=gpt-4o@high")
+
+    messages = parse_transcript("Session ID: abc\n\n" + TRANSCRIPT)
+
+    assert [message["role"] for message in messages] == [
+        "assistant",
+        "user",
+        "assistant",
+        "user",
+    ]
+    assert messages[1]["content"] == "I worked on the data pipeline.\nIt took most of the term."
+
+
+def test_replay_turns_end_at_each_participant_message():
+    transcript = ReplayTranscript("t-1", "midterm_interview", tuple(parse_transcript(TRANSCRIPT)))
+
+    turns = replay_turns(transcript)
+
+    assert [(turn, len(history)) for turn, history in turns] == [(1, 2), (2, 4)]
+    assert turns[1][1][-1] == {"role": "user", "content": "Testing it."}
+    assert len(replay_turns(transcript, max_turns=1)) == 1
+
+
+def test_replay_kwargs_window_history_to_the_context_budget(monkeypatch):
+    config = load_interview_config("midterm_interview")
+    monkeypatch.setattr(config, "CONTEXT_TOKEN_BUDGET", 200, raising=False)
+    history = []
+    for index in range(20):
+        history.append({"role": "assistant", "content": f"Question {index} " + "word " * 30})
+        history.append({"role": "user", "content": f"Answer {index} " + "word " * 30})
+    runtime = create_target_runtime(
+        {"API_PROVIDER": "openai", "API_KEY": "test", "MODEL": "gpt-4o-mini"},
+        parse_target("openai"),
+        "midterm_interview",
+        config.MAX_OUTPUT_TOKENS,
+    )
+
+    windowed = build_replay_kwargs(runtime, config, "midterm_interview", "Prompt", history)
+    full = build_replay_kwargs(
+        runtime, config, "midterm_interview", "Prompt", history, full_history=True
+    )
+
+    assert len(full["messages"]) == len(history) + 1
+    assert windowed["messages"][0] == {"role": "system", "content": "Prompt"}
+    assert REPLAY_SUMMARY_PLACEHOLDER in windowed["messages"][1]["content"]
+    assert windowed["messages"][-1] == history[-1]
+    assert len(windowed["messages"]) < len(full["messages"])
+
+
+def test_target_runtime_uses_production_model_routing():
+    secrets = {"OPENROUTER_API_KEY": "test", "OPENROUTER_REASONING_MAX_TOKENS": 2048}
+
+    default = create_target_runtime(
+        secrets, parse_target("openrouter=qwen/test"), "midterm_interview", 1024
+    )
+    industry = create_target_runtime(
+        secrets, parse_target("openrouter=openai/test@low"), "industry_org_survey", 1024
+    )
+
+    assert (default.model_selection.model, default.model_selection.reasoning) == (
+        "qwen/test",
+        {"enabled": False},
+    )
+    assert industry.model_selection.model == "openai/test"
+    assert industry.model_selection.max_tokens == 2048
+    assert industry.model_selection.reasoning_level == "low"
+
+
+def test_load_transcripts_from_files_and_database(monkeypatch, tmp_path):
+    (tmp_path / "260312_s123_transcript.txt").write_text(
+        "Session ID: abc\n\n" + TRANSCRIPT, encoding="utf-8"
+    )
+    (tmp_path / "260312_s124_transcript.txt").write_text(
+        "Session ID: def\n\nassistant: Hello\n", encoding="utf-8"
+    )
+    local = load_local_transcripts(tmp_path, "midterm_interview")
+
+    assert len(local) == 1
+    assert "s123" not in local[0].label
+
+    secrets = {
+        "DATABASE_BACKEND": "local",
+        "LOCAL_DATABASE_DIRECTORY": str(tmp_path / "db"),
+    }
+    monkeypatch.setattr(
+        database, "get_secret", lambda key, default=None: secrets.get(key, default)
+    )
+    for index, interview_type in enumerate(["midterm_interview", "industry_org_survey"]):
+        database.persist_completion_remote(
+            f"interview-{index}",
+            f"student-{index}",
+            "Miros",
+            "ACME",
+            interview_type,
+            f"2026-03-1{index} 10:00:00",
+            TRANSCRIPT,
+            "5.00",
+        )
+
+    stored = load_database_transcripts(interview_type="industry_org_survey")
+
+    assert [transcript.config_name for transcript in stored] == ["industry_org_survey"]
+    assert "interview-1" not in stored[0].label
+    assert len(load_database_transcripts(limit=1)) == 1
+
+
+def test_run_replay_against_mock_provider_reports_per_target():
+    transcript = ReplayTranscript("t-1", "midterm_interview", tuple(parse_transcript(TRANSCRIPT)))
+    settings = MockProviderSettings(tokens_per_second=0, ttft_seconds=0, reply_tokens=8)
+    with MockProviderServer(settings) as server:
+        secrets = {
+            "API_PROVIDER": "openai",
+            "API_KEY": "test",
+            "MODEL": "mock-model",
+            "OPENAI_BASE_URL": server.base_url,
+        }
+        rows = run_replay(
+            [transcript],
+            [parse_target("openai"), parse_target("openai=gpt-4o-mini")],
+            secrets,
+            concurrency=2,
+        )
+
+    assert [(row["target"], row["turn"]) for row in rows] == [
+        ("openai", 1),
+        ("openai=gpt-4o-mini", 1),
+        ("openai", 2),
+        ("openai=gpt-4o-mini", 2),
+    ]
+    assert all(not row["error"] and row["output_tokens"] == 8 for row in rows)
+    assert all(row["ttft_ms"] is not None and row["total_ms"] >= row["ttft_ms"] for row in rows)
+
+    report = build_report(rows)
+
+    assert [row["target"] for row in report] == ["openai", "openai=gpt-4o-mini"]
+    assert all(row["history"] == "windowed" for row in report)
+    assert report[0]["turns"] == 2 and report[0]["errors"] == 0
+    assert report[0]["cost_usd"] is None
+    assert report[1]["output_tokens"] == 16
+    assert report[1]["cost_usd"] > 0
+    assert report[1]["cost_per_turn_usd"] == pytest.approx(report[1]["cost_usd"] / 2)
+
+
+def test_main_configures_rate_limits_and_only_rejects_bad_arguments(
+    monkeypatch, tmp_path
+):
+    secrets = {"API_PROVIDER": "openrouter", "OPENROUTER_TOKENS_PER_MINUTE": "1000"}
+    configured = []
+    monkeypatch.setattr(benchmark_models, "load_local_secrets", lambda: secrets)
+    monkeypatch.setattr(benchmark_models, "configure_rate_limits", configured.append)
+    (tmp_path / "a_transcript.txt").write_text(TRANSCRIPT, encoding="utf-8")
+
+    with pytest.raises(SystemExit):
+        main(["--target", "=model", "--transcripts-dir", str(tmp_path)])
+    assert configured == []
+
+    def failing_replay(*args, **kwargs):
+        raise ValueError("provider rejected the request")
+
+    monkeypatch.setattr(benchmark_models, "run_replay", failing_replay)
+    with pytest.raises(ValueError, match="provider rejected"):
+        main(["--transcripts-dir", str(tmp_path)])
+    assert configured == [secrets]
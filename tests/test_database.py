@@ -1,3 +1,5 @@
+import pytest
+
 import database
 from remote_utils import SshSettings
 
@@ -128,11 +130,13 @@ def test_get_transcript_by_student_and_type_returns_summary_text(monkeypatch):
         "get_ssh_connection",
         lambda timeout_seconds=None, retries=None: (fake_ssh, "/tmp/key"),
     )
-    monkeypatch.setattr(
-        database,
-        "run_remote_sql",
-        lambda ssh, db_path, sql, params=None, fetch=None: ["summary text"],
-    )
+    batch_calls = []
+
+    def fake_run_remote_sql_batch(ssh, db_path, operations):
+        batch_calls.append((db_path, operations))
+        return [["summary text"]]
+
+    monkeypatch.setattr(database, "run_remote_sql_batch", fake_run_remote_sql_batch)
     cleanup = []
     monkeypatch.setattr(
         database,
@@ -145,6 +149,18 @@ def test_get_transcript_by_student_and_type_returns_summary_text(monkeypatch):
     )
 
     assert result == "summary text"
+    db_path, operations = batch_calls[0]
+    assert db_path == ":memory:"
+    assert operations[0] == {
+        "type": "attach_existing",
+        "databases": [["shard_0", "/remote/data/interviews.db"]],
+    }
+    assert [operation["table"] for operation in operations[1:3]] == [
+        "latest_summaries",
+        "interviews",
+    ]
+    assert "FROM latest_summaries" in operations[3]["sql_query"]
+    assert operations[3]["params"] == ["student-1", "midterm_interview"] * 3
     assert cleanup == [(fake_ssh, "/tmp/key")]
 
 
@@ -191,9 +207,14 @@ def test_update_progress_and_summary_use_parameterized_queries(monkeypatch):
     assert any(
         "VALUES (?, ?, ?, ?)" in sql for sql, _ in batch_calls[0]
     )
-    assert any(
-        params == ["summary text", "interview-1"] for _, params in summary_calls
-    )
+    assert batch_calls[1][0][1] == ["summary text", "interview-1"]
+    assert "INSERT INTO latest_summaries" in batch_calls[1][2][0]
+    assert batch_calls[1][2][1] == ["interview-1"]
+    assert summary_calls == []
+
+    with pytest.raises(ValueError, match="empty summary"):
+        database.update_interview_summary("interview-1", "  ")
+    assert len(batch_calls) == 2
 
 
 def test_update_interview_survey_adds_missing_columns_and_saves_answers(monkeypatch):
@@ -442,3 +463,23 @@ def test_record_email_delivery_remote_updates_audit_and_interview_status(monkeyp
         "ssh timed out",
         "interview-1",
     ]
+
+
+def test_get_storage_backend_uses_pooled_ssh_connection_when_enabled(monkeypatch):
+    secrets = {"SSH_CONNECTION_POOL": "true"}
+    monkeypatch.setattr(
+        database, "get_secret", lambda key, default=None: secrets.get(key, default)
+    )
+    monkeypatch.setattr(
+        database,
+        "get_remote_database_location",
+        lambda: ("/remote/data", "/remote/data/interviews.db"),
+    )
+
+    pooled = database.get_storage_backend()
+    secrets["SSH_CONNECTION_POOL"] = False
+    direct = database.get_storage_backend()
+
+    assert pooled.connect is database.get_pooled_ssh_connection
+    assert pooled.close is database.release_pooled_ssh_connection
+    assert direct.connect is database.get_ssh_connection
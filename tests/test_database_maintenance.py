@@ -0,0 +1,199 @@
+from itertools import count
+
+import database_maintenance
+from database_maintenance import (
+    DatabaseStats,
+    abandoned_interviews_report,
+    archive_checkpoints,
+    build_maintenance_plan,
+    run_maintenance,
+)
+from storage_backend import LocalSqliteBackend
+
+
+def _local_backend(tmp_path):
+    directory = tmp_path / "db"
+    directory.mkdir()
+    return LocalSqliteBackend(
+        directory=str(directory),
+        db_path=str(directory / "interviews.db"),
+    )
+
+
+def _fill_and_delete(backend):
+    backend.run_batch(
+        [
+            {
+                "type": "execute",
+                "sql_query": "CREATE TABLE interview_checkpoints (interview_id TEXT, transcript TEXT)",
+            },
+            *[
+                {
+                    "type": "execute",
+                    "sql_query": "INSERT INTO interview_checkpoints VALUES (?, ?)",
+                    "params": [f"interview-{index}", "x" * 20000],
+                }
+                for index in range(20)
+            ],
+            {"type": "execute", "sql_query": "DELETE FROM interview_checkpoints"},
+        ]
+    )
+
+
+def test_run_maintenance_enables_incremental_vacuum_and_reports_sizes(tmp_path):
+    backend = _local_backend(tmp_path)
+    _fill_and_delete(backend)
+
+    report = run_maintenance(backend).as_dict()
+
+    assert report["before"]["auto_vacuum"] == 0
+    assert report["before"]["fragmentation_pct"] > 50
+    assert report["after"]["auto_vacuum"] == database_maintenance.AUTO_VACUUM_INCREMENTAL
+    assert report["after"]["file_size_bytes"] < report["before"]["file_size_bytes"]
+    assert [step["name"] for step in report["steps"]] == [
+        "enable_incremental_auto_vacuum",
+        "incremental_vacuum",
+        "analyze",
+        "integrity_check",
+    ]
+    assert all(step["status"] == "ran" for step in report["steps"])
+    assert report["steps"][-1]["detail"] == "ok"
+
+
+def test_run_maintenance_skips_steps_once_time_budget_is_spent(tmp_path):
+    backend = _local_backend(tmp_path)
+    _fill_and_delete(backend)
+    ticks = count()
+
+    report = run_maintenance(
+        backend,
+        max_seconds=3,
+        clock=lambda: next(ticks),
+    )
+
+    statuses = [(step.name, step.status) for step in report.steps]
+    assert statuses[0] == ("enable_incremental_auto_vacuum", "ran")
+    assert ("integrity_check", "skipped") in statuses
+    assert "time budget" in report.steps[-1].detail
+
+
+def test_run_maintenance_skips_full_file_steps_that_would_overrun(monkeypatch, tmp_path):
+    backend = _local_backend(tmp_path)
+    _fill_and_delete(backend)
+    monkeypatch.setattr(database_maintenance, "VACUUM_BYTES_PER_SECOND", 1024)
+    monkeypatch.setattr(database_maintenance, "INTEGRITY_CHECK_BYTES_PER_SECOND", 1024)
+
+    report = run_maintenance(backend, max_seconds=60)
+
+    statuses = {step.name: step.status for step in report.steps}
+    assert statuses == {
+        "enable_incremental_auto_vacuum": "skipped",
+        "incremental_vacuum": "ran",
+        "analyze": "ran",
+        "integrity_check": "skipped",
+    }
+    assert "exceeds" in report.steps[0].detail
+    assert report.after["auto_vacuum"] == 0
+
+
+def test_build_maintenance_plan_skips_full_vacuum_above_size_budget():
+    stats = DatabaseStats(page_size=4096, page_count=1000, freelist_count=10, auto_vacuum=0)
+
+    plan = dict(build_maintenance_plan(stats, max_vacuum_bytes=1024, integrity_check="skip"))
+
+    assert "VACUUM budget" in plan["enable_incremental_auto_vacuum"]
+    assert plan["integrity_check"] == "disabled"
+    assert plan["incremental_vacuum"][0]["sql_query"] == "PRAGMA incremental_vacuum(2000)"
+    assert dict(build_maintenance_plan(stats))["integrity_check"][0]["sql_query"] == (
+        "PRAGMA quick_check(100)"
+    )
+
+
+def _seed_checkpoints(backend):
+    backend.run_batch(
+        database_maintenance.CHECKPOINT_SCHEMA_OPERATIONS
+        + [
+            {
+                "type": "execute",
+                "sql_query": (
+                    "INSERT INTO interview_checkpoints (interview_id, student_id, "
+                    "interview_type, last_updated, transcript) VALUES (?, ?, ?, ?, ?)"
+                ),
+                "params": [interview_id, "s1", "midterm_interview", last_updated, "user: hi\n"],
+            }
+            for interview_id, last_updated in [
+                ("completed", "2026-03-01 10:00:00"),
+                ("stale", "2026-01-01 10:00:00"),
+                ("recent", "2026-03-12 09:00:00"),
+            ]
+        ]
+        + [
+            {
+                "type": "execute",
+                "sql_query": "INSERT INTO interviews (interview_id, student_id) VALUES (?, ?)",
+                "params": ["completed", "s1"],
+            }
+        ]
+    )
+
+
+def test_archive_checkpoints_moves_completed_and_expired_rows(tmp_path):
+    backend = _local_backend(tmp_path)
+    _seed_checkpoints(backend)
+    now = 1773316800.0  # 2026-03-12 12:00:00 UTC
+
+    dry_run = archive_checkpoints(backend, retention_days=30, dry_run=True, now_fn=lambda: now)
+    result = archive_checkpoints(backend, retention_days=30, now_fn=lambda: now)
+
+    assert dry_run["completed_checkpoints"] == 1
+    assert dry_run["expired_checkpoints"] == 1
+    assert result["completed_checkpoints"] == 1
+    remaining, archived = backend.run_batch(
+        [
+            {
+                "type": "execute",
+                "sql_query": "SELECT interview_id FROM interview_checkpoints",
+                "fetch": "all",
+            },
+            {
+                "type": "execute",
+                "sql_query": (
+                    "SELECT interview_id, archive_reason, zlib_decompress(transcript_zlib) "
+                    "FROM interview_checkpoints_archive ORDER BY interview_id"
+                ),
+                "fetch": "all",
+            },
+        ]
+    )
+    assert remaining == [["recent"]]
+    assert archived == [
+        ["completed", "completed", "user: hi\n"],
+        ["stale", "abandoned", "user: hi\n"],
+    ]
+
+
+def test_abandoned_interviews_report_uses_indexed_anti_join(tmp_path):
+    backend = _local_backend(tmp_path)
+    _seed_checkpoints(backend)
+    rows = abandoned_interviews_report(
+        backend, older_than_hours=1, now_fn=lambda: 1773403200.0
+    )
+    plan = backend.run_batch(
+        [
+            {
+                "type": "execute",
+                "sql_query": (
+                    "EXPLAIN QUERY PLAN SELECT c.interview_id FROM interview_checkpoints AS c "
+                    "LEFT JOIN interviews AS i ON i.interview_id = c.interview_id "
+                    "WHERE c.last_updated < ? AND i.interview_id IS NULL"
+                ),
+                "params": ["2026-03-12 11:00:00"],
+                "fetch": "all",
+            }
+        ]
+    )[0]
+
+    assert [row["interview_id"] for row in rows] == ["recent", "stale"]
+    assert rows[0]["transcript_chars"] == len("user: hi\n")
+    plan_text = " ".join(str(row[-1]) for row in plan)
+    assert "idx_interviews_interview_id" in plan_text
@@ -0,0 +1,69 @@
+import time
+
+import pytest
+
+from database_shards import (
+    academic_year_for,
+    build_attach_operations,
+    resolve_read_shard_keys,
+    resolve_write_shard_key,
+    shard_filename,
+)
+
+
+def _fixed_now(year, month):
+    return lambda: time.struct_time((year, month, 15, 12, 0, 0, 0, 0, -1))
+
+
+def test_academic_year_for_splits_on_start_month():
+    assert academic_year_for("2026-08-31 23:59:59") == "2025-2026"
+    assert academic_year_for("2026-09-01 00:00:00") == "2026-2027"
+    assert academic_year_for(now_fn=_fixed_now(2026, 3)) == "2025-2026"
+
+
+def test_resolve_write_shard_key_by_mode():
+    assert resolve_write_shard_key("none", interview_type="midterm_interview") is None
+    assert (
+        resolve_write_shard_key("academic_year", timestamp="2026-03-12 10:00:00")
+        == "2025-2026"
+    )
+    assert (
+        resolve_write_shard_key("interview_type", interview_type="Midterm_Interview")
+        == "midterm_interview"
+    )
+    with pytest.raises(ValueError, match="interview_type is required"):
+        resolve_write_shard_key("interview_type")
+
+
+def test_resolve_read_shard_keys_lists_hot_shard_first():
+    assert resolve_read_shard_keys(
+        "academic_year", lookback_years=2, now_fn=_fixed_now(2026, 10)
+    ) == ["2026-2027", "2025-2026", "2024-2025"]
+    assert resolve_read_shard_keys(
+        "interview_type", interview_type="midterm_interview"
+    ) == ["midterm_interview"]
+    assert resolve_read_shard_keys("none") == []
+
+
+def test_shard_filename_and_attach_operations():
+    assert shard_filename(None) == "interviews.db"
+    assert shard_filename("2025-2026") == "interviews-2025-2026.db"
+    assert shard_filename("../etc") == "interviews-etc.db"
+
+    operations = build_attach_operations(
+        "/data", ["2025-2026"], {"progress": ["student_id"]}
+    )
+
+    assert operations == [
+        {
+            "type": "attach_existing",
+            "databases": [
+                ["shard_0", "/data/interviews-2025-2026.db"],
+                ["shard_1", "/data/interviews.db"],
+            ],
+        },
+        {"type": "federated_view", "table": "progress", "columns": ["student_id"]},
+    ]
+    assert build_attach_operations(
+        "/data", ["2025-2026"], {}, include_unsharded=False
+    )[0]["databases"] == [["shard_0", "/data/interviews-2025-2026.db"]]
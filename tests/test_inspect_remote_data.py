@@ -39,3 +39,22 @@ def test_build_query_rejects_session_id_for_progress_table():
 
     with pytest.raises(ValueError, match="--session-id"):
         build_query(args)
+
+
+def test_build_query_reads_the_federated_view():
+    args = SimpleNamespace(
+        table="progress",
+        limit=5,
+        student_id="s123",
+        interview_type="",
+        interview_id="",
+        count_only=True,
+        show_summary=False,
+        show_transcript=False,
+    )
+
+    query, params, columns = build_query(args)
+
+    assert query == "SELECT COUNT(*) FROM progress WHERE student_id = ?"
+    assert params == ["s123"]
+    assert columns == ["count"]
@@ -0,0 +1,379 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from streamlit.runtime.scriptrunner_utils.script_requests import RerunData, ScriptRequests
+
+import interview_async_provider
+import interview_rate_limit
+from interview_async_provider import (
+    CancelToken,
+    ProviderBusyError,
+    ProviderLimiter,
+    StreamCancelledError,
+    get_cancellation_stats,
+    get_limiter,
+    iter_async_stream,
+    resolve_concurrency_limit,
+    script_run_interrupted_check,
+    stream_reply,
+)
+from interview_provider import ModelSelection, ProviderRuntime
+
+
+@pytest.fixture(autouse=True)
+def _reset_limiters():
+    interview_async_provider.reset_limiters()
+    interview_async_provider.reset_cancellation_stats()
+    interview_rate_limit.reset_rate_limits()
+    yield
+    interview_async_provider.reset_limiters()
+    interview_async_provider.reset_cancellation_stats()
+    interview_rate_limit.reset_rate_limits()
+
+
+class _FakeOpenAIStream:
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.closed = False
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for chunk in self.chunks:
+            yield chunk
+
+    async def close(self):
+        self.closed = True
+
+
+def _chunk(text=None, usage=None):
+    choices = [SimpleNamespace(delta=SimpleNamespace(content=text))] if text else []
+    return SimpleNamespace(choices=choices, usage=usage)
+
+
+def test_resolve_concurrency_limit_prefers_provider_specific_setting():
+    secrets = {"PROVIDER_MAX_CONCURRENCY": "4", "OPENROUTER_MAX_CONCURRENCY": "12"}
+
+    assert resolve_concurrency_limit(secrets, "openrouter") == 12
+    assert resolve_concurrency_limit(secrets, "deepinfra") == 4
+    assert resolve_concurrency_limit({}, "openai") == 8
+
+
+def test_provider_limiter_caps_in_flight_requests_and_records_waits():
+    limiter = ProviderLimiter("openrouter", 2)
+    peak = {"in_flight": 0}
+
+    async def request():
+        async with limiter.slot(timeout=5):
+            peak["in_flight"] = max(peak["in_flight"], limiter.stats.in_flight)
+            await asyncio.sleep(0.01)
+
+    async def burst():
+        await asyncio.gather(*(request() for _ in range(6)))
+
+    asyncio.run(burst())
+
+    stats = limiter.stats.as_dict()
+    assert peak["in_flight"] == 2
+    assert stats["acquired"] == 6
+    assert stats["in_flight"] == 0
+    assert stats["max_wait_ms"] > 0
+
+
+def test_provider_limiter_raises_busy_error_after_queue_timeout():
+    limiter = ProviderLimiter("openrouter", 1)
+
+    async def scenario():
+        async with limiter.slot(timeout=5):
+            with pytest.raises(ProviderBusyError, match="openrouter"):
+                async with limiter.slot(timeout=0.01):
+                    pass
+
+    asyncio.run(scenario())
+    assert limiter.stats.timeouts == 1
+
+
+def test_stream_reply_bridges_async_openai_stream_and_captures_usage():
+    stream = _FakeOpenAIStream(
+        [
+            _chunk("Hello"),
+            _chunk(" there"),
+            _chunk(usage=SimpleNamespace(prompt_tokens=100, prompt_tokens_details=None)),
+        ]
+    )
+    requests = []
+
+    async def create(**kwargs):
+        requests.append(kwargs)
+        return stream
+
+    runtime = ProviderRuntime(
+        provider="openrouter",
+        api="openai",
+        client=None,
+        model_selection=ModelSelection(model="m", max_tokens=10),
+        async_client=SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+        ),
+    )
+    usage_state = {}
+
+    chunks = list(stream_reply(runtime, {"model": "m", "stream": True}, usage_state))
+
+    assert chunks == ["Hello", " there"]
+    assert requests == [{"model": "m", "stream": True}]
+    assert stream.closed
+    assert usage_state["usage"].cache_miss_tokens == 100
+    assert usage_state["queue_wait_seconds"] >= 0
+    assert get_limiter("openrouter").stats.acquired == 1
+
+
+class _RateLimitedError(Exception):
+    status_code = 429
+
+    def __init__(self):
+        super().__init__("rate limited")
+        self.response = SimpleNamespace(status_code=429, headers={"retry-after-ms": "50"})
+
+
+def test_stream_reply_waits_out_retry_after_then_retries():
+    stream = _FakeOpenAIStream([_chunk("Hi")])
+    stream.response = SimpleNamespace(
+        headers={"x-ratelimit-remaining-tokens": "5000", "x-ratelimit-reset-tokens": "1s"}
+    )
+    outcomes = [_RateLimitedError(), stream]
+
+    async def create(**kwargs):
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    runtime = ProviderRuntime(
+        provider="openrouter",
+        api="openai",
+        client=None,
+        model_selection=ModelSelection(model="m", max_tokens=10),
+        async_client=SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+        ),
+    )
+    usage_state = {}
+
+    chunks = list(stream_reply(runtime, {"model": "m", "stream": True}, usage_state))
+
+    assert chunks == ["Hi"]
+    assert usage_state["rate_limit_wait_seconds"] >= 0.04
+    assert usage_state["queue_wait_seconds"] >= usage_state["rate_limit_wait_seconds"]
+    assert "response_headers" not in usage_state
+    [stats] = interview_rate_limit.get_rate_limit_stats()
+    assert (stats["rate_limited"], stats["granted"]) == (1, 2)
+
+
+def test_iter_async_stream_propagates_errors_and_cancels_on_close():
+    async def failing():
+        raise RuntimeError("upstream failed")
+        yield  # pragma: no cover
+
+    with pytest.raises(RuntimeError, match="upstream failed"):
+        list(iter_async_stream(failing, limiter=get_limiter("openai")))
+
+    cancelled = asyncio.Event()
+
+    async def endless():
+        try:
+            while True:
+                yield "tick"
+                await asyncio.sleep(0)
+        finally:
+            cancelled.set()
+
+    stream = iter_async_stream(endless, limiter=get_limiter("deepinfra"))
+    assert next(stream) == "tick"
+    stream.close()
+
+    future = asyncio.run_coroutine_threadsafe(
+        asyncio.wait_for(cancelled.wait(), 5), interview_async_provider.get_event_loop()
+    )
+    future.result(timeout=5)
+
+
+def test_rate_limit_wait_counts_against_the_concurrency_queue_timeout():
+    async def create(**kwargs):
+        return _FakeOpenAIStream([_chunk("word ")])
+
+    runtime = ProviderRuntime(
+        provider="openrouter",
+        api="openai",
+        client=None,
+        model_selection=ModelSelection(model="m", max_tokens=500),
+        async_client=SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+        ),
+    )
+    limiter = get_limiter("openrouter", 1)
+    interview_rate_limit.get_rate_limit_scheduler().record_rate_limited(
+        "openrouter", "m", {"retry-after-ms": "200"}
+    )
+
+    async def hold_slot(release):
+        async with limiter.slot():
+            await release.wait()
+
+    loop = interview_async_provider.get_event_loop()
+    release = asyncio.run_coroutine_threadsafe(_make_event(), loop).result()
+    holder = asyncio.run_coroutine_threadsafe(hold_slot(release), loop)
+    started = time.monotonic()
+    with pytest.raises(ProviderBusyError):
+        list(
+            stream_reply(
+                runtime,
+                {"model": "m", "stream": True},
+                {},
+                concurrency_limit=1,
+                queue_timeout=0.3,
+            )
+        )
+    elapsed = time.monotonic() - started
+    loop.call_soon_threadsafe(release.set)
+    holder.result(timeout=5)
+
+    assert 0.2 <= elapsed < 0.45
+
+
+async def _make_event():
+    return asyncio.Event()
+
+
+class _EndlessOpenAIStream(_FakeOpenAIStream):
+    def __init__(self):
+        super().__init__([])
+
+    async def _iterate(self):
+        while True:
+            yield _chunk("word ")
+            await asyncio.sleep(0.01)
+
+
+def _endless_runtime(stream):
+    async def create(**kwargs):
+        return stream
+
+    return ProviderRuntime(
+        provider="openrouter",
+        api="openai",
+        client=None,
+        model_selection=ModelSelection(model="m", max_tokens=500),
+        async_client=SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+        ),
+    )
+
+
+def test_cancel_token_closes_upstream_stream_and_counts_saved_tokens():
+    stream = _EndlessOpenAIStream()
+    token = CancelToken()
+    usage_state = {}
+    chunks = stream_reply(
+        _endless_runtime(stream),
+        {"model": "m", "stream": True, "max_tokens": 500},
+        usage_state,
+        cancel_token=token,
+    )
+
+    assert next(chunks) == "word "
+    token.cancel("participant finished")
+    with pytest.raises(StreamCancelledError, match="participant finished"):
+        list(chunks)
+
+    deadline = time.monotonic() + 5
+    while not stream.closed and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert stream.closed
+    assert usage_state["cancelled"]
+    [stats] = get_cancellation_stats()
+    assert (stats["provider"], stats["model"], stats["cancelled"]) == ("openrouter", "m", 1)
+    assert 0 < stats["saved_tokens"] < 500
+    assert stats["saved_tokens"] == usage_state["saved_tokens"]
+
+
+def test_cancel_token_follows_should_cancel_while_waiting_for_first_chunk():
+    interrupted = {"value": False}
+    token = CancelToken(should_cancel=lambda: interrupted["value"])
+
+    async def never_answers():
+        await asyncio.sleep(30)
+        yield "late"
+
+    chunks = iter_async_stream(
+        never_answers, limiter=ProviderLimiter("openrouter", 1), cancel_token=token
+    )
+    threading.Timer(0.05, interrupted.update, kwargs={"value": True}).start()
+
+    with pytest.raises(StreamCancelledError):
+        next(chunks)
+    assert token.reason == "script run interrupted"
+
+
+def test_closing_without_cancel_token_counts_as_early_close_only():
+    stream = _EndlessOpenAIStream()
+    usage_state = {}
+    chunks = stream_reply(
+        _endless_runtime(stream),
+        {"model": "m", "stream": True, "max_tokens": 500},
+        usage_state,
+    )
+
+    assert next(chunks) == "word "
+    chunks.close()
+
+    [stats] = get_cancellation_stats()
+    assert (stats["cancelled"], stats["saved_tokens"], stats["closed_early"]) == (0, 0, 1)
+    assert "cancelled" not in usage_state
+
+
+class _SilentOpenAIStream(_FakeOpenAIStream):
+    def __init__(self):
+        super().__init__([])
+
+    async def _iterate(self):
+        await asyncio.sleep(30)
+        yield _chunk("late")
+
+
+def test_stop_event_closes_stream_before_first_chunk_as_early_close():
+    stream = _SilentOpenAIStream()
+    stop_event = threading.Event()
+    usage_state = {}
+    chunks = stream_reply(
+        _endless_runtime(stream),
+        {"model": "m", "stream": True, "max_tokens": 500},
+        usage_state,
+        stop_event=stop_event,
+    )
+    threading.Timer(0.05, stop_event.set).start()
+
+    with pytest.raises(StreamCancelledError):
+        next(chunks)
+
+    deadline = time.monotonic() + 5
+    while not stream.closed and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert stream.closed
+    [stats] = get_cancellation_stats()
+    assert (stats["cancelled"], stats["closed_early"]) == (0, 1)
+    assert "cancelled" not in usage_state
+
+
+def test_script_run_check_follows_streamlit_script_requests():
+    requests = ScriptRequests()
+    interrupted = script_run_interrupted_check(SimpleNamespace(script_requests=requests))
+
+    assert not interrupted()
+    requests.request_rerun(RerunData())
+    assert interrupted()
+    assert not script_run_interrupted_check(None)()
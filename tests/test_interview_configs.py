@@ -9,3 +9,21 @@ def test_interview_configs_disable_random_reasoning_by_default():
     assert industry_org_survey.RANDOM_REASONING_EXPERIMENT is False
     assert midterm_interview.RANDOM_REASONING_EXPERIMENT is False
     assert end_reflection_interview.RANDOM_REASONING_EXPERIMENT is False
+
+
+def test_interview_configs_share_context_token_budget():
+    assert midterm_interview.CONTEXT_TOKEN_BUDGET == 8000
+    assert end_reflection_interview.CONTEXT_TOKEN_BUDGET == 8000
+    assert industry_org_survey.CONTEXT_TOKEN_BUDGET == 8000
+
+
+def test_interview_configs_enable_typing_pacing_by_default():
+    assert midterm_interview.TYPING_PACING is True
+    assert end_reflection_interview.TYPING_PACING is True
+    assert industry_org_survey.TYPING_PACING is True
+
+
+def test_interview_configs_cache_opening_turn_by_default():
+    assert midterm_interview.CACHE_OPENING_TURN is True
+    assert end_reflection_interview.CACHE_OPENING_TURN is True
+    assert industry_org_survey.CACHE_OPENING_TURN is True
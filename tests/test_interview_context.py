@@ -0,0 +1,93 @@
+import interview_context
+from interview_context import (
+    CONTEXT_SUMMARY_HEADER,
+    build_context_window,
+    build_rolling_summary_prompt,
+    message_tokens,
+    submit_rolling_summary,
+)
+
+
+def _conversation(turns: int, words: int = 40) -> list[dict]:
+    messages = [{"role": "system", "content": "System prompt"}]
+    for index in range(turns):
+        messages.append({"role": "assistant", "content": f"question {index} " * words})
+        messages.append({"role": "user", "content": f"answer {index} " * words})
+    return messages
+
+
+def test_build_context_window_sends_everything_without_budget():
+    messages = _conversation(3)
+
+    window = build_context_window(messages, token_budget=None)
+
+    assert window.messages == messages
+    assert window.pending_summary_through is None
+
+
+def test_build_context_window_requests_summary_once_history_exceeds_budget():
+    messages = _conversation(10)
+    budget = message_tokens(messages[0]) + 6 * message_tokens(messages[1])
+
+    window = build_context_window(messages, token_budget=budget, min_recent_messages=2)
+
+    # Nothing is dropped until the background summary catches up.
+    assert window.messages == messages
+    assert window.summary_through == 0
+    assert 0 < window.pending_summary_through < 20
+    assert 20 - window.pending_summary_through >= 2
+
+
+def test_build_context_window_replaces_summarized_turns_with_summary_message():
+    messages = _conversation(10)
+    budget = message_tokens(messages[0]) + 12 * message_tokens(messages[1])
+
+    window = build_context_window(
+        messages,
+        token_budget=budget,
+        summary="Covered parts one and two.",
+        summary_through=14,
+        min_recent_messages=2,
+    )
+
+    assert window.messages[0] == messages[0]
+    assert window.messages[1] == {
+        "role": "system",
+        "content": f"{CONTEXT_SUMMARY_HEADER}Covered parts one and two.",
+    }
+    assert window.messages[2:] == messages[15:]
+    assert window.pending_summary_through is None
+
+
+def test_build_rolling_summary_prompt_folds_new_turns_into_previous_summary():
+    prompt = build_rolling_summary_prompt(
+        "Earlier summary", [{"role": "user", "content": "New detail"}]
+    )
+
+    assert prompt.startswith("Summary so far:\n\nEarlier summary")
+    assert "user: New detail\n" in prompt
+
+
+def test_submit_rolling_summary_resolves_to_summary_and_new_boundary():
+    prompts = []
+
+    def summarize(prompt):
+        prompts.append(prompt)
+        return "  updated summary  ", "usage"
+
+    conversation = _conversation(3)[1:]
+    future = submit_rolling_summary(summarize, "", conversation, 0, 4)
+
+    assert future.result(timeout=5) == ("updated summary", 4, "usage")
+    assert "answer 1" in prompts[0]
+    assert "answer 2" not in prompts[0]
+
+
+def test_estimate_tokens_falls_back_to_character_heuristic(monkeypatch):
+    monkeypatch.setattr(interview_context, "_load_encoding", lambda: None)
+    interview_context.estimate_tokens.cache_clear()
+
+    assert interview_context.estimate_tokens("abcdefghi") == 3
+    assert interview_context.estimate_tokens("") == 0
+
+    interview_context.estimate_tokens.cache_clear()
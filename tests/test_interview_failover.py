@@ -0,0 +1,199 @@
+import threading
+
+import pytest
+
+import interview_failover
+from interview_async_provider import StreamCancelledError
+from interview_failover import (
+    FailoverTimeoutError,
+    HedgeOutcome,
+    create_failover_runtimes,
+    hedged_stream,
+    parse_failover_chain,
+)
+from interview_provider import ModelSelection, ProviderRuntime
+
+
+def _runtime(provider: str, model: str = "model") -> ProviderRuntime:
+    return ProviderRuntime(
+        provider=provider,
+        api="openai",
+        client=object(),
+        model_selection=ModelSelection(model=model, max_tokens=1024),
+    )
+
+
+class _FakeStream:
+    def __init__(self, chunks, *, wait_for=None, error=None):
+        self.chunks = list(chunks)
+        self.wait_for = wait_for
+        self.error = error
+        self.closed = threading.Event()
+
+    def __iter__(self):
+        if self.wait_for is not None:
+            self.wait_for.wait(timeout=5)
+        if self.error is not None:
+            raise self.error
+        yield from self.chunks
+
+    def close(self):
+        self.closed.set()
+
+
+def test_parse_failover_chain_puts_primary_first_and_deduplicates():
+    assert parse_failover_chain("openrouter, DeepInfra,openai,deepinfra", "openrouter") == [
+        "openrouter",
+        "deepinfra",
+        "openai",
+    ]
+    assert parse_failover_chain("", "openai") == ["openai"]
+    with pytest.raises(ValueError, match="PROVIDER_FAILOVER_CHAIN"):
+        parse_failover_chain("openrouter,bedrock", "openrouter")
+
+
+def test_create_failover_runtimes_skips_providers_without_keys(monkeypatch):
+    calls = []
+
+    def fake_create_provider_runtime(secrets, config_name, default_max_tokens):
+        calls.append((secrets["API_PROVIDER"], secrets.get("MODEL")))
+        return _runtime(secrets["API_PROVIDER"], secrets.get("MODEL"))
+
+    monkeypatch.setattr(
+        interview_failover, "create_provider_runtime", fake_create_provider_runtime
+    )
+    primary = _runtime("openrouter")
+
+    runtimes = create_failover_runtimes(
+        {
+            "API_PROVIDER": "openrouter",
+            "MODEL": "gpt-5.4",
+            "PROVIDER_FAILOVER_CHAIN": "openrouter,deepinfra,openai",
+            "DEEPINFRA_API_KEY": "deepinfra-key",
+            "DEEPINFRA_MODEL": "meta-llama/Llama-3.3-70B-Instruct",
+        },
+        "midterm_interview",
+        1024,
+        primary,
+    )
+
+    assert runtimes[0] is primary
+    assert [runtime.provider for runtime in runtimes] == ["openrouter", "deepinfra"]
+    assert calls == [("deepinfra", "meta-llama/Llama-3.3-70B-Instruct")]
+
+
+def test_hedged_stream_uses_primary_when_it_answers_in_time():
+    outcome = HedgeOutcome()
+    fallback_started = threading.Event()
+
+    def fallback(cancel):
+        fallback_started.set()
+        return _FakeStream(["fallback"])
+
+    chunks = list(
+        hedged_stream(
+            [("openrouter", lambda cancel: _FakeStream(["Hello", " there"])), ("openai", fallback)],
+            ttft_deadline_seconds=5,
+            outcome=outcome,
+        )
+    )
+
+    assert chunks == ["Hello", " there"]
+    assert outcome.served_by == "openrouter"
+    assert outcome.attempted == ["openrouter"]
+    assert not fallback_started.is_set()
+
+
+def test_hedged_stream_hedges_slow_primary_and_cancels_it():
+    outcome = HedgeOutcome()
+    primaries = []
+
+    def primary(cancel):
+        # Blocks before its first token until the hedge signals it.
+        primaries.append(_FakeStream(["slow"], wait_for=cancel))
+        return primaries[0]
+
+    stream = hedged_stream(
+        [("openrouter", primary), ("deepinfra", lambda cancel: _FakeStream(["fast"]))],
+        ttft_deadline_seconds=0.05,
+        outcome=outcome,
+    )
+    chunks = list(stream)
+
+    assert chunks == ["fast"]
+    assert outcome.served_by == "deepinfra"
+    assert outcome.hedged
+    assert primaries[0].closed.wait(timeout=1)
+
+
+def test_hedged_stream_raises_when_no_attempt_answers_before_the_deadline():
+    outcome = HedgeOutcome()
+    streams = []
+
+    def hanging(cancel):
+        streams.append(_FakeStream(["late"], wait_for=cancel))
+        return streams[-1]
+
+    with pytest.raises(FailoverTimeoutError, match="openrouter, deepinfra"):
+        list(
+            hedged_stream(
+                [("openrouter", hanging), ("deepinfra", hanging)],
+                ttft_deadline_seconds=0.05,
+                timeout_seconds=0.2,
+                outcome=outcome,
+            )
+        )
+
+    assert outcome.served_by is None
+    assert len(streams) == 2
+    assert all(stream.closed.wait(timeout=1) for stream in streams)
+
+
+def test_hedged_stream_falls_through_errors_and_raises_when_all_fail():
+    outcome = HedgeOutcome()
+
+    chunks = list(
+        hedged_stream(
+            [
+                ("openrouter", lambda cancel: _FakeStream([], error=RuntimeError("upstream 502"))),
+                ("openai", lambda cancel: _FakeStream(["recovered"])),
+            ],
+            ttft_deadline_seconds=5,
+            outcome=outcome,
+        )
+    )
+
+    assert chunks == ["recovered"]
+    assert outcome.served_by == "openai"
+
+    with pytest.raises(RuntimeError, match="upstream 502"):
+        list(
+            hedged_stream(
+                [("openrouter", lambda cancel: _FakeStream([], error=RuntimeError("upstream 502")))],
+                ttft_deadline_seconds=5,
+            )
+        )
+
+
+def test_hedged_stream_does_not_fall_back_after_cancellation():
+    fallback_started = threading.Event()
+
+    def fallback(cancel):
+        fallback_started.set()
+        return _FakeStream(["fallback"])
+
+    with pytest.raises(StreamCancelledError):
+        list(
+            hedged_stream(
+                [
+                    (
+                        "openrouter",
+                        lambda cancel: _FakeStream([], error=StreamCancelledError("tab closed")),
+                    ),
+                    ("openai", fallback),
+                ],
+                ttft_deadline_seconds=5,
+            )
+        )
+
+    assert not fallback_started.is_set()
@@ -7,6 +7,7 @@ from interview_logic import (
     extract_openai_stream_delta,
     filter_display_messages,
     find_closing_code,
+    get_closing_code_matcher,
     missing_query_params,
     normalize_query_value,
     resolve_query_params,
@@ -53,8 +54,8 @@ def test_missing_query_params_reports_only_empty_required_values():
 
 def test_compose_system_prompt_includes_context_when_present():
     prompt = compose_system_prompt("Base prompt", "Earlier summary")
-    assert "Earlier summary" in prompt
-    assert prompt.endswith("Base prompt")
+    assert prompt.startswith("Base prompt")
+    assert prompt.endswith("Earlier summary")
 
 
 def test_extract_anthropic_text_ignores_non_text_blocks():
@@ -93,6 +94,35 @@ def test_find_closing_code_returns_first_matching_code():
     assert find_closing_code("keep going", closing_messages) is None
 
 
+def test_closing_code_scanner_strips_codes_split_across_deltas():
+    scanner = get_closing_code_matcher({"5j3k": "problem", "x7y8": "done"}).scanner()
+
+    released = [scanner.feed(delta) for delta in ["Thanks x", "7", "y8 and 5", "j3", "k5x"]]
+    released.append(scanner.finish())
+
+    assert released == ["Thanks ", "", " and ", "", "5", "x"]
+    assert scanner.codes == ["x7y8", "5j3k"]
+    assert scanner.classification().visible_text == "Thanks  and 5x"
+
+
+def test_closing_code_scanner_only_holds_back_possible_code_prefixes():
+    matcher = get_closing_code_matcher({"x7y8": "done"})
+    scanner = matcher.scanner()
+
+    assert scanner.feed("Tell me more about that") == "Tell me more about that"
+    assert scanner.feed(" x7") == " "
+    assert scanner.feed("z") == "x7z"
+    assert matcher.max_holdback == 3
+    assert get_closing_code_matcher({"x7y8": "other"}) is matcher
+
+
+def test_closing_code_matcher_handles_overlapping_codes():
+    scanner = get_closing_code_matcher({"abcd": "a", "bce": "b"}).scanner()
+
+    assert scanner.feed("xabce") + scanner.finish() == "xa"
+    assert scanner.codes == ["bce"]
+
+
 def test_classify_assistant_reply_identifies_code_only_close():
     closing_messages = {"x7y8": "done"}
     parsed = classify_assistant_reply("  x7y8 \n", closing_messages)
@@ -0,0 +1,94 @@
+import pytest
+
+import interview_metrics
+from interview_metrics import (
+    Histogram,
+    StreamTiming,
+    get_histogram,
+    get_metrics_snapshot,
+    record_turn_metrics,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    interview_metrics.reset_metrics()
+    yield
+    interview_metrics.reset_metrics()
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_stream_timing_separates_provider_latency_from_local_rendering():
+    clock = _FakeClock()
+    timing = StreamTiming(clock=clock)
+
+    timing.start()
+    clock.now = 100.8
+    timing.mark_delta("Hello ")
+    clock.now = 101.0
+    timing.mark_visible()
+    clock.now = 102.8
+    timing.mark_delta("there, how are you?")
+    clock.now = 102.9
+    timing.mark_visible()
+    clock.now = 104.0
+    timing.finish()
+
+    assert timing.as_dict(output_tokens=40) == {
+        "ttft_ms": 800.0,
+        "first_visible_ms": 1000.0,
+        "holdback_ms": 200.0,
+        "stream_ms": 2800.0,
+        "render_ms": 4000.0,
+        "pacing_ms": 1200.0,
+        "output_chars": 25,
+        "output_tokens_per_second": 20.0,
+    }
+
+
+def test_stream_timing_without_visible_text_or_usage():
+    clock = _FakeClock()
+    timing = StreamTiming(clock=clock)
+    timing.start()
+    clock.now = 100.5
+    timing.mark_delta("x" * 40)
+    timing.finish()
+
+    metrics = timing.as_dict()
+
+    assert metrics["first_visible_ms"] is None
+    assert metrics["holdback_ms"] is None
+    # A single delta gives no generation window to measure throughput over.
+    assert metrics["output_tokens_per_second"] is None
+
+
+def test_histogram_quantiles_interpolate_within_buckets():
+    histogram = Histogram(bounds=(100, 200, 400))
+    for value in (50, 150, 150, 300, 900):
+        histogram.observe(value)
+
+    assert histogram.counts == [1, 2, 1, 1]
+    assert histogram.quantile(0.5) == 175.0
+    assert histogram.quantile(1.0) == 900
+    assert histogram.as_dict()["mean"] == 310.0
+    assert Histogram(bounds=(1,)).quantile(0.5) is None
+
+
+def test_record_turn_metrics_labels_histograms_by_provider_model_and_reasoning():
+    labels = {"provider": "openrouter", "model": "openai/gpt-5.4", "reasoning_level": "low"}
+    record_turn_metrics({"ttft_ms": 900.0, "first_visible_ms": None, "output_chars": 12}, **labels)
+    record_turn_metrics({"ttft_ms": 1100.0}, **{**labels, "reasoning_level": "high"})
+
+    assert get_histogram("ttft_ms", **labels).count == 1
+    assert get_histogram("first_visible_ms", **labels) is None
+    assert [
+        (row["metric"], row["reasoning_level"], row["count"])
+        for row in get_metrics_snapshot()
+    ] == [("ttft_ms", "high", 1), ("ttft_ms", "low", 1)]
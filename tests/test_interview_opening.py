@@ -0,0 +1,52 @@
+import pytest
+
+import interview_opening
+from interview_opening import (
+    OpeningTurnCache,
+    get_cached_opening,
+    get_opening_cache_stats,
+    has_cached_opening,
+    opening_cache_key,
+    store_opening,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_cache():
+    interview_opening.reset_opening_cache()
+    yield
+    interview_opening.reset_opening_cache()
+
+
+def test_opening_cache_key_changes_with_prompt_model_and_reasoning():
+    key = opening_cache_key("midterm_interview", "m", "system", "begin")
+
+    assert key[:2] == ("midterm_interview", "m")
+    assert key == opening_cache_key("midterm_interview", "m", "system", "begin")
+    assert key != opening_cache_key("midterm_interview", "m", "system v2", "begin")
+    assert key != opening_cache_key("midterm_interview", "other", "system", "begin")
+    assert key != opening_cache_key(
+        "midterm_interview", "m", "system", "begin", reasoning_level="medium"
+    )
+
+
+def test_cached_opening_is_shared_and_counts_hits():
+    key = opening_cache_key("midterm_interview", "m", "system", "begin")
+
+    assert get_cached_opening(key) is None
+    store_opening(key, "Hello! I'm glad to have the opportunity to speak with you.")
+    store_opening(opening_cache_key("x", "m", "s", "b"), "   ")
+
+    assert has_cached_opening(key)
+    assert get_cached_opening(key).startswith("Hello!")
+    assert get_opening_cache_stats() == {"entries": 1, "hits": 1, "misses": 1}
+
+
+def test_opening_cache_evicts_least_recently_used_entry():
+    cache = OpeningTurnCache(max_entries=2)
+    cache.store("a", "A")
+    cache.store("b", "B")
+    cache.get("a")
+    cache.store("c", "C")
+
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == ("A", None, "C")
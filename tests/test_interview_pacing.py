@@ -0,0 +1,77 @@
+import pytest
+
+from interview_pacing import TypingPacer
+
+
+class _FakeTime:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def clock(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _pacer(fake, **kwargs):
+    return TypingPacer(clock=fake.clock, sleep=fake.sleep, **kwargs)
+
+
+def test_pacer_catches_up_when_a_long_reply_arrives_at_once():
+    fake = _FakeTime()
+    pacer = _pacer(fake)
+    reply = "word " * 300
+
+    chunks = list(pacer.feed(reply))
+
+    assert "".join(chunks) == reply
+    # 1500 characters at the old fixed 65 cps would take over 20 seconds.
+    assert sum(fake.sleeps) <= pacer.catch_up_seconds * 1.5
+    assert pacer.backlog_chars == 0
+    assert len(chunks) == pacer.frames < 60
+
+
+def test_pacer_batches_into_frames_on_word_boundaries():
+    fake = _FakeTime()
+    pacer = _pacer(fake, base_cps=150, frame_seconds=0.1)
+
+    chunks = list(pacer.feed("alpha beta gamma delta epsilon zeta "))
+
+    assert chunks[0] == "alpha beta gamma "
+    assert all(chunk.endswith(" ") for chunk in chunks)
+
+
+def test_pacer_keeps_up_with_a_fast_provider():
+    fake = _FakeTime()
+    pacer = _pacer(fake)
+    shown = []
+
+    # The provider delivers 400 characters per second in 20-character deltas.
+    for index in range(40):
+        fake.now = max(fake.now, index * 0.05)
+        shown.extend(pacer.feed("x" * 19 + " "))
+
+    assert len("".join(shown)) == 800
+    assert fake.now < 40 * 0.05 + 0.2
+
+
+def test_pacer_caps_added_delay_per_reply():
+    fake = _FakeTime()
+    pacer = _pacer(fake, max_cps=100, max_added_delay_seconds=2.0)
+
+    text = "".join(pacer.feed("y" * 5000))
+
+    assert len(text) == 5000
+    assert sum(fake.sleeps) == pytest.approx(2.0)
+
+
+def test_disabled_pacer_passes_text_through_without_sleeping():
+    fake = _FakeTime()
+    pacer = _pacer(fake, enabled=False)
+
+    assert list(pacer.feed("Hello there")) == ["Hello there"]
+    assert list(pacer.feed("")) == []
+    assert fake.sleeps == []
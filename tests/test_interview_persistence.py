@@ -1,5 +1,6 @@
 from interview_completion import CompletionResponses
 from interview_persistence import CompletionContext, persist_completion
+from interview_summary_jobs import SummaryJob
 
 
 def test_persist_completion_runs_full_pipeline_and_returns_result():
@@ -15,12 +16,8 @@ def test_persist_completion_runs_full_pipeline_and_returns_result():
     def persist_remote_completion(*args, **kwargs):
         calls.append(("persist_remote", args, kwargs))
 
-    def generate_summary(transcript_text):
-        calls.append(("generate_summary", transcript_text))
-        return "summary text"
-
-    def update_interview_summary(*args):
-        calls.append(("update_summary", args))
+    def schedule_summary(job):
+        calls.append(("schedule_summary", job))
 
     context = CompletionContext(
         interview_id="session-1",
@@ -52,8 +49,7 @@ def test_persist_completion_runs_full_pipeline_and_returns_result():
         persist_local_transcript=persist_local_transcript,
         send_transcript_email=send_transcript_email,
         persist_remote_completion=persist_remote_completion,
-        generate_summary=generate_summary,
-        update_interview_summary=update_interview_summary,
+        schedule_summary=schedule_summary,
         now_fn=lambda: 120.0,
         timestamp_fn=lambda: "2026-03-12 10:00:00",
     )
@@ -62,7 +58,7 @@ def test_persist_completion_runs_full_pipeline_and_returns_result():
     assert result.transcript_file == "/tmp/transcript.txt"
     assert result.transcript_text == "assistant: Hello\nuser: Hi\n"
     assert result.duration_minutes == "2.00"
-    assert result.summary_text == "summary text"
+    assert result.summary_status == "pending"
     assert result.email_sent is True
     assert result.remote_saved is True
     assert result.remote_error == ""
@@ -88,7 +84,19 @@ def test_persist_completion_runs_full_pipeline_and_returns_result():
         "survey_timestamp": "2026-03-12 10:00:00",
         "model": "openai/gpt-5.4",
         "model_reasoning_level": "medium",
+        "summary_status": "pending",
     }
+    schedule_call = next(call for call in calls if call[0] == "schedule_summary")
+    assert schedule_call[1] == SummaryJob(
+        interview_id="session-1",
+        interview_type="midterm_interview",
+        timestamp="2026-03-12 10:00:00",
+        transcript_text="assistant: Hello\nuser: Hi\n",
+    )
+    # The summary is queued after the transcript is saved, never before.
+    assert [call[0] for call in calls].index("persist_remote") < [
+        call[0] for call in calls
+    ].index("schedule_summary")
 
 
 def test_persist_completion_skips_optional_steps_when_not_needed():
@@ -124,8 +132,7 @@ def test_persist_completion_skips_optional_steps_when_not_needed():
         persist_remote_completion=lambda *args, **kwargs: calls.append(
             ("persist_remote", args, kwargs)
         ),
-        generate_summary=lambda transcript_text: "summary text",
-        update_interview_summary=lambda *args: calls.append(("update_summary", args)),
+        schedule_summary=lambda job: calls.append(("schedule_summary", job)),
         now_fn=lambda: 120.0,
         timestamp_fn=lambda: "2026-03-12 10:00:00",
     )
@@ -147,6 +154,7 @@ def test_persist_completion_skips_optional_steps_when_not_needed():
     assert persist_remote_call[2]["survey_timestamp"] == ""
     assert persist_remote_call[2]["model"] == ""
     assert persist_remote_call[2]["model_reasoning_level"] == "none"
+    assert "usage" not in persist_remote_call[2]
 
 
 def test_persist_completion_returns_downloadable_result_when_remote_save_fails():
@@ -181,8 +189,7 @@ def test_persist_completion_returns_downloadable_result_when_remote_save_fails()
         persist_local_transcript=lambda: ("", "/tmp/transcript.txt"),
         send_transcript_email=lambda **kwargs: None,
         persist_remote_completion=persist_remote_completion,
-        generate_summary=lambda transcript_text: "summary text",
-        update_interview_summary=lambda *args: None,
+        schedule_summary=lambda job: None,
         now_fn=lambda: 120.0,
         timestamp_fn=lambda: "2026-03-12 10:00:00",
     )
@@ -190,4 +197,41 @@ def test_persist_completion_returns_downloadable_result_when_remote_save_fails()
     assert result.remote_saved is False
     assert result.remote_error == "ssh timed out"
     assert result.transcript_text == "assistant: Hello\nuser: Hi\n"
-    assert result.summary_text == ""
+    assert result.summary_status == ""
+
+
+def test_persist_completion_passes_chat_usage_totals_to_remote_save():
+    calls = []
+    usage = {"input_tokens": 900, "output_tokens": 120, "cost_usd": 0.004}
+    context = CompletionContext(
+        interview_id="session-4",
+        student_number="",
+        respondent_name="Miros",
+        company_name="",
+        config_name="industry_org_survey",
+        recipient_email="person@example.com",
+        start_time=60.0,
+        messages=[{"role": "assistant", "content": "Hello"}],
+        completion_responses=CompletionResponses(
+            email="person@example.com",
+            send_email=False,
+            helpfulness_rating="",
+            connection_rating="",
+            understanding_rating="",
+            validation_rating="",
+            feedback="",
+        ),
+        usage=usage,
+    )
+
+    persist_completion(
+        context,
+        persist_local_transcript=lambda: ("", "/tmp/transcript.txt"),
+        send_transcript_email=lambda **kwargs: None,
+        persist_remote_completion=lambda *args, **kwargs: calls.append(kwargs),
+        schedule_summary=lambda job: None,
+        now_fn=lambda: 120.0,
+        timestamp_fn=lambda: "2026-03-12 10:00:00",
+    )
+
+    assert calls[0]["usage"] == usage
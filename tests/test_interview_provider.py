@@ -1,21 +1,38 @@
 from types import SimpleNamespace
 
+import anthropic
+import httpx
+import pytest
+
 import interview_provider
 from interview_provider import (
     OPENROUTER_DEFAULT_MODEL,
     OPENROUTER_INDUSTRY_MODEL,
     OPENROUTER_MIN_REASONING_MAX_TOKENS,
+    SUMMARY_DEFAULT_MAX_TOKENS,
     ModelSelection,
     apply_reasoning_level,
     apply_model_selection_to_openai_kwargs,
+    apply_prompt_cache_to_anthropic_kwargs,
+    apply_prompt_cache_to_openai_kwargs,
     build_openrouter_headers,
+    build_prompt_cache_key,
+    client_registry_key,
     create_provider_runtime,
     normalize_provider,
     resolve_reasoning_experiment_level,
     resolve_model_selection,
+    resolve_summary_model_selection,
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_client_registry():
+    interview_provider.clear_client_registry()
+    yield
+    interview_provider.clear_client_registry()
+
+
 def test_normalize_provider_handles_claude_models():
     assert normalize_provider("anthropic", "claude-3-5-sonnet") == "anthropic"
     assert normalize_provider("", "claude-3-5-sonnet") == "anthropic"
@@ -68,6 +85,50 @@ def test_resolve_model_selection_allows_no_reasoning_for_industry():
     assert selection.reasoning_level == "none"
 
 
+def test_resolve_summary_model_selection_routes_industry_summaries_to_cheap_model():
+    interview_selection = resolve_model_selection(
+        "openrouter", "industry_org_survey", {}, 1024
+    )
+
+    selection = resolve_summary_model_selection(
+        "openrouter", "industry_org_survey", {}, interview_selection
+    )
+
+    assert interview_selection.model == OPENROUTER_INDUSTRY_MODEL
+    assert selection.model == OPENROUTER_DEFAULT_MODEL
+    assert selection.max_tokens == SUMMARY_DEFAULT_MAX_TOKENS
+    assert selection.reasoning == {"enabled": False}
+    assert selection.reasoning_level == "none"
+
+
+def test_resolve_summary_model_selection_prefers_per_config_secrets():
+    secrets = {
+        "MODEL": "gpt-5.4",
+        "SUMMARY_MODEL": "gpt-5.4-mini",
+        "SUMMARY_MODEL_INDUSTRY_ORG_SURVEY": "gpt-5.4-nano",
+        "SUMMARY_MAX_TOKENS": "300",
+        "SUMMARY_REASONING_EFFORT": "low",
+    }
+    interview_selection = resolve_model_selection("openai", "midterm_interview", secrets, 1024)
+
+    midterm = resolve_summary_model_selection(
+        "openai", "midterm_interview", secrets, interview_selection
+    )
+    industry = resolve_summary_model_selection(
+        "openai", "industry_org_survey", secrets, interview_selection
+    )
+    routed = resolve_summary_model_selection(
+        "openrouter", "midterm_interview", secrets, interview_selection
+    )
+
+    assert (midterm.model, midterm.max_tokens, midterm.reasoning) == ("gpt-5.4-mini", 300, None)
+    assert industry.model == "gpt-5.4-nano"
+    assert routed.reasoning == {"effort": "low", "exclude": True}
+    assert resolve_summary_model_selection(
+        "openai", "midterm_interview", {}, interview_selection
+    ).model == interview_selection.model
+
+
 def test_apply_reasoning_level_can_force_medium_or_none():
     selection = ModelSelection(model=OPENROUTER_INDUSTRY_MODEL, max_tokens=1536)
 
@@ -136,6 +197,7 @@ def test_create_provider_runtime_builds_openrouter_client(monkeypatch):
     calls = []
 
     def fake_openai(**kwargs):
+        assert isinstance(kwargs.pop("http_client"), httpx.Client)
         calls.append(kwargs)
         return SimpleNamespace(kind="openai", kwargs=kwargs)
 
@@ -155,6 +217,7 @@ def test_create_provider_runtime_builds_openrouter_client(monkeypatch):
     assert runtime.provider == "openrouter"
     assert runtime.api == "openai"
     assert runtime.model_selection.model == OPENROUTER_INDUSTRY_MODEL
+    assert runtime.summary_selection.model == OPENROUTER_DEFAULT_MODEL
     assert calls == [
         {
             "api_key": "test-key",
@@ -171,6 +234,7 @@ def test_create_provider_runtime_ignores_model_setting_for_openrouter(monkeypatc
     calls = []
 
     def fake_openai(**kwargs):
+        assert isinstance(kwargs.pop("http_client"), httpx.Client)
         calls.append(kwargs)
         return SimpleNamespace(kind="openai", kwargs=kwargs)
 
@@ -196,3 +260,116 @@ def test_create_provider_runtime_ignores_model_setting_for_openrouter(monkeypatc
             "default_headers": None,
         }
     ]
+
+
+def test_create_provider_runtime_reuses_cached_client(monkeypatch):
+    calls = []
+
+    def fake_openai(**kwargs):
+        calls.append(kwargs)
+        return SimpleNamespace(kind="openai", kwargs=kwargs)
+
+    monkeypatch.setattr(interview_provider, "OpenAI", fake_openai)
+    secrets = {"API_PROVIDER": "openrouter", "OPENROUTER_API_KEY": "test-key"}
+
+    first = create_provider_runtime(secrets, "industry_org_survey", 1024)
+    second = create_provider_runtime(secrets, "midterm_interview", 1024)
+    rotated = create_provider_runtime(
+        {**secrets, "OPENROUTER_API_KEY": "rotated-key"}, "midterm_interview", 1024
+    )
+
+    assert first.client is second.client
+    assert rotated.client is not first.client
+    assert len(calls) == 2
+
+
+def test_create_provider_runtime_honors_base_url_secret(monkeypatch):
+    calls = []
+
+    def fake_openai(**kwargs):
+        kwargs.pop("http_client")
+        calls.append(kwargs)
+        return SimpleNamespace(kind="openai", kwargs=kwargs)
+
+    def fake_anthropic(**kwargs):
+        kwargs.pop("http_client")
+        calls.append(kwargs)
+        return SimpleNamespace(kind="anthropic", kwargs=kwargs)
+
+    monkeypatch.setattr(interview_provider, "OpenAI", fake_openai)
+    monkeypatch.setattr(anthropic, "Anthropic", fake_anthropic)
+    monkeypatch.setattr(anthropic, "AsyncAnthropic", fake_anthropic)
+
+    create_provider_runtime(
+        {
+            "API_PROVIDER": "openrouter",
+            "OPENROUTER_API_KEY": "test-key",
+            "OPENROUTER_BASE_URL": "http://127.0.0.1:8765/v1",
+        },
+        "midterm_interview",
+        1024,
+    )
+    create_provider_runtime(
+        {
+            "API_PROVIDER": "anthropic",
+            "ANTHROPIC_API_KEY": "test-key",
+            "ANTHROPIC_BASE_URL": "http://127.0.0.1:8765",
+        },
+        "midterm_interview",
+        1024,
+    )
+
+    assert calls[0]["base_url"] == "http://127.0.0.1:8765/v1"
+    assert calls[-1] == {"api_key": "test-key", "base_url": "http://127.0.0.1:8765"}
+
+
+def test_client_registry_key_hashes_api_key_and_orders_headers():
+    key = client_registry_key(
+        "openrouter", "secret-key", "https://example.test", {"b": "2", "a": "1"}
+    )
+
+    assert "secret-key" not in key
+    assert key == client_registry_key(
+        "openrouter", "secret-key", "https://example.test", {"a": "1", "b": "2"}
+    )
+    assert key != client_registry_key("openrouter", "secret-key", "https://example.test")
+
+
+def test_apply_prompt_cache_to_openai_kwargs_merges_extra_body_for_supported_providers():
+    kwargs = {"model": "m", "extra_body": {"reasoning": {"enabled": False}}}
+    cache_key = build_prompt_cache_key("midterm_interview", "m")
+
+    updated = apply_prompt_cache_to_openai_kwargs(kwargs, "openrouter", cache_key)
+
+    assert updated["extra_body"] == {
+        "reasoning": {"enabled": False},
+        "prompt_cache_key": cache_key,
+    }
+    assert kwargs["extra_body"] == {"reasoning": {"enabled": False}}
+    assert apply_prompt_cache_to_openai_kwargs(kwargs, "deepinfra", cache_key) is kwargs
+    assert cache_key == build_prompt_cache_key("midterm_interview", "m")
+    assert cache_key != build_prompt_cache_key("end_reflection", "m")
+
+
+def test_apply_prompt_cache_to_anthropic_kwargs_marks_system_and_history_prefix():
+    messages = [
+        {"role": "user", "content": "Begin"},
+        {"role": "assistant", "content": "Hello"},
+        {"role": "user", "content": "Hi"},
+    ]
+
+    updated = apply_prompt_cache_to_anthropic_kwargs(
+        {"system": "System prompt", "messages": messages}
+    )
+
+    assert updated["system"] == [
+        {"type": "text", "text": "System prompt", "cache_control": {"type": "ephemeral"}}
+    ]
+    assert updated["messages"][:2] == messages[:2]
+    assert updated["messages"][-1] == {
+        "role": "user",
+        "content": [
+            {"type": "text", "text": "Hi", "cache_control": {"type": "ephemeral"}}
+        ],
+    }
+    assert messages[-1] == {"role": "user", "content": "Hi"}
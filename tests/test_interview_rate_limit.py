@@ -0,0 +1,186 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import interview_rate_limit
+from interview_rate_limit import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    RateLimit,
+    RateLimitScheduler,
+    RateLimitTimeoutError,
+    TokenBucket,
+    parse_rate_limits,
+    parse_reset_seconds,
+    retry_after_seconds,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_state():
+    interview_rate_limit.reset_rate_limits()
+    yield
+    interview_rate_limit.reset_rate_limits()
+
+
+def test_parse_reset_seconds_understands_provider_formats():
+    now = 1_700_000_000.0
+
+    assert parse_reset_seconds("6m0s", now) == 360
+    assert parse_reset_seconds("20ms", now) == pytest.approx(0.02)
+    assert parse_reset_seconds("1.5", now) == 1.5
+    assert parse_reset_seconds(str(int((now + 30) * 1000)), now) == pytest.approx(30)
+    assert parse_reset_seconds("2023-11-14T22:13:50Z", now) == pytest.approx(30)
+    assert retry_after_seconds(
+        {"Retry-After": "Tue, 14 Nov 2023 22:14:00 GMT"}, now
+    ) == pytest.approx(40)
+    assert retry_after_seconds({"retry-after-ms": "250", "retry-after": "9"}, now) == 0.25
+    assert parse_reset_seconds("soon", now) is None
+
+
+def test_parse_rate_limits_reads_provider_and_model_budgets():
+    limits = parse_rate_limits(
+        {
+            "OPENROUTER_REQUESTS_PER_MINUTE": "200",
+            "RATE_LIMITS_JSON": '{"openrouter:openai/gpt-5.4": {"rpm": 20, "tpm": 40000}}',
+        }
+    )
+
+    assert limits == {
+        "openrouter": RateLimit(200.0, 0.0),
+        "openrouter:openai/gpt-5.4": RateLimit(20.0, 40000.0),
+    }
+
+
+def test_token_bucket_refills_evenly_and_carries_token_debt():
+    bucket = TokenBucket(per_minute=60, updated=0.0)
+
+    bucket.take(60, 0.0)
+    assert bucket.wait_seconds(1, 0.0) == 1.0
+    assert bucket.wait_seconds(1, 1.0) == 0.0
+
+    bucket.take(30, 1.0)
+    assert bucket.wait_seconds(10, 1.0) == pytest.approx(39.0)
+    assert bucket.wait_seconds(500, 61.0) == pytest.approx(29.0)
+    assert bucket.wait_seconds(500, 90.0) == 0.0
+
+
+def test_scheduler_enforces_model_budget_on_top_of_provider_budget():
+    now = [0.0]
+    scheduler = RateLimitScheduler(
+        {"deepinfra": RateLimit(requests_per_minute=600), "deepinfra:m": RateLimit(0, 1000)},
+        clock=lambda: now[0],
+    )
+
+    scheduler.acquire("deepinfra", "m", tokens=900)
+    with pytest.raises(RateLimitTimeoutError):
+        scheduler.acquire("deepinfra", "m", tokens=900, timeout=0)
+    scheduler.acquire("deepinfra", "other", tokens=900, timeout=0)
+
+    scheduler.record_usage("deepinfra", "m", estimated_tokens=900, actual_tokens=400)
+    scheduler.acquire("deepinfra", "m", tokens=500, timeout=0)
+
+    stats = {row["model"]: row for row in scheduler.stats()}
+    assert stats["m"]["granted"] == 2
+    assert stats["m"]["timeouts"] == 1
+
+
+def test_retry_after_pauses_key_and_live_turns_go_before_background_jobs():
+    scheduler = RateLimitScheduler()
+    order = []
+
+    pause = scheduler.record_rate_limited(
+        "openrouter", "m", {"retry-after-ms": "300"}
+    )
+
+    def request(name, priority):
+        scheduler.acquire("openrouter", "m", priority=priority, timeout=5)
+        order.append(name)
+
+    threads = [
+        threading.Thread(target=request, args=("summary", PRIORITY_BACKGROUND)),
+        threading.Thread(target=request, args=("turn", PRIORITY_INTERACTIVE)),
+    ]
+    threads[0].start()
+    while scheduler.stats()[0]["queued"] < 1:
+        time.sleep(0.005)
+    threads[1].start()
+    while scheduler.stats()[0]["queued"] < 2:
+        time.sleep(0.005)
+    snapshot = scheduler.stats()[0]
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert pause == pytest.approx(0.3)
+    assert order == ["turn", "summary"]
+    assert (snapshot["queued_interactive"], snapshot["queued_background"]) == (1, 1)
+    assert scheduler.stats()[0]["rate_limited"] == 1
+    assert scheduler.stats()[0]["max_queued"] == 2
+
+
+def _queued(scheduler, model):
+    return sum(row["queued"] for row in scheduler.stats() if row["model"] == model)
+
+
+def test_live_turn_goes_before_background_job_on_another_model_of_the_provider():
+    scheduler = RateLimitScheduler({"openrouter": RateLimit(tokens_per_minute=60000)})
+    order = []
+    scheduler.acquire("openrouter", "drain", tokens=60000)
+
+    def request(name, model, priority):
+        scheduler.acquire("openrouter", model, tokens=100, priority=priority, timeout=5)
+        order.append(name)
+
+    summary = threading.Thread(
+        target=request, args=("summary", "default-model", PRIORITY_BACKGROUND)
+    )
+    turn = threading.Thread(
+        target=request, args=("turn", "industry-model", PRIORITY_INTERACTIVE)
+    )
+    summary.start()
+    while _queued(scheduler, "default-model") < 1:
+        time.sleep(0.005)
+    turn.start()
+    for thread in (summary, turn):
+        thread.join(timeout=5)
+
+    assert order == ["turn", "summary"]
+
+
+def test_request_passes_earlier_one_held_back_by_its_own_model():
+    scheduler = RateLimitScheduler()
+    scheduler.record_rate_limited("openrouter", "paused", {"retry-after-ms": "300"})
+    waiting = threading.Thread(
+        target=scheduler.acquire, args=("openrouter", "paused"), kwargs={"timeout": 5}
+    )
+    waiting.start()
+    while _queued(scheduler, "paused") < 1:
+        time.sleep(0.005)
+
+    assert scheduler.acquire(
+        "openrouter", "other", priority=PRIORITY_BACKGROUND, timeout=0
+    ) == pytest.approx(0.0, abs=0.05)
+    waiting.join(timeout=5)
+
+
+def test_exhausted_remaining_header_pauses_until_reset():
+    now = [100.0]
+    scheduler = RateLimitScheduler(clock=lambda: now[0], wall_clock=lambda: 0.0)
+
+    paused = scheduler.update_from_headers(
+        "openai",
+        "gpt",
+        {"x-ratelimit-remaining-requests": "0", "x-ratelimit-reset-requests": "2s"},
+    )
+
+    assert paused == 2.0
+    with pytest.raises(RateLimitTimeoutError):
+        scheduler.acquire("openai", "gpt", timeout=0)
+    now[0] += 2.0
+    assert scheduler.acquire("openai", "gpt", timeout=0) == 0.0
+    assert scheduler.handle_error("openai", "gpt", RuntimeError("boom")) is False
+    assert scheduler.handle_error(
+        "openai", "gpt", SimpleNamespace(status_code=429, response=None)
+    ) is True
@@ -0,0 +1,96 @@
+import pytest
+
+import interview_reasoning
+from interview_reasoning import (
+    AdaptiveReasoningPolicy,
+    LatencySlo,
+    LatencyWindow,
+    parse_latency_slo,
+    percentile,
+    resolve_reasoning_policy,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_policy():
+    interview_reasoning.reset_reasoning_policy()
+    yield
+    interview_reasoning.reset_reasoning_policy()
+
+
+def _policy(now, **slo):
+    return AdaptiveReasoningPolicy(
+        LatencySlo(window_seconds=60, min_samples=3, **slo), clock=lambda: now[0]
+    )
+
+
+def test_latency_window_drops_samples_older_than_the_window():
+    window = LatencyWindow(window_seconds=60)
+    window.add(0.0, 9000, 12000)
+    window.add(30.0, 1000, None)
+    window.add(61.0, 2000, 3000)
+
+    assert window.p95(61.0) == (2, 2000, 3000)
+    assert percentile([1, 2, 3, 4, 100], 0.95) == 100
+    assert percentile([], 0.95) is None
+
+
+def test_adaptive_policy_steps_down_until_a_level_meets_the_slo():
+    now = [0.0]
+    policy = _policy(now, ttft_p95_ms=5000)
+    for _ in range(3):
+        policy.record("openrouter", "m", "medium", ttft_ms=8000, total_ms=9000)
+        policy.record("openrouter", "m", "low", ttft_ms=6000, total_ms=7000)
+        policy.record("openrouter", "m", "minimal", ttft_ms=1500, total_ms=4000)
+
+    decision = policy.choose("openrouter", "m", "medium")
+
+    assert decision.level == "minimal"
+    assert decision.downgraded is True
+    assert decision.reason == "medium ttft p95 8000ms > 5000ms; low ttft p95 6000ms > 5000ms"
+    assert policy.choose("openrouter", "m", "none").level == "none"
+    assert policy.choose("openrouter", "other", "medium").reason == "within latency SLO"
+
+
+def test_adaptive_policy_probes_a_level_again_once_slow_samples_expire():
+    now = [0.0]
+    policy = _policy(now, total_p95_ms=10000)
+    for _ in range(3):
+        policy.record("openrouter", "m", "medium", ttft_ms=None, total_ms=20000)
+
+    assert policy.choose("openrouter", "m", "medium").level == "low"
+    policy.record("openrouter", "m", "medium", ttft_ms=None, total_ms=20000)
+
+    now[0] = 120.0
+    decision = policy.choose("openrouter", "m", "medium")
+    assert (decision.level, decision.reason) == ("medium", "within latency SLO")
+
+
+def test_policy_without_slo_keeps_assigned_level_and_secrets_parse():
+    decision = AdaptiveReasoningPolicy().choose("openrouter", "m", "medium")
+
+    assert (decision.level, decision.reason) == ("medium", "no latency SLO configured")
+    assert resolve_reasoning_policy({"REASONING_POLICY": "Adaptive"}) == "adaptive"
+    assert resolve_reasoning_policy({"REASONING_POLICY": "fastest"}) == "random"
+    assert parse_latency_slo(
+        {"REASONING_TTFT_P95_SLO_MS": "4000", "REASONING_SLO_MIN_SAMPLES": "10"}
+    ) == LatencySlo(ttft_p95_ms=4000.0, min_samples=10)
+
+
+def test_module_policy_records_and_reports_rolling_stats():
+    interview_reasoning.configure_reasoning_slo({"REASONING_TTFT_P95_SLO_MS": "100"})
+    interview_reasoning.record_reasoning_latency(
+        "openrouter", "m", "medium", ttft_ms=50, total_ms=400
+    )
+
+    assert interview_reasoning.get_reasoning_latency_stats() == [
+        {
+            "provider": "openrouter",
+            "model": "m",
+            "reasoning_level": "medium",
+            "samples": 1,
+            "ttft_p95_ms": 50,
+            "total_p95_ms": 400,
+        }
+    ]
+    assert interview_reasoning.choose_reasoning_level("openrouter", "m", "medium").level == "medium"
@@ -0,0 +1,128 @@
+import threading
+from types import SimpleNamespace
+
+from interview_summary import (
+    REDUCE_PROMPT_PREFIX,
+    SUMMARY_PROMPT_PREFIX,
+    build_summary_completion,
+    chunk_transcript,
+    split_transcript_turns,
+    summarize_transcript,
+)
+from interview_provider import ModelSelection
+from interview_usage import TokenUsage
+
+
+def _transcript(turns: int, words_per_turn: int = 40, part_every: int = 0) -> str:
+    lines = []
+    for index in range(turns):
+        heading = ""
+        if part_every and index % part_every == 0:
+            heading = f"Let's move to Part {'I' * (index // part_every + 1)}. "
+        lines.append(f"assistant: {heading}Question {index}?\n")
+        lines.append(f"user: {'answer ' * words_per_turn}\nsecond line {index}\n")
+    return "".join(lines)
+
+
+def test_split_transcript_turns_keeps_multiline_turns_together():
+    transcript = "assistant: Hello\nuser: First line\nsecond line\nassistant: Next?\n"
+
+    assert split_transcript_turns(transcript) == [
+        "assistant: Hello\n",
+        "user: First line\nsecond line\n",
+        "assistant: Next?\n",
+    ]
+
+
+def test_chunk_transcript_respects_budget_and_prefers_part_boundaries():
+    transcript = _transcript(12, part_every=4)
+
+    chunks = chunk_transcript(transcript, chunk_tokens=400)
+
+    assert "".join(chunks) == transcript
+    assert [chunk.startswith("assistant: Let's move to Part") for chunk in chunks] == [
+        True,
+        True,
+        True,
+    ]
+    small_chunks = chunk_transcript(transcript, chunk_tokens=120)
+    assert len(small_chunks) > 3
+    assert "".join(small_chunks) == transcript
+
+
+def test_summarize_transcript_uses_one_call_below_threshold():
+    calls = []
+
+    def complete(system_prompt, prompt, max_tokens):
+        calls.append((prompt, max_tokens))
+        return "Short summary", TokenUsage(input_tokens=100, output_tokens=20)
+
+    summary, usage, mode = summarize_transcript(
+        "assistant: Hi\nuser: Hello\n", complete, single_shot_token_limit=1000
+    )
+
+    assert (summary, mode) == ("Short summary", "single")
+    assert usage.input_tokens == 100
+    assert calls == [(SUMMARY_PROMPT_PREFIX + "assistant: Hi\nuser: Hello\n", None)]
+
+
+def test_summarize_transcript_maps_chunks_in_parallel_then_reduces_in_order():
+    transcript = _transcript(16)
+    in_flight = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+    barrier = threading.Barrier(2, timeout=5)
+    reduce_prompts = []
+
+    def complete(system_prompt, prompt, max_tokens):
+        if prompt.startswith(REDUCE_PROMPT_PREFIX):
+            reduce_prompts.append(prompt)
+            return "Final summary", TokenUsage(input_tokens=50, output_tokens=30)
+        with lock:
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        try:
+            barrier.wait()
+        except threading.BrokenBarrierError:
+            pass
+        with lock:
+            in_flight["now"] -= 1
+        index = prompt.split("(", 1)[1].split(" ", 1)[0]
+        return f"chunk {index}", TokenUsage(input_tokens=200, output_tokens=10)
+
+    summary, usage, mode = summarize_transcript(
+        transcript, complete, single_shot_token_limit=500, chunk_tokens=300
+    )
+
+    assert (summary, mode) == ("Final summary", "map_reduce")
+    assert in_flight["peak"] >= 2
+    chunk_count = len(chunk_transcript(transcript, 300))
+    merged = reduce_prompts[0][len(REDUCE_PROMPT_PREFIX):]
+    assert merged.startswith("Part 1:\nchunk 1\n\nPart 2:\nchunk 2")
+    assert usage.input_tokens == 200 * chunk_count + 50
+
+
+def test_build_summary_completion_uses_the_summary_selection():
+    requests = []
+
+    def create(**kwargs):
+        requests.append(kwargs)
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=" Summary "))],
+            usage=None,
+        )
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    complete = build_summary_completion(
+        "openrouter",
+        "openai",
+        client,
+        ModelSelection(
+            model="qwen/qwen3.5-35b-a3b", max_tokens=250, reasoning={"enabled": False}
+        ),
+    )
+
+    assert complete("system", "prompt", None) == ("Summary", None)
+    complete("system", "chunk", 400)
+    assert requests[0]["model"] == "qwen/qwen3.5-35b-a3b"
+    assert [request["max_tokens"] for request in requests] == [250, 400]
+    assert requests[0]["extra_body"] == {"reasoning": {"enabled": False}}
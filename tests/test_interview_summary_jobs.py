@@ -0,0 +1,93 @@
+from interview_summary_jobs import (
+    SummaryJob,
+    run_summary_job,
+    submit_summary_job,
+    summary_retry_delay,
+)
+
+
+JOB = SummaryJob(
+    interview_id="interview-1",
+    interview_type="midterm_interview",
+    timestamp="2026-03-12 10:00:00",
+    transcript_text="assistant: Hello\nuser: Hi\n",
+)
+
+
+def _recorder():
+    calls = []
+
+    def save_status(job, status, *, attempts, error=""):
+        calls.append(("status", status, attempts, error))
+
+    def save_summary(job, summary_text, usage):
+        calls.append(("summary", job.interview_id, summary_text, usage))
+
+    return calls, save_status, save_summary
+
+
+def test_run_summary_job_retries_with_backoff_then_saves():
+    calls, save_status, save_summary = _recorder()
+    sleeps = []
+    outcomes = [RuntimeError("rate limited"), ("Short summary", {"output_tokens": 12})]
+
+    def summarize(transcript_text):
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    status = run_summary_job(
+        JOB,
+        summarize=summarize,
+        save_summary=save_summary,
+        save_status=save_status,
+        sleep=sleeps.append,
+    )
+
+    assert status == "done"
+    assert calls == [
+        ("status", "running", 1, ""),
+        ("status", "retrying", 1, "rate limited"),
+        ("status", "running", 2, ""),
+        ("summary", "interview-1", "Short summary", {"output_tokens": 12}),
+    ]
+    assert sleeps == [summary_retry_delay(1)]
+
+
+def test_run_summary_job_marks_failed_after_last_attempt():
+    calls, save_status, save_summary = _recorder()
+
+    def summarize(transcript_text):
+        raise TimeoutError("provider timed out")
+
+    status = run_summary_job(
+        JOB,
+        summarize=summarize,
+        save_summary=save_summary,
+        save_status=save_status,
+        max_attempts=2,
+        sleep=lambda seconds: None,
+    )
+
+    assert status == "failed"
+    assert calls[-1] == ("status", "failed", 2, "provider timed out")
+    assert not any(call[0] == "summary" for call in calls)
+    assert [summary_retry_delay(n) for n in (1, 2, 3)] == [5.0, 10.0, 20.0]
+
+
+def test_submit_summary_job_survives_status_write_failures():
+    saved = []
+
+    def save_status(job, status, **kwargs):
+        raise ConnectionError("ssh unavailable")
+
+    future = submit_summary_job(
+        JOB,
+        summarize=lambda transcript_text: ("Summary", None),
+        save_summary=lambda job, text, usage: saved.append(text),
+        save_status=save_status,
+    )
+
+    assert future.result(timeout=5) == "done"
+    assert saved == ["Summary"]
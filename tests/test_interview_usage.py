@@ -0,0 +1,132 @@
+from types import SimpleNamespace
+
+import pytest
+
+from interview_usage import (
+    MODEL_PRICES,
+    ModelPrice,
+    TokenUsage,
+    estimate_cost_usd,
+    extract_anthropic_usage,
+    extract_openai_usage,
+    interview_usage_totals,
+    load_model_prices,
+    resolve_model_price,
+    total_usage,
+)
+
+
+def test_extract_usage_normalizes_openai_and_anthropic_payloads():
+    openai_usage = SimpleNamespace(
+        prompt_tokens=4000,
+        completion_tokens=300,
+        prompt_tokens_details=SimpleNamespace(cached_tokens=3072),
+        completion_tokens_details=SimpleNamespace(reasoning_tokens=120),
+    )
+    anthropic_usage = SimpleNamespace(
+        input_tokens=50,
+        output_tokens=80,
+        cache_read_input_tokens=3000,
+        cache_creation_input_tokens=200,
+    )
+
+    assert extract_openai_usage(openai_usage).as_dict() == {
+        "input_tokens": 4000,
+        "cache_hit_tokens": 3072,
+        "cache_miss_tokens": 928,
+        "cache_write_tokens": 0,
+        "output_tokens": 300,
+        "reasoning_tokens": 120,
+    }
+    assert extract_anthropic_usage(anthropic_usage).as_dict() == {
+        "input_tokens": 3250,
+        "cache_hit_tokens": 3000,
+        "cache_miss_tokens": 250,
+        "cache_write_tokens": 200,
+        "output_tokens": 80,
+        "reasoning_tokens": 0,
+    }
+    assert extract_openai_usage({"prompt_tokens": 10}).cache_miss_tokens == 10
+    assert extract_openai_usage(None) is None
+
+
+def test_resolve_model_price_ignores_vendor_prefix_and_date_suffix():
+    assert resolve_model_price("openai/gpt-4o-mini") is resolve_model_price("gpt-4o-mini")
+    assert resolve_model_price("gpt-4o-mini-2024-07-18") is resolve_model_price("gpt-4o-mini")
+    assert resolve_model_price("claude-3-5-haiku-20241022") is not None
+    assert resolve_model_price("qwen/unknown-model") is None
+
+
+def test_resolve_model_price_covers_the_default_models_and_dotted_versions():
+    gpt_5_4 = resolve_model_price("openai/gpt-5.4")
+
+    assert gpt_5_4 is MODEL_PRICES["gpt-5.4"]
+    assert resolve_model_price("gpt-5.4-2026-03-05") is gpt_5_4
+    assert resolve_model_price("gpt-5.4-mini") is MODEL_PRICES["gpt-5.4-mini"]
+    assert resolve_model_price("qwen/qwen3.5-35b-a3b") is MODEL_PRICES["qwen3.5-35b-a3b"]
+    assert resolve_model_price("gpt-5.5") is None
+
+
+def test_estimate_cost_usd_prices_cached_and_output_tokens_separately():
+    prices = {"demo": ModelPrice(input=2.0, cached_input=0.5, output=8.0, cache_write=2.5)}
+    usage = TokenUsage(
+        input_tokens=1_000_000,
+        cache_read_tokens=400_000,
+        cache_write_tokens=100_000,
+        output_tokens=250_000,
+    )
+
+    assert estimate_cost_usd("demo", usage, prices) == pytest.approx(
+        0.5 * 2.0 + 0.4 * 0.5 + 0.1 * 2.5 + 0.25 * 8.0
+    )
+    assert estimate_cost_usd("other", usage, prices) is None
+
+
+def test_load_model_prices_merges_json_overrides():
+    prices = load_model_prices(
+        '{"openai/gpt-5.4": {"input": 1.5, "cached_input": 0.15, "output": 12}}'
+    )
+
+    assert prices["openai/gpt-5.4"] == ModelPrice(input=1.5, cached_input=0.15, output=12.0)
+    assert "gpt-4o-mini" in prices
+
+
+def test_total_usage_sums_entries_and_refuses_partial_cost():
+    entries = [
+        {"input_tokens": 100, "cache_hit_tokens": 60, "output_tokens": 20, "cost_usd": 0.01},
+        {"input_tokens": 50, "output_tokens": 10, "reasoning_tokens": 5, "cost_usd": 0.02},
+    ]
+
+    assert total_usage(entries) == {
+        "input_tokens": 150,
+        "cached_input_tokens": 60,
+        "cache_write_tokens": 0,
+        "output_tokens": 30,
+        "reasoning_tokens": 5,
+        "cost_usd": 0.03,
+    }
+    assert total_usage(entries + [{"input_tokens": 1, "cost_usd": None}])["cost_usd"] is None
+
+
+def test_interview_totals_include_finished_rolling_summaries():
+    turn_usage = [
+        {"kind": "chat", "input_tokens": 1000, "output_tokens": 100, "cost_usd": 0.004},
+        {"kind": "chat", "input_tokens": 1200, "output_tokens": 120, "cost_usd": 0.005},
+    ]
+    chat_only = interview_usage_totals(turn_usage)
+    with_summary = interview_usage_totals(
+        turn_usage
+        + [
+            {
+                "kind": "context_summary",
+                "input_tokens": 900,
+                "output_tokens": 150,
+                "cost_usd": 0.003,
+            }
+        ]
+    )
+
+    assert chat_only["cost_usd"] == 0.009
+    assert with_summary["cost_usd"] == 0.012
+    assert with_summary["input_tokens"] == 3100
+    assert with_summary["output_tokens"] == 370
@@ -0,0 +1,88 @@
+import os
+import threading
+
+import pytest
+
+import interview_warmup
+from interview_warmup import (
+    WarmupRunner,
+    available_config_names,
+    load_interview_config,
+    preload_interview_configs,
+    resolve_warmup_interval,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_warmup():
+    interview_warmup.reset_warmup()
+    yield
+    interview_warmup.reset_warmup()
+
+
+def test_load_interview_config_reuses_module_until_file_changes(monkeypatch, tmp_path):
+    (tmp_path / "base_config.py").write_text("SHARED = 1\n")
+    config_file = tmp_path / "pilot.py"
+    config_file.write_text("MAX_OUTPUT_TOKENS = 10\n")
+    monkeypatch.setattr(interview_warmup, "CONFIG_DIRECTORY", tmp_path)
+
+    first = load_interview_config("pilot")
+    assert load_interview_config("pilot") is first
+    assert available_config_names() == ["pilot"]
+
+    config_file.write_text("MAX_OUTPUT_TOKENS = 20\n")
+    stat = config_file.stat()
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert load_interview_config("pilot").MAX_OUTPUT_TOKENS == 20
+
+
+def test_preload_interview_configs_loads_shipped_configs():
+    names = preload_interview_configs()
+
+    assert {"midterm_interview", "industry_org_survey", "end_reflection_interview"} <= set(names)
+    assert load_interview_config("midterm_interview").MAX_OUTPUT_TOKENS == 1024
+
+
+def test_warmup_runner_reports_readiness_and_failed_steps():
+    ticks = iter(range(100))
+    runner = WarmupRunner(clock=lambda: next(ticks), wall_clock=lambda: 1000.0)
+    calls = []
+
+    def fail():
+        raise ConnectionError("ssh down")
+
+    runner.steps = {"configs": lambda: calls.append("configs"), "storage": fail}
+    runner.run_once()
+    status = runner.status()
+
+    assert calls == ["configs"]
+    assert status["ready"] is False
+    assert {step["name"]: step["error"] for step in status["steps"]} == {
+        "configs": "",
+        "storage": "ssh down",
+    }
+
+    runner.steps = {"configs": lambda: None}
+    runner.run_once()
+    assert runner.status()["ready"] is True
+    assert runner.status()["runs"] == 2
+
+
+def test_ensure_warmup_starts_one_background_thread():
+    ran = threading.Event()
+    calls = []
+
+    def step():
+        calls.append(1)
+        ran.set()
+
+    interview_warmup.ensure_warmup({"step": step}, interval_seconds=0)
+    interview_warmup.ensure_warmup({"step": step}, interval_seconds=0)
+    assert ran.wait(5)
+    interview_warmup._WARMUP._thread.join(timeout=5)
+
+    assert calls == [1]
+    assert interview_warmup.is_warm() is True
+    assert resolve_warmup_interval({"WARMUP_INTERVAL_SECONDS": "60"}) == 60.0
+    assert resolve_warmup_interval({"WARMUP_INTERVAL_SECONDS": "soon"}) == 240.0
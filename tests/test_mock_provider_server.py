@@ -0,0 +1,85 @@
+import json
+import urllib.request
+
+import anthropic
+import openai
+import pytest
+
+from interview_async_provider import preconnect_async_client
+from interview_provider import clear_client_registry, get_cached_client, preconnect_client
+from mock_provider_server import MockProviderServer, MockProviderSettings
+
+
+FAST = {"tokens_per_second": 0, "ttft_seconds": 0, "reply_tokens": 5}
+
+
+def _stats(server):
+    with urllib.request.urlopen(f"{server.root_url}/stats") as response:
+        return json.loads(response.read())
+
+
+def test_openai_client_streams_and_completes_against_mock():
+    with MockProviderServer(MockProviderSettings(**FAST)) as server:
+        client = openai.OpenAI(api_key="test", base_url=server.base_url, max_retries=0)
+        stream = client.chat.completions.create(
+            model="mock",
+            messages=[{"role": "user", "content": "Hello there"}],
+            stream=True,
+            stream_options={"include_usage": True},
+        )
+        chunks = list(stream)
+        completion = client.chat.completions.create(
+            model="mock", messages=[{"role": "user", "content": "Hello"}]
+        )
+        stats = _stats(server)
+
+    text = "".join(chunk.choices[0].delta.content or "" for chunk in chunks if chunk.choices)
+    assert len(text.split()) == 5
+    assert chunks[-1].usage.completion_tokens == 5
+    assert completion.choices[0].message.content == text.strip()
+    assert (stats["requests"], stats["streamed"]) == (2, 1)
+
+
+def test_anthropic_client_streams_against_mock():
+    with MockProviderServer(MockProviderSettings(**FAST)) as server:
+        client = anthropic.Anthropic(api_key="test", base_url=server.root_url, max_retries=0)
+        with client.messages.stream(
+            model="mock",
+            max_tokens=50,
+            system="Be brief.",
+            messages=[{"role": "user", "content": "Hello there"}],
+        ) as stream:
+            text = "".join(stream.text_stream)
+            message = stream.get_final_message()
+
+    assert len(text.split()) == 5
+    assert message.usage.output_tokens == 5
+    assert message.usage.input_tokens > 0
+
+
+def test_injected_rate_limits_carry_retry_after():
+    settings = MockProviderSettings(**FAST, rate_limit_rate=1.0, retry_after_seconds=2)
+    with MockProviderServer(settings) as server:
+        client = openai.OpenAI(api_key="test", base_url=server.base_url, max_retries=0)
+        with pytest.raises(openai.RateLimitError) as exc_info:
+            client.chat.completions.create(
+                model="mock", messages=[{"role": "user", "content": "Hi"}], stream=True
+            )
+        stats = _stats(server)
+
+    assert exc_info.value.response.headers["retry-after"] == "2"
+    assert stats["rate_limited"] == 1
+
+
+def test_preconnect_opens_pooled_connections_without_a_completion():
+    with MockProviderServer(MockProviderSettings(**FAST)) as server:
+        client = get_cached_client("openai", "test", base_url=server.base_url)
+        async_client = get_cached_client(
+            "openai", "test", base_url=server.base_url, asynchronous=True
+        )
+
+        assert preconnect_client(client) is True
+        assert preconnect_async_client(async_client) is True
+        assert preconnect_client(object()) is False
+        assert _stats(server)["requests"] == 0
+    clear_client_registry()
@@ -1,6 +1,9 @@
 import ast
 import base64
 import json
+import sqlite3
+import subprocess
+import sys
 from pathlib import Path
 
 import remote_utils
@@ -190,3 +193,97 @@ def test_run_remote_sql_batch_encodes_operations_and_decodes_results(monkeypatch
         ],
     }
     assert result == [["summary text"], [[0, "survey_helpfulness", "TEXT", 0, None, 0]]]
+
+
+def test_remote_batch_runner_federates_only_existing_files(monkeypatch, tmp_path):
+    with sqlite3.connect(tmp_path / "interviews.db") as conn:
+        conn.execute("CREATE TABLE progress (student_id TEXT)")
+        conn.execute("INSERT INTO progress VALUES ('s1')")
+    monkeypatch.setattr(
+        remote_utils,
+        "run_remote_python",
+        lambda ssh, python_code: subprocess.run(
+            [sys.executable, "-c", python_code], capture_output=True, text=True, check=True
+        ).stdout.strip(),
+    )
+
+    result = remote_utils.run_remote_sql_batch(
+        object(),
+        ":memory:",
+        [
+            {
+                "type": "attach_existing",
+                "databases": [
+                    ["shard_0", str(tmp_path / "interviews-2025-2026.db")],
+                    ["shard_1", str(tmp_path / "interviews.db")],
+                ],
+            },
+            {
+                "type": "federated_view",
+                "table": "progress",
+                "columns": ["student_id", "name"],
+            },
+            {"type": "execute", "sql_query": "SELECT * FROM progress", "fetch": "all"},
+        ],
+    )
+
+    assert result == [[["s1", None]]]
+    assert not (tmp_path / "interviews-2025-2026.db").exists()
+
+
+def test_pooled_ssh_connection_is_reused_until_transport_dies(monkeypatch, tmp_path):
+    class FakeTransport:
+        def __init__(self):
+            self.active = True
+            self.keepalive = None
+
+        def is_active(self):
+            return self.active
+
+        def set_keepalive(self, seconds):
+            self.keepalive = seconds
+
+    class FakeSSH:
+        def __init__(self):
+            self.transport = FakeTransport()
+            self.closed = False
+
+        def get_transport(self):
+            return self.transport
+
+        def close(self):
+            self.closed = True
+
+    connections = []
+
+    def fake_connect(timeout_seconds=None, retries=None):
+        key_file = tmp_path / f"key-{len(connections)}"
+        key_file.write_text("key")
+        connections.append(FakeSSH())
+        return connections[-1], str(key_file)
+
+    monkeypatch.setattr(
+        remote_utils,
+        "get_secret",
+        _fake_secrets({"REMOTE_SSH_USERNAME": "user", "REMOTE_SSH_KEY": "key"}),
+    )
+    monkeypatch.setattr(remote_utils, "get_ssh_connection", fake_connect)
+    remote_utils.close_ssh_pool()
+
+    first, key_path = remote_utils.get_pooled_ssh_connection()
+    remote_utils.release_pooled_ssh_connection(first, key_path)
+    second, _ = remote_utils.get_pooled_ssh_connection()
+
+    assert second is first and key_path is None
+    assert first.closed is False
+    assert first.transport.keepalive == remote_utils.SSH_KEEPALIVE_SECONDS
+    assert not (tmp_path / "key-0").exists()
+
+    first.transport.active = False
+    remote_utils.release_pooled_ssh_connection(first, None)
+    third, _ = remote_utils.get_pooled_ssh_connection()
+
+    assert first.closed is True
+    assert third is connections[1]
+    remote_utils.close_ssh_pool()
+    assert third.closed is True
@@ -0,0 +1,177 @@
+import json
+
+import pytest
+
+import database
+import resummarize_interviews
+from database_maintenance import summary_backfill_candidates
+from resummarize_interviews import RequestPacer, load_checkpoint, main, run_backfill
+
+
+SETTINGS = {"mode": "missing", "interview_type": "", "shard": ""}
+
+
+@pytest.fixture
+def local_database(monkeypatch, tmp_path):
+    secrets = {
+        "DATABASE_BACKEND": "local",
+        "LOCAL_DATABASE_DIRECTORY": str(tmp_path / "db"),
+    }
+    monkeypatch.setattr(
+        database, "get_secret", lambda key, default=None: secrets.get(key, default)
+    )
+    for index in range(5):
+        database.persist_completion_remote(
+            f"interview-{index}",
+            f"student-{index}",
+            "Miros",
+            "ACME",
+            "midterm_interview",
+            "2026-03-12 10:00:00",
+            f"assistant: Hello {index}\nuser: Hi\n",
+            "12.50",
+            summary_status="failed" if index == 1 else "pending",
+        )
+    database.update_interview_summary("interview-0", "existing summary")
+    database.update_summary_status("interview-4", "running", attempts=1)
+    return database.get_storage_backend()
+
+
+def _summaries(backend):
+    return backend.query(
+        "SELECT interview_id, summary, summary_status FROM interviews ORDER BY interview_id",
+        [],
+        fetch="all",
+    )
+
+
+def test_summary_backfill_candidates_pages_missing_and_failed_rows(local_database):
+    first_page = summary_backfill_candidates(local_database, limit=1)
+    rest = summary_backfill_candidates(
+        local_database, after_interview_id=first_page[-1]["interview_id"]
+    )
+
+    assert [row["interview_id"] for row in first_page + rest] == [
+        "interview-1",
+        "interview-2",
+        "interview-3",
+    ]
+    assert first_page[0]["transcript"] == "assistant: Hello 1\nuser: Hi\n"
+    assert len(summary_backfill_candidates(local_database, mode="all")) == 5
+
+
+def test_run_backfill_writes_groups_and_resumes_from_checkpoint(local_database, tmp_path):
+    checkpoint_path = tmp_path / "checkpoint.json"
+    writes = []
+
+    def summarize_for(interview_type):
+        def summarize(transcript_text):
+            if "Hello 3" in transcript_text:
+                raise TimeoutError("provider timed out")
+            return f"summary of {transcript_text.split()[2]}", {"output_tokens": 5}
+
+        return "qwen/qwen3.5-35b-a3b", summarize
+
+    def write_results(results):
+        writes.append([result["interview_id"] for result in results])
+        database.save_summary_results(results)
+
+    def fetch_page(after_interview_id, limit):
+        return summary_backfill_candidates(
+            local_database, after_interview_id=after_interview_id, limit=limit
+        )
+
+    first_run = run_backfill(
+        fetch_page=fetch_page,
+        summarize_for=summarize_for,
+        write_results=write_results,
+        checkpoint_path=checkpoint_path,
+        settings=SETTINGS,
+        page_size=2,
+        batch_size=1,
+        limit=2,
+        max_attempts=1,
+    )
+
+    assert first_run["after_interview_id"] == "interview-2"
+    assert first_run["finished"] is False
+    assert writes == [["interview-1"], ["interview-2"]]
+    assert json.loads(checkpoint_path.read_text())["done"] == 2
+
+    second_run = run_backfill(
+        fetch_page=fetch_page,
+        summarize_for=summarize_for,
+        write_results=write_results,
+        checkpoint_path=checkpoint_path,
+        settings=SETTINGS,
+        page_size=2,
+        max_attempts=1,
+    )
+
+    assert writes[-1] == ["interview-3"]
+    assert (second_run["processed"], second_run["done"], second_run["failed"]) == (3, 2, 1)
+    assert second_run["finished"] is True
+    assert local_database.query(
+        "SELECT summary_model FROM interviews WHERE interview_id = ?",
+        ["interview-2"],
+        fetch="one",
+    ) == ["qwen/qwen3.5-35b-a3b"]
+    assert _summaries(local_database) == [
+        ["interview-0", "existing summary", "done"],
+        ["interview-1", "summary of 1", "done"],
+        ["interview-2", "summary of 2", "done"],
+        ["interview-3", None, "failed"],
+        ["interview-4", None, "running"],
+    ]
+    error = local_database.query(
+        "SELECT summary_error FROM interviews WHERE interview_id = ?",
+        ["interview-3"],
+        fetch="one",
+    )
+    assert error == ["provider timed out"]
+    assert load_checkpoint(checkpoint_path, SETTINGS)["after_interview_id"] == ""
+
+
+def test_load_checkpoint_refuses_other_settings(tmp_path):
+    checkpoint_path = tmp_path / "checkpoint.json"
+    checkpoint_path.write_text(json.dumps({**SETTINGS, "after_interview_id": "x"}))
+
+    assert load_checkpoint(checkpoint_path, SETTINGS)["after_interview_id"] == "x"
+    with pytest.raises(ValueError, match="mode"):
+        load_checkpoint(checkpoint_path, {**SETTINGS, "mode": "all"})
+
+
+def test_request_pacer_spaces_calls_across_workers():
+    now = [0.0]
+    sleeps = []
+    pacer = RequestPacer(120, clock=lambda: now[0], sleep=sleeps.append)
+
+    for _ in range(3):
+        pacer.acquire()
+
+    assert sleeps == [0.5, 1.0]
+
+
+def test_main_configures_rate_limits_and_only_rejects_bad_arguments(
+    monkeypatch, tmp_path, capsys
+):
+    secrets = {"OPENROUTER_TOKENS_PER_MINUTE": "1000"}
+    configured = []
+    monkeypatch.setattr(resummarize_interviews, "get_storage_backend", lambda **_: None)
+    monkeypatch.setattr(resummarize_interviews, "load_local_secrets", lambda: secrets)
+    monkeypatch.setattr(resummarize_interviews, "configure_rate_limits", configured.append)
+    checkpoint_path = tmp_path / "checkpoint.json"
+    checkpoint_path.write_text(json.dumps({**SETTINGS, "after_interview_id": "x"}))
+
+    with pytest.raises(SystemExit):
+        main(["--checkpoint-file", str(checkpoint_path), "--mode", "all"])
+    assert "different mode" in capsys.readouterr().err
+    assert configured == []
+
+    def failing_backfill(**kwargs):
+        raise ValueError("provider rejected the request")
+
+    monkeypatch.setattr(resummarize_interviews, "run_backfill", failing_backfill)
+    with pytest.raises(ValueError, match="provider rejected"):
+        main(["--checkpoint-file", str(checkpoint_path)])
+    assert configured == [secrets]
@@ -0,0 +1,411 @@
+import pytest
+
+import database
+from database_maintenance import pending_summaries_report
+from storage_backend import LocalSqliteBackend, normalize_backend_name
+
+
+def _local_backend(tmp_path):
+    directory = tmp_path / "db"
+    return LocalSqliteBackend(
+        directory=str(directory),
+        db_path=str(directory / "interviews.db"),
+    )
+
+
+def test_local_backend_runs_batch_operations_and_returns_json_rows(tmp_path):
+    backend = _local_backend(tmp_path)
+
+    results = backend.run_batch(
+        [
+            {"type": "execute", "sql_query": database.INTERVIEWS_TABLE_QUERY},
+            {
+                "type": "ensure_columns",
+                "table": "interviews",
+                "columns": database.EMAIL_STATUS_COLUMNS,
+            },
+            database._build_interview_insert_operation(
+                "interview-1",
+                "student-1",
+                "Miros",
+                "ACME",
+                "midterm_interview",
+                "2026-03-12 10:00:00",
+                "assistant: Hello",
+                "12.50",
+            ),
+            {
+                "type": "execute",
+                "sql_query": "SELECT interview_id, email_status FROM interviews",
+                "fetch": "all",
+            },
+        ],
+        ensure_directory=True,
+    )
+
+    assert results == [[["interview-1", None]]]
+
+
+def test_local_backend_rejects_unknown_operations(tmp_path):
+    backend = _local_backend(tmp_path)
+
+    with pytest.raises(ValueError, match="Unsupported batch operation"):
+        backend.run_batch([{"type": "vacuum"}], ensure_directory=True)
+
+
+def test_normalize_backend_name_defaults_to_ssh_and_rejects_unknown():
+    assert normalize_backend_name(None) == "ssh"
+    assert normalize_backend_name(" Local ") == "local"
+    with pytest.raises(ValueError, match="DATABASE_BACKEND"):
+        normalize_backend_name("postgres")
+
+
+def test_public_database_functions_round_trip_through_local_backend(
+    monkeypatch, tmp_path
+):
+    secrets = {
+        "DATABASE_BACKEND": "local",
+        "LOCAL_DATABASE_DIRECTORY": str(tmp_path / "db"),
+    }
+    monkeypatch.setattr(
+        database, "get_secret", lambda key, default=None: secrets.get(key, default)
+    )
+
+    database.persist_completion_remote(
+        "interview-1",
+        "student-1",
+        "Miros",
+        "ACME",
+        "midterm_interview",
+        "2026-03-12 10:00:00",
+        "assistant: Hello",
+        "12.50",
+    )
+    database.update_interview_summary("interview-1", "summary text")
+
+    assert (
+        database.get_transcript_by_student_and_type("student-1", "midterm_interview")
+        == "summary text"
+    )
+    assert (tmp_path / "db" / "interviews.db").is_file()
+
+
+def test_latest_summaries_track_newest_summary_and_backfill_history(
+    monkeypatch, tmp_path
+):
+    secrets = {
+        "DATABASE_BACKEND": "local",
+        "LOCAL_DATABASE_DIRECTORY": str(tmp_path / "db"),
+    }
+    monkeypatch.setattr(
+        database, "get_secret", lambda key, default=None: secrets.get(key, default)
+    )
+    for interview_id, timestamp in [
+        ("older", "2026-01-10 10:00:00"),
+        ("newer", "2026-03-12 10:00:00"),
+    ]:
+        database.persist_completion_remote(
+            interview_id,
+            "student-1",
+            "Miros",
+            "ACME",
+            "midterm_interview",
+            timestamp,
+            "assistant: Hello",
+            "12.50",
+        )
+
+    database.update_interview_summary("newer", "newer summary")
+    database.update_interview_summary("older", "older summary")
+
+    assert (
+        database.get_transcript_by_student_and_type("student-1", "midterm_interview")
+        == "newer summary"
+    )
+
+    backend = database.get_storage_backend()
+    backend.run_batch([{"type": "execute", "sql_query": "DELETE FROM latest_summaries"}])
+
+    assert database.backfill_latest_summaries() == 1
+    assert (
+        database.get_transcript_by_student_and_type("student-1", "midterm_interview")
+        == "newer summary"
+    )
+
+
+def test_context_read_falls_back_to_interviews_before_backfill(monkeypatch, tmp_path):
+    secrets = {
+        "DATABASE_BACKEND": "local",
+        "LOCAL_DATABASE_DIRECTORY": str(tmp_path / "db"),
+    }
+    monkeypatch.setattr(
+        database, "get_secret", lambda key, default=None: secrets.get(key, default)
+    )
+    backend = database.get_storage_backend()
+    backend.run_batch(
+        [
+            {"type": "execute", "sql_query": database.INTERVIEWS_TABLE_QUERY},
+            {
+                "type": "execute",
+                "sql_query": """
+                INSERT INTO interviews (
+                    interview_id, student_id, interview_type, timestamp, summary
+                )
+                VALUES
+                    ('older', 'student-1', 'midterm_interview', '2026-01-10', 'older summary'),
+                    ('newer', 'student-1', 'midterm_interview', '2026-03-12', 'newer summary'),
+                    ('empty', 'student-1', 'midterm_interview', '2026-04-01', '')
+                """,
+            },
+        ],
+        ensure_directory=True,
+    )
+
+    assert (
+        database.get_transcript_by_student_and_type("student-1", "midterm_interview")
+        == "newer summary"
+    )
+    assert (
+        database.get_transcript_by_student_and_type("student-2", "midterm_interview")
+        == ""
+    )
+
+
+def test_academic_year_sharding_routes_writes_and_federates_context_reads(
+    monkeypatch, tmp_path
+):
+    secrets = {
+        "DATABASE_BACKEND": "local",
+        "LOCAL_DATABASE_DIRECTORY": str(tmp_path / "db"),
+        "DATABASE_SHARDING": "academic_year",
+    }
+    monkeypatch.setattr(
+        database, "get_secret", lambda key, default=None: secrets.get(key, default)
+    )
+    monkeypatch.setattr(
+        database,
+        "get_read_shard_keys",
+        lambda interview_type="": ["2026-2027", "2025-2026"],
+    )
+    legacy = database.get_storage_backend()
+    legacy.run_batch(
+        [
+            {"type": "execute", "sql_query": database.LATEST_SUMMARIES_TABLE_QUERY},
+            {
+                "type": "execute",
+                "sql_query": """
+                INSERT INTO latest_summaries
+                VALUES ('student-2', 'midterm_interview', 'old', '2024-03-12', 'old summary')
+                """,
+            },
+        ],
+        ensure_directory=True,
+    )
+
+    database.persist_completion_remote(
+        "midterm",
+        "student-1",
+        "Miros",
+        "ACME",
+        "midterm_interview",
+        "2026-03-12 10:00:00",
+        "assistant: Hello",
+        "12.50",
+    )
+    database.update_interview_summary(
+        "midterm",
+        "midterm summary",
+        interview_type="midterm_interview",
+        timestamp="2026-03-12 10:00:00",
+    )
+
+    assert (tmp_path / "db" / "interviews-2025-2026.db").is_file()
+    assert (
+        database.get_transcript_by_student_and_type("student-1", "midterm_interview")
+        == "midterm summary"
+    )
+    assert (
+        database.get_transcript_by_student_and_type("student-2", "midterm_interview")
+        == "old summary"
+    )
+    assert not (tmp_path / "db" / "interviews-2026-2027.db").exists()
+
+
+def test_sharded_updates_follow_the_interview_timestamp(monkeypatch, tmp_path):
+    secrets = {
+        "DATABASE_BACKEND": "local",
+        "LOCAL_DATABASE_DIRECTORY": str(tmp_path / "db"),
+        "DATABASE_SHARDING": "academic_year",
+    }
+    monkeypatch.setattr(
+        database, "get_secret", lambda key, default=None: secrets.get(key, default)
+    )
+    database.persist_completion_remote(
+        "interview-1",
+        "student-1",
+        "Miros",
+        "ACME",
+        "midterm_interview",
+        "2026-08-31 23:50:00",
+        "assistant: Hello",
+        "12.50",
+    )
+
+    database.record_email_delivery_remote(
+        "interview-1",
+        "person@example.com",
+        ["person@example.com"],
+        "liacs",
+        "sent",
+        "2026-09-01 00:05:00",
+        interview_type="midterm_interview",
+        interview_timestamp="2026-08-31 23:50:00",
+    )
+    database.update_interview_survey(
+        "interview-1",
+        "5",
+        "4",
+        "6",
+        "7",
+        "",
+        "2026-09-01 00:10:00",
+        interview_type="midterm_interview",
+        interview_timestamp="2026-08-31 23:50:00",
+    )
+
+    row = database.get_storage_backend(shard_key="2025-2026").query(
+        "SELECT email_status, survey_helpfulness FROM interviews", fetch="one"
+    )
+    assert row == ["sent", "5"]
+    assert not (tmp_path / "db" / "interviews-2026-2027.db").exists()
+    with pytest.raises(ValueError, match="interview_timestamp"):
+        database.update_interview_survey(
+            "interview-1", "5", "4", "6", "7", "", "2026-09-01 00:10:00"
+        )
+
+
+def test_usage_totals_accumulate_across_completion_and_summary(monkeypatch, tmp_path):
+    secrets = {
+        "DATABASE_BACKEND": "local",
+        "LOCAL_DATABASE_DIRECTORY": str(tmp_path / "db"),
+    }
+    monkeypatch.setattr(
+        database, "get_secret", lambda key, default=None: secrets.get(key, default)
+    )
+
+    database.persist_completion_remote(
+        "interview-1",
+        "student-1",
+        "Miros",
+        "ACME",
+        "industry_org_survey",
+        "2026-03-12 10:00:00",
+        "assistant: Hello",
+        "12.50",
+        model="openai/gpt-5.4",
+        model_reasoning_level="medium",
+        usage={
+            "input_tokens": 900,
+            "cached_input_tokens": 600,
+            "output_tokens": 120,
+            "cost_usd": None,
+        },
+    )
+    database.update_interview_summary(
+        "interview-1",
+        "summary text",
+        usage={"input_tokens": 300, "output_tokens": 80, "cost_usd": 0.002},
+    )
+
+    row = database.get_storage_backend().query(
+        """
+        SELECT input_tokens, cached_input_tokens, output_tokens, reasoning_tokens, cost_usd
+        FROM interviews WHERE interview_id = ?
+        """,
+        ["interview-1"],
+        fetch="one",
+    )
+    # The chat turns had no price, so the summary's cost must not pose as the total.
+    assert row == [1200, 600, 200, 0, None]
+
+
+def test_checkpoint_persists_turn_metrics_and_overwrites_resent_turns(
+    monkeypatch, tmp_path
+):
+    secrets = {
+        "DATABASE_BACKEND": "local",
+        "LOCAL_DATABASE_DIRECTORY": str(tmp_path / "db"),
+    }
+    monkeypatch.setattr(
+        database, "get_secret", lambda key, default=None: secrets.get(key, default)
+    )
+    checkpoint_args = (
+        "interview-1",
+        "student-1",
+        "Miros",
+        "ACME",
+        "midterm_interview",
+        "2026-03-12 10:01:00",
+        "assistant: Hello\n",
+        "1.00",
+    )
+    turn = {
+        "turn": 1,
+        "provider": "openrouter",
+        "model": "openai/gpt-5.4",
+        "reasoning_level": "low",
+        "hedged": True,
+        "ttft_ms": 900.0,
+        "render_ms": 2500.0,
+        "output_tokens": 42,
+    }
+
+    database.persist_checkpoint_remote(*checkpoint_args, turn_metrics=[turn])
+    database.persist_checkpoint_remote(
+        *checkpoint_args, turn_metrics=[{**turn, "ttft_ms": 700.0}]
+    )
+    database.persist_checkpoint_remote(*checkpoint_args)
+
+    rows = database.get_storage_backend().query(
+        "SELECT turn, provider, hedged, ttft_ms, render_ms, output_tokens FROM turn_metrics",
+        [],
+        fetch="all",
+    )
+    assert rows == [[1, "openrouter", 1, 700.0, 2500.0, 42]]
+
+
+def test_summary_status_moves_from_pending_to_done(monkeypatch, tmp_path):
+    secrets = {
+        "DATABASE_BACKEND": "local",
+        "LOCAL_DATABASE_DIRECTORY": str(tmp_path / "db"),
+    }
+    monkeypatch.setattr(
+        database, "get_secret", lambda key, default=None: secrets.get(key, default)
+    )
+    database.persist_completion_remote(
+        "interview-1",
+        "student-1",
+        "Miros",
+        "ACME",
+        "midterm_interview",
+        "2026-03-12 10:00:00",
+        "assistant: Hello",
+        "12.50",
+        summary_status="pending",
+    )
+
+    assert [row["interview_id"] for row in pending_summaries_report()] == ["interview-1"]
+
+    database.update_summary_status("interview-1", "retrying", attempts=1, error="timeout")
+    database.update_interview_summary("interview-1", "summary text")
+
+    row = database.get_storage_backend().query(
+        """
+        SELECT summary, summary_status, summary_attempts, summary_error
+        FROM interviews WHERE interview_id = ?
+        """,
+        ["interview-1"],
+        fetch="one",
+    )
+    assert row == ["summary text", "done", 1, ""]
+    assert pending_summaries_report() == []